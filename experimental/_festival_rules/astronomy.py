@@ -1,35 +1,72 @@
-"""Low-level astronomical helpers with injectable compatibility seams."""
+"""Low-level astronomical helpers with injectable compatibility seams.
+
+Window questions (how long a tithi lasts inside a kala, whether a tithi and
+a nakshatra meet) are answered on exact spans rather than by sampling: a
+``spans(start_jd, end_jd, limb)`` callable returns the ``(start, end,
+number)`` divisions covering the window, and overlap or intersection is
+then interval arithmetic. ``limb_spans`` builds them from
+``panchanga.limb_timeline`` sweeps over fixed blocks of days, so every
+window inside a block shares one memoized sweep.
+"""
+
+from math import floor
+
+# Width of the day-aligned blocks that limb timelines are swept over.
+LIMB_BLOCK_DAYS = 8
+
+
+def limb_spans(start_jd, end_jd, limb, panchanga):
+    """``[(start, end, number), ...]`` of ``limb`` over ``[start_jd, end_jd)``.
+
+    Spans are clipped to the window, in order, and adjacent pieces of the
+    same division from neighbouring blocks are merged.
+    """
+    spans = []
+    cursor = start_jd
+    while cursor < end_jd:
+        block = floor(cursor / LIMB_BLOCK_DAYS) * LIMB_BLOCK_DAYS
+        timeline = panchanga.limb_timeline(block, block + LIMB_BLOCK_DAYS, limb)
+        number, boundary = panchanga.limb_at(timeline, cursor)
+        following = min(end_jd, timeline.end_jd if boundary is None else boundary)
+        if spans and spans[-1][2] == number:
+            spans[-1] = (spans[-1][0], following, number)
+        else:
+            spans.append((cursor, following, number))
+        cursor = following
+    return spans
+
+
+def overlap_hours(spans, number):
+    return 24 * sum(end - start for start, end, value in spans if value == number)
+
+
+def intersect_spans(first, second):
+    """Non-empty ``(start, end)`` intersections of two ordered interval lists."""
+    result = []
+    index = 0
+    for start, end in first:
+        while index < len(second) and second[index][1] <= start:
+            index += 1
+        probe = index
+        while probe < len(second) and second[probe][0] < end:
+            low = max(start, second[probe][0])
+            high = min(end, second[probe][1])
+            if low < high:
+                result.append((low, high))
+            probe += 1
+    return result
+
+
+def matching_intervals(spans, number):
+    return [(start, end) for start, end, value in spans if value == number]
 
 
 def tithi_number_at(jd, panchanga):
     return int(panchanga.lunar_phase(jd) // 12) + 1
 
 
-def tithi_overlap_hours(start_jd, end_jd, target_tithi, tithi_at):
-    epsilon = 1e-10
-    start_matches = tithi_at(start_jd + epsilon) == target_tithi
-    end_matches = tithi_at(end_jd - epsilon) == target_tithi
-    if start_matches and end_matches:
-        return (end_jd - start_jd) * 24
-    if not start_matches and not end_matches:
-        return 0
-
-    low, high = start_jd, end_jd
-    for _ in range(50):
-        middle = (low + high) / 2
-        middle_matches = tithi_at(middle) == target_tithi
-        if start_matches:
-            if middle_matches:
-                low = middle
-            else:
-                high = middle
-        elif middle_matches:
-            high = middle
-        else:
-            low = middle
-    if start_matches:
-        return (low - start_jd) * 24
-    return (end_jd - high) * 24
+def tithi_overlap_hours(start_jd, end_jd, target_tithi, spans):
+    return overlap_hours(spans(start_jd, end_jd, "tithi"), target_tithi)
 
 
 def intervals_overlap(first_start, first_end, second_start, second_end):
@@ -114,75 +151,48 @@ def karana_index_at(jd, panchanga):
     return int(panchanga.lunar_phase(jd) // 6) + 1
 
 
-def is_vishti_at(jd, karana_at):
-    index = karana_at(jd)
+def is_vishti_karana(index):
     return 2 <= index <= 57 and (index - 2) % 7 == 6
 
 
-def has_bhadra_free_purnima(start_jd, end_jd, tithi_at, vishti_at):
-    for index in range(97):
-        instant = start_jd + (end_jd - start_jd) * index / 96
-        if tithi_at(instant) == 15 and not vishti_at(instant):
-            return True
-    return False
+def is_vishti_at(jd, karana_at):
+    return is_vishti_karana(karana_at(jd))
+
+
+def has_bhadra_free_purnima(start_jd, end_jd, spans):
+    # Purnima is karanas 29 (Vishti) and 30: read both halves off one sweep
+    # so the tithi and karana boundaries cannot disagree by a rounding error.
+    return any(
+        number in (29, 30) and not is_vishti_karana(number)
+        for _, _, number in spans(start_jd, end_jd, "karana")
+    )
 
 
 def nakshatra_number_at(jd, panchanga):
     return int(panchanga.lunar_longitude(jd) // (360 / 27)) + 1
 
 
-def nakshatra_overlap_hours(start_jd, end_jd, target_nakshatra, nakshatra_at):
-    epsilon = 1e-10
-    start_matches = nakshatra_at(start_jd + epsilon) == target_nakshatra
-    end_matches = nakshatra_at(end_jd - epsilon) == target_nakshatra
-    if start_matches and end_matches:
-        return (end_jd - start_jd) * 24
-    if not start_matches and not end_matches:
-        return 0
-
-    low, high = start_jd, end_jd
-    for _ in range(50):
-        middle = (low + high) / 2
-        middle_matches = nakshatra_at(middle) == target_nakshatra
-        if start_matches:
-            if middle_matches:
-                low = middle
-            else:
-                high = middle
-        elif middle_matches:
-            high = middle
-        else:
-            low = middle
-    if start_matches:
-        return (low - start_jd) * 24
-    return (end_jd - high) * 24
+def nakshatra_overlap_hours(start_jd, end_jd, target_nakshatra, spans):
+    return overlap_hours(spans(start_jd, end_jd, "nakshatra"), target_nakshatra)
 
 
-def has_tithi_nakshatra(
-    start_jd,
-    end_jd,
-    tithi_number,
-    nakshatra_number,
-    *,
-    tithi_at,
-    nakshatra_at,
-):
-    for index in range(97):
-        instant = start_jd + (end_jd - start_jd) * index / 96
-        if (
-            tithi_at(instant) == tithi_number
-            and nakshatra_at(instant) == nakshatra_number
-        ):
-            return True
-    return False
+def has_tithi_nakshatra(start_jd, end_jd, tithi_number, nakshatra_number, spans):
+    return bool(
+        intersect_spans(
+            matching_intervals(spans(start_jd, end_jd, "tithi"), tithi_number),
+            matching_intervals(
+                spans(start_jd, end_jd, "nakshatra"),
+                nakshatra_number,
+            ),
+        )
+    )
 
 
-def has_nakshatra(start_jd, end_jd, nakshatra_number, nakshatra_at):
-    for index in range(97):
-        instant = start_jd + (end_jd - start_jd) * index / 96
-        if nakshatra_at(instant) == nakshatra_number:
-            return True
-    return False
+def has_nakshatra(start_jd, end_jd, nakshatra_number, spans):
+    return any(
+        number == nakshatra_number
+        for _, _, number in spans(start_jd, end_jd, "nakshatra")
+    )
 
 
 def nakshatra_overlaps(start_jd, end_jd, nakshatra_number, nakshatra_at):
@@ -193,32 +203,5 @@ def nakshatra_overlaps(start_jd, end_jd, nakshatra_number, nakshatra_at):
     )
 
 
-def tithi_intervals(start_jd, end_jd, target_tithi, tithi_at):
-    step = 0.25
-    intervals = []
-    cursor = start_jd
-    active = tithi_at(cursor) == target_tithi
-    interval_start = cursor if active else None
-    while cursor < end_jd:
-        following = min(cursor + step, end_jd)
-        following_active = tithi_at(following) == target_tithi
-        if active != following_active:
-            low, high = cursor, following
-            for _ in range(50):
-                middle = (low + high) / 2
-                middle_active = tithi_at(middle) == target_tithi
-                if middle_active == active:
-                    low = middle
-                else:
-                    high = middle
-            boundary = (low + high) / 2
-            if following_active:
-                interval_start = boundary
-            else:
-                intervals.append((interval_start, boundary))
-                interval_start = None
-        cursor = following
-        active = following_active
-    if interval_start is not None:
-        intervals.append((interval_start, end_jd))
-    return intervals
+def tithi_intervals(start_jd, end_jd, target_tithi, spans):
+    return matching_intervals(spans(start_jd, end_jd, "tithi"), target_tithi)
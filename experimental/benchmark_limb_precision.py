@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Benchmark limb end times: ephemeris calls per boundary for each precision.
+
+For every civil day in the range this computes tithi, nakshatra, yoga and
+karana at sunrise with ``precision='fast'`` and ``precision='exact'`` and
+counts ``swe.calc_ut`` calls beyond the shared day frame. For reference it
+also counts the calls the experimental festival helpers spend per
+sunrise-to-sunrise window (``tithi_overlap_hours`` on limb-timeline spans).
+
+Reports calls per boundary and the largest fast-vs-exact difference in
+seconds. Run as ``python -m experimental.benchmark_limb_precision``.
+"""
+
+import argparse
+import time
+
+import panchanga
+from experimental.festival_rules import tithi_overlap_hours
+
+LIMB_FUNCTIONS = {
+    "tithi": panchanga.tithi,
+    "nakshatra": panchanga.nakshatra,
+    "yoga": panchanga.yoga,
+    "karana": panchanga.karana,
+}
+
+
+class CallCounter:
+    """Wraps ``swe.calc_ut`` for the duration of a ``with`` block."""
+
+    def __init__(self):
+        self.calls = 0
+        self.original = None
+
+    def __call__(self, *args, **kwargs):
+        self.calls += 1
+        return self.original(*args, **kwargs)
+
+    def __enter__(self):
+        self.original = panchanga.swe.calc_ut
+        panchanga.swe.calc_ut = self
+        return self
+
+    def __exit__(self, *exc):
+        panchanga.swe.calc_ut = self.original
+
+
+def hours(hms):
+    return hms[0] + hms[1] / 60 + hms[2] / 3600
+
+
+def end_hours(result):
+    """End times (hours after local midnight) in a limb function's result."""
+    return [hours(hms) for hms in result[1::2]]
+
+
+def benchmark(place, start_jd, days):
+    totals = {}
+    for limb, function in LIMB_FUNCTIONS.items():
+        row = {"boundaries": 0, "fast": 0, "exact": 0, "fast_s": 0.0, "exact_s": 0.0, "worst": 0.0}
+        for offset in range(days):
+            jd = start_jd + offset
+            frame = panchanga.day_frame(jd, place)
+            ends = {}
+            for precision in ("fast", "exact"):
+                with CallCounter() as counter:
+                    began = time.perf_counter()
+                    ends[precision] = end_hours(function(jd, place, frame, precision))
+                    row[precision + "_s"] += time.perf_counter() - began
+                row[precision] += counter.calls
+            row["boundaries"] += len(ends["exact"])
+            for fast, exact in zip(ends["fast"], ends["exact"]):
+                row["worst"] = max(row["worst"], abs(fast - exact) * 3600)
+        totals[limb] = row
+    return totals
+
+
+def overlap_calls(place, start_jd, days):
+    """``calc_ut`` calls per ``tithi_overlap_hours`` window."""
+    windows = 0
+    with CallCounter() as counter:
+        for offset in range(days):
+            frame = panchanga.day_frame(start_jd + offset, place)
+            number = panchanga.tithi(start_jd + offset, place, frame)[0]
+            tithi_overlap_hours(frame.rise, frame.rise + 1, number)
+            windows += 1
+    return counter.calls / windows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ephemeris calls per limb boundary, fast vs exact.")
+    parser.add_argument("--latitude", type=float, default=12.972, help="degrees north (default: Bengaluru)")
+    parser.add_argument("--longitude", type=float, default=77.594, help="degrees east (default: Bengaluru)")
+    parser.add_argument("--timezone", type=float, default=5.5, help="hours east of UTC")
+    parser.add_argument("--start", default="2026-01-01", help="first civil date, YYYY-MM-DD")
+    parser.add_argument("--days", type=int, default=365, help="number of days")
+    parser.add_argument("--tolerance", type=float, default=panchanga.EXACT_TOLERANCE, help="exact-mode tolerance, days")
+    args = parser.parse_args(argv)
+    panchanga.EXACT_TOLERANCE = args.tolerance
+
+    year, month, day = (int(part) for part in args.start.split("-"))
+    place = panchanga.Place(args.latitude, args.longitude, args.timezone)
+    start_jd = panchanga.gregorian_to_jd(panchanga.Date(year, month, day))
+
+    totals = benchmark(place, start_jd, args.days)
+    print(f"{'limb':<10} {'boundaries':>10} {'fast/bdy':>9} {'exact/bdy':>9} {'fast ms':>8} {'exact ms':>8} "
+          f"{'max diff s':>10}")
+    for limb, row in totals.items():
+        count = row["boundaries"]
+        print(f"{limb:<10} {count:>10} {row['fast'] / count:>9.2f} {row['exact'] / count:>9.2f} "
+              f"{1000 * row['fast_s']:>8.1f} {1000 * row['exact_s']:>8.1f} {row['worst']:>10.3f}")
+    print(f"tithi_overlap_hours spans: {overlap_calls(place, start_jd, args.days):.1f} calls per window")
+
+
+if __name__ == "__main__":
+    main()
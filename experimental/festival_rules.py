@@ -26,6 +26,10 @@ collect_moonrise_jds = _records.collect_moonrise_jds
 plain_tithi_number = _records.plain_tithi_number
 
 
+def limb_spans(start_jd, end_jd, limb):
+    return _astronomy.limb_spans(start_jd, end_jd, limb, panchanga)
+
+
 def tithi_number_at(jd):
     return _astronomy.tithi_number_at(jd, panchanga)
 
@@ -35,7 +39,7 @@ def tithi_overlap_hours(start_jd, end_jd, target_tithi):
         start_jd,
         end_jd,
         target_tithi,
-        tithi_number_at,
+        limb_spans,
     )
 
 
@@ -74,8 +78,7 @@ def has_bhadra_free_purnima(start_jd, end_jd):
     return _astronomy.has_bhadra_free_purnima(
         start_jd,
         end_jd,
-        tithi_number_at,
-        is_vishti_at,
+        limb_spans,
     )
 
 
@@ -88,7 +91,7 @@ def nakshatra_overlap_hours(start_jd, end_jd, target_nakshatra):
         start_jd,
         end_jd,
         target_nakshatra,
-        nakshatra_number_at,
+        limb_spans,
     )
 
 
@@ -103,8 +106,7 @@ def has_tithi_nakshatra(
         end_jd,
         tithi_number,
         nakshatra_number,
-        tithi_at=tithi_number_at,
-        nakshatra_at=nakshatra_number_at,
+        limb_spans,
     )
 
 
@@ -113,7 +115,7 @@ def has_nakshatra(start_jd, end_jd, nakshatra_number):
         start_jd,
         end_jd,
         nakshatra_number,
-        nakshatra_number_at,
+        limb_spans,
     )
 
 
@@ -131,7 +133,7 @@ def tithi_intervals(start_jd, end_jd, target_tithi):
         start_jd,
         end_jd,
         target_tithi,
-        tithi_number_at,
+        limb_spans,
     )
 
 
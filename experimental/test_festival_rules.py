@@ -1,14 +1,22 @@
 """Regression tests for Dharma Sindhu festival-date decisions."""
 
+import contextlib
 from datetime import date
+import io
 import unittest
 from unittest.mock import patch
 
+import panchanga
+from experimental._festival_rules import astronomy
 from experimental.festival_test_helpers import festival_rule, record
 from experimental.festival_rules import (
     FESTIVAL_RULES,
     VARAMAHALAKSHMI_RULE,
+    limb_spans,
     nakshatra_overlaps,
+    tithi_intervals,
+    tithi_number_at,
+    tithi_overlap_hours,
     select_aksaya_trtiya_dates,
     select_ayudha_puja_dates,
     select_bali_padyami_dates,
@@ -1667,5 +1675,87 @@ class DasaraRuleTests(unittest.TestCase):
             )
 
 
+class LimbSpanTests(unittest.TestCase):
+    # 2026-07-28 12:00 UT to 2026-07-31 12:00 UT: Purnima on 2026-07-29.
+    start_jd = 2461250.0
+    end_jd = 2461253.0
+
+    def test_spans_tile_the_window_and_match_the_sampled_tithi(self):
+        spans = limb_spans(self.start_jd, self.end_jd, "tithi")
+        self.assertEqual(spans[0][0], self.start_jd)
+        self.assertEqual(spans[-1][1], self.end_jd)
+        for (_, end, number), (start, _, following) in zip(spans, spans[1:]):
+            self.assertEqual(end, start)
+            self.assertEqual(following, number % 30 + 1)
+        for start, end, number in spans:
+            self.assertEqual(tithi_number_at((start + end) / 2), number)
+            self.assertEqual(tithi_number_at(start + 1e-6), number)
+            self.assertEqual(tithi_number_at(end - 1e-6), number)
+
+    def test_windows_across_block_edges_merge_the_division(self):
+        edge = astronomy.LIMB_BLOCK_DAYS * 307459
+        spans = limb_spans(edge - 0.5, edge + 0.5, "karana")
+        numbers = [number for _, _, number in spans]
+        self.assertNotIn(0, [b - a for a, b in zip(numbers, numbers[1:])])
+        self.assertTrue(any(start < edge < end for start, end, _ in spans))
+
+    def test_overlap_and_intervals_are_interval_arithmetic(self):
+        (start, end), = tithi_intervals(self.start_jd, self.end_jd, 15)
+        self.assertAlmostEqual(
+            tithi_overlap_hours(self.start_jd, self.end_jd, 15),
+            (end - start) * 24,
+        )
+        self.assertEqual(tithi_overlap_hours(self.start_jd, self.end_jd, 5), 0)
+        self.assertEqual(tithi_intervals(start - 0.25, end + 0.25, 15), [(start, end)])
+
+    def test_window_predicates_read_exact_spans(self):
+        def spans(start_jd, end_jd, limb):
+            return {
+                "tithi": [(0.0, 0.4, 14), (0.4, 1.0, 15)],
+                "karana": [(0.0, 0.4, 28), (0.4, 0.7, 29), (0.7, 1.0, 30)],
+                "nakshatra": [(0.0, 0.5, 20), (0.5, 1.0, 21)],
+            }[limb]
+
+        self.assertTrue(astronomy.has_bhadra_free_purnima(0.0, 1.0, spans))
+        self.assertFalse(
+            astronomy.has_bhadra_free_purnima(
+                0.0,
+                0.7,
+                lambda start, end, limb: spans(start, end, limb)[:2],
+            )
+        )
+        self.assertTrue(astronomy.has_tithi_nakshatra(0.0, 1.0, 15, 20, spans))
+        self.assertFalse(astronomy.has_tithi_nakshatra(0.0, 1.0, 14, 21, spans))
+        self.assertTrue(astronomy.has_nakshatra(0.0, 1.0, 21, spans))
+        self.assertFalse(astronomy.has_nakshatra(0.0, 1.0, 22, spans))
+        self.assertAlmostEqual(
+            astronomy.nakshatra_overlap_hours(0.0, 1.0, 21, spans),
+            12.0,
+        )
+
+    def test_windows_in_one_block_share_a_sweep(self):
+        panchanga.clear_caches("_cached_limb_timeline")
+        limb_spans(self.start_jd, self.start_jd + 0.5, "tithi")
+        with patch(
+            "panchanga.swe.calc_ut",
+            wraps=panchanga.swe.calc_ut,
+        ) as calc:
+            tithi_intervals(self.start_jd + 0.5, self.start_jd + 1.5, 15)
+            tithi_overlap_hours(self.start_jd + 1.0, self.start_jd + 2.0, 15)
+        self.assertEqual(calc.call_count, 0)
+
+
+class LimbPrecisionBenchmarkTests(unittest.TestCase):
+    def test_main_runs_on_a_short_range(self):
+        from experimental import benchmark_limb_precision
+
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            benchmark_limb_precision.main(["--days", "2"])
+        lines = output.getvalue().splitlines()
+        self.assertEqual([line.split()[0] for line in lines[1:5]], ["tithi", "nakshatra", "yoga", "karana"])
+        self.assertRegex(lines[-1], r"^tithi_overlap_hours spans: [0-9.]+ calls per window$")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Stream sunrise panchanga records of a city over a date range as CSV or JSON Lines.
+
+Rows are written a month at a time as ``iter_day_tables`` computes them, so
+output starts after the first month and memory stays flat for century-long
+ranges::
+
+  python export_panchanga_days.py --city Ujjain --start 1950-01-01 --end 2049-12-31 -o ujjain.csv
+"""
+
+import argparse
+import csv
+import json
+import math
+import os
+import sys
+from datetime import date as CivilDate
+from pathlib import Path
+
+from generate_panchanga_calendar import (
+  DEFAULT_CITIES_PATH,
+  configure_logging,
+  iter_day_tables,
+  load_location,
+  require_coordinate_selection,
+)
+
+FIELDS = ("date", "tithi", "nakshatra", "yoga", "masa", "is_adhika", "raasi", "sunrise_jd", "sunset_jd", "tithi_end_jd")
+FORMATS = ("csv", "jsonl")
+
+
+def require_date(text):
+  """Parse ``YYYY-MM-DD`` or raise ``ValueError``."""
+  try:
+    return CivilDate.fromisoformat((text or "").strip())
+  except ValueError:
+    raise ValueError(f"dates must use YYYY-MM-DD format: {text!r}") from None
+
+
+def day_rows(table):
+  """``FIELDS`` tuples of a ``DayTable``.
+
+  Tithi is 1–30 and māsa the amānta number 1–12; Julian days are UT, with
+  ``None`` where unknown (no sunset, or a tithi ending past the sweep).
+  """
+  columns = (table.ordinals, table.tithi, table.nakshatra, table.yoga, table.masa, table.is_adhika, table.raasi,
+             table.sunrise, table.sunset, table.tithi_end)
+  for ordinal, tithi, nakshatra, yoga, masa, is_adhika, raasi, sunrise, sunset, tithi_end in zip(*columns):
+    yield (CivilDate.fromordinal(ordinal).isoformat(), tithi, nakshatra, yoga, masa, bool(is_adhika), raasi, sunrise,
+           None if math.isnan(sunset) else sunset, None if math.isnan(tithi_end) else tithi_end)
+
+
+def write_csv(tables, stream):
+  """Write a header, then the rows of each table in ``tables``, flushing after every table."""
+  writer = csv.writer(stream, lineterminator="\n")
+  writer.writerow(FIELDS)
+  for table in tables:
+    writer.writerows(day_rows(table))
+    stream.flush()
+
+
+def write_jsonl(tables, stream):
+  """Write one JSON object per day, flushing after every table."""
+  for table in tables:
+    stream.writelines(json.dumps(dict(zip(FIELDS, row))) + "\n" for row in day_rows(table))
+    stream.flush()
+
+
+def export_days(location, start_date, end_date, stream, output_format="csv", coordinate_selection=None):
+  """Stream the days of ``location`` from ``start_date`` to ``end_date`` to ``stream`` in ``output_format``."""
+  if output_format not in FORMATS:
+    raise ValueError(f"Unknown export format: {output_format!r}")
+  tables = iter_day_tables(location, start_date, end_date, coordinate_selection)
+  (write_csv if output_format == "csv" else write_jsonl)(tables, stream)
+
+
+def argument_parser():
+  parser = argparse.ArgumentParser(description="Stream sunrise tithi, nakshatra, yoga and māsa for a date range.")
+  parser.add_argument("--city", required=True, help=(f"city as listed in {DEFAULT_CITIES_PATH.name} "
+                                                     f'(e.g. "Helsinki, FI" or Helsinki,FI)'))
+  parser.add_argument("--start", required=True, metavar="YYYY-MM-DD", help="first day")
+  parser.add_argument("--end", metavar="YYYY-MM-DD", help="last day, inclusive (default: the first day)")
+  parser.add_argument("--format", default="csv", choices=FORMATS, help="csv (default) or jsonl (JSON Lines)")
+  parser.add_argument(
+    "--ayanamsa", default="citra", metavar="NAME", help=("ayanamsa: citra (default), revati, rohini, pushya, mula, "
+                                                         "krishnamurti, raman or tropical"))
+  parser.add_argument("-o", "--output", type=Path, help="output file (default: standard output)")
+  return parser
+
+
+def main(argv=None):
+  configure_logging()
+  parser = argument_parser()
+  arguments = parser.parse_args(argv)
+  try:
+    start_date = require_date(arguments.start)
+    end_date = require_date(arguments.end) if arguments.end else start_date
+    if end_date < start_date:
+      raise ValueError("End date must not be before the start date.")
+    location = load_location(arguments.city)
+    coordinate_selection = require_coordinate_selection(arguments.ayanamsa)
+    if arguments.output is None:
+      export_days(location, start_date, end_date, sys.stdout, arguments.format, coordinate_selection)
+    else:
+      with open(arguments.output, "w", encoding="utf-8", newline="") as stream:
+        export_days(location, start_date, end_date, stream, arguments.format, coordinate_selection)
+  except BrokenPipeError:  # e.g. piped into head
+    os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+  except (OSError, ValueError, RuntimeError) as error:
+    parser.error(str(error))
+
+
+if __name__ == "__main__":
+  main()
@@ -3,7 +3,12 @@
 import calendar
 import configparser
 import logging
+import struct as binary
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
 from collections import namedtuple as struct
+from collections.abc import Mapping
 from datetime import date as CivilDate
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -121,11 +126,286 @@ def resolve_vriddhi_dates(dates):
   return resolved
 
 
+def tithi_code(tithi_number):
+  """``S1``..``S15`` / ``K1``..``K15`` code of tithi 1..30."""
+  code = f"S{tithi_number}" if tithi_number <= 15 else f"K{tithi_number - 15}"
+  return code
+
+
+def masa_code(masa_number, is_adhika):
+  """``"5"`` / ``"A5"`` code of an amānta māsa."""
+  return f"A{masa_number}" if is_adhika else str(masa_number)
+
+
+class DayTable:
+  """Sunrise values of consecutive civil days, one typed array per column.
+
+  Integer columns: ``tithi`` (1..30), ``nakshatra``, ``yoga``, amānta
+  ``masa`` (1..12), ``is_adhika`` and the solar ``raasi`` at sunrise (0
+  when unknown); float columns (UT Julian days, NaN when unknown):
+  ``sunrise``, ``sunset``, ``moonrise`` and ``tithi_end``, the end of the
+  sunrise tithi. Days are kept in date order (``ordinals`` holds
+  ``date.toordinal()``).
+
+  Layers that need numbers read the columns; indexing and iteration yield
+  ``DayRecord`` views with the ``S11`` / ``A5`` codes, so code written for
+  record lists keeps working. Slices and ``between`` return tables, and
+  ``to_bytes`` / ``from_bytes`` store one as its raw columns.
+  """
+
+  COLUMNS = (('ordinals', 'i'), ('tithi', 'b'), ('nakshatra', 'b'), ('yoga', 'b'), ('masa', 'b'), ('is_adhika', 'b'),
+             ('raasi', 'b'), ('sunrise', 'd'), ('sunset', 'd'), ('moonrise', 'd'), ('tithi_end', 'd'))
+  # Stored header: format tag and row count. Change the tag with COLUMNS.
+  FORMAT = b'DAY1'
+  _HEADER = binary.Struct('<4sI')
+
+  def __init__(self):
+    for name, typecode in self.COLUMNS:
+      setattr(self, name, array(typecode))
+
+  @classmethod
+  def from_records(cls, records):
+    """Table of ``DayRecord`` rows in date order; a table is returned as is."""
+    if isinstance(records, cls):
+      return records
+    table = cls()
+    for record in sorted(records, key=lambda record: record.civil_date):
+      is_adhika = record.is_adhika or record.masa.startswith("A")
+      table.append(record.civil_date, plain_tithi_number(record.tithi), record.nakshatra, record.yoga,
+                   int(record.masa.lstrip("A")), is_adhika, record.sunrise_jd)
+    return table
+
+  @classmethod
+  def from_bytes(cls, data):
+    """Table stored by ``to_bytes``; ``ValueError`` for anything else."""
+    data = memoryview(data)
+    if len(data) < cls._HEADER.size:
+      raise ValueError('Truncated day table')
+    tag, rows = cls._HEADER.unpack_from(data)
+    if tag != cls.FORMAT:
+      raise ValueError('Not a {} day table'.format(cls.FORMAT.decode()))
+    table = cls()
+    offset = cls._HEADER.size
+    for name, _ in cls.COLUMNS:
+      column = getattr(table, name)
+      size = rows * column.itemsize
+      if len(data) < offset + size:
+        raise ValueError('Truncated day table')
+      column.frombytes(data[offset:offset + size])
+      if sys.byteorder == 'big':
+        column.byteswap()
+      offset += size
+    if offset != len(data):
+      raise ValueError('Trailing data after day table')
+    return table
+
+  def to_bytes(self):
+    """Header and the little-endian columns, in ``COLUMNS`` order."""
+    parts = [self._HEADER.pack(self.FORMAT, len(self))]
+    for name, _ in self.COLUMNS:
+      column = getattr(self, name)
+      if sys.byteorder == 'big':
+        column = array(column.typecode, column)
+        column.byteswap()
+      parts.append(column.tobytes())
+    return b''.join(parts)
+
+  def append(self, civil_date, tithi, nakshatra, yoga, masa, is_adhika, sunrise, sunset=float('nan'),
+             moonrise=float('nan'), tithi_end=float('nan'), raasi=0):
+    """Add the day after the last one (callers append in date order)."""
+    values = (civil_date.toordinal(), tithi, nakshatra, yoga, masa, is_adhika, raasi, sunrise, sunset, moonrise,
+              tithi_end)
+    for (name, _), value in zip(self.COLUMNS, values):
+      getattr(self, name).append(value)
+
+  def extend(self, other):
+    """Add the rows of ``other``, a table of later days."""
+    for name, _ in self.COLUMNS:
+      getattr(self, name).extend(getattr(other, name))
+
+  def __len__(self):
+    return len(self.ordinals)
+
+  def __sizeof__(self):
+    # Counted by sys.getsizeof, so byte-limited caches see the columns.
+    return object.__sizeof__(self) + sum(sys.getsizeof(getattr(self, name)) for name, _ in self.COLUMNS)
+
+  def __getitem__(self, index):
+    if isinstance(index, slice):
+      table = DayTable()
+      for name, _ in self.COLUMNS:
+        setattr(table, name, getattr(self, name)[index])
+      return table
+    return DayRecord(CivilDate.fromordinal(self.ordinals[index]), tithi_code(self.tithi[index]),
+                     self.nakshatra[index], self.yoga[index], masa_code(self.masa[index], self.is_adhika[index]),
+                     bool(self.is_adhika[index]), self.sunrise[index])
+
+  def __iter__(self):
+    return (self[index] for index in range(len(self)))
+
+  def __eq__(self, other):
+    # Bitwise, so that NaN (unknown) values compare equal.
+    if not isinstance(other, DayTable):
+      return NotImplemented
+    return all(getattr(self, name).tobytes() == getattr(other, name).tobytes() for name, _ in self.COLUMNS)
+
+  @property
+  def dates(self):
+    """Civil dates of the rows."""
+    return [CivilDate.fromordinal(ordinal) for ordinal in self.ordinals]
+
+  def between(self, start, end):
+    """Rows dated ``start``..``end`` inclusive."""
+    return self[bisect_left(self.ordinals, start.toordinal()):bisect_right(self.ordinals, end.toordinal())]
+
+
+class FestivalIndex:
+  """Day records indexed once, so every festival rule is a lookup.
+
+  ``resolve_festivals`` builds one per record table and hands it to each
+  rule's selector in place of the record list: the ``select_*`` primitives
+  answer from its tables, and any other selector can still iterate it.
+  Each query returns what the primitive returns for the record list.
+  """
+
+  def __init__(self, records):
+    self.table = table = DayTable.from_records(records)
+    self.dates = dates = table.dates  # civil date of each row
+    rows = {}  # civil date -> row index, the last row winning
+    self.by_tithi = {}  # (tithi 1..30, masa, is_adhika) -> sunrise civil dates
+    self.by_nakshatra = {}  # nakshatra -> row indices
+    self.adhika_dates = set()  # sunrise civil dates in an adhika masa
+    masas = list(zip(table.masa, table.is_adhika))
+    for index, (civil_date, tithi, nakshatra, masa) in enumerate(zip(dates, table.tithi, table.nakshatra, masas)):
+      rows[civil_date] = index
+      if masa[1]:
+        self.adhika_dates.add(civil_date)
+      self.by_tithi.setdefault((tithi, ) + masa, []).append(civil_date)
+      self.by_nakshatra.setdefault(nakshatra, []).append(index)
+    self.by_date = _RowsByDate(table, rows)
+    # plain tithi -> (later civil date, earlier masa, later masa) for each skip between consecutive sunrises
+    self.kshaya = {}
+    for index in range(1, len(table)):
+      if table.ordinals[index] != table.ordinals[index - 1] + 1:
+        continue
+      start_tithi = table.tithi[index - 1]
+      for offset in range(1, (table.tithi[index] - start_tithi) % 30):
+        skipped = (start_tithi + offset - 1) % 30 + 1
+        self.kshaya.setdefault(skipped, []).append((dates[index], masas[index - 1], masas[index]))
+    # Rāśis the table already carries; the rest are computed on demand.
+    self._raasis = {sunrise: raasi for sunrise, raasi in zip(table.sunrise, table.raasi) if raasi}
+    self._sankrantis = None
+
+  def __iter__(self):
+    return iter(self.table)
+
+  def __len__(self):
+    return len(self.table)
+
+  def raasi(self, index):
+    """Solar rāśi at the sunrise of row ``index``, computed once per sunrise."""
+    sunrise = self.table.sunrise[index]
+    if sunrise not in self._raasis:
+      self._raasis[sunrise] = panchanga.raasi(sunrise)
+    return self._raasis[sunrise]
+
+  def kshaya_dates(self, tithi, masa=None, allow_adhika=False):
+    """As ``select_kshaya_dates``."""
+    target_tithi = plain_tithi_number(tithi)
+    masa_keys = _masa_keys_for(masa, allow_adhika)
+    matches = []
+    for next_date, day_masa, next_masa in self.kshaya.get(target_tithi, ()):
+      check_masa = next_masa if target_tithi <= 15 else day_masa
+      if masa_keys is None or check_masa in masa_keys:
+        matches.append(next_date)
+    return matches
+
+  def tithi_dates(self, tithi, masa=None, allow_adhika=False):
+    """As ``select_tithi_dates``."""
+    target_tithi = plain_tithi_number(tithi)
+    masa_keys = _masa_keys_for(masa, allow_adhika)
+    sunrise_dates = []
+    for (day_tithi, *day_masa), dates in self.by_tithi.items():
+      if day_tithi == target_tithi and (masa_keys is None or tuple(day_masa) in masa_keys):
+        sunrise_dates.extend(dates)
+    kshaya_matches = self.kshaya_dates(tithi, masa=masa, allow_adhika=allow_adhika)
+    return sorted(set(resolve_vriddhi_dates(sunrise_dates)) | set(kshaya_matches))
+
+  def nija_nakshatra_dates(self, masa, nakshatra):
+    """As ``_nija_nakshatra_dates``."""
+    masa = int(masa)
+    table = self.table
+    return resolve_vriddhi_dates([
+      self.dates[index] for index in self.by_nakshatra.get(nakshatra, ())
+      if table.masa[index] == masa and not table.is_adhika[index]
+    ])
+
+  def nakshatra_in_raasi_dates(self, nakshatra, raasi):
+    """Sunrises in ``nakshatra`` with the Sun in ``raasi``, vriddhi-resolved."""
+    return resolve_vriddhi_dates([
+      self.dates[index] for index in self.by_nakshatra.get(nakshatra, ()) if self.raasi(index) == raasi
+    ])
+
+  def sankrantis(self):
+    """As ``sankranti_raasi_by_date``, computed once."""
+    if self._sankrantis is None:
+      self._sankrantis = {}
+      previous_raasi = None
+      for index, civil_date in enumerate(self.dates):
+        raasi = int(self.raasi(index))
+        if previous_raasi is not None and raasi != previous_raasi:
+          self._sankrantis[civil_date] = raasi
+        previous_raasi = raasi
+    return self._sankrantis
+
+
+class _RowsByDate(Mapping):
+  """``{civil date: DayRecord}`` over a ``DayTable``; each row view is built when it is looked up."""
+
+  def __init__(self, table, rows):
+    self.table = table
+    self.rows = rows  # civil date -> row index
+
+  def __getitem__(self, civil_date):
+    return self.table[self.rows[civil_date]]
+
+  def __contains__(self, civil_date):
+    return civil_date in self.rows
+
+  def __iter__(self):
+    return iter(self.rows)
+
+  def __len__(self):
+    return len(self.rows)
+
+
+def _masa_keys_for(masa, allow_adhika=False):
+  """``masa_codes_for`` as ``(masa, is_adhika)`` column pairs."""
+  if masa is None:
+    return None
+  keys = {(int(masa), False)}
+  if allow_adhika:
+    keys.add((int(masa), True))
+  return keys
+
+
+def _records_by_date(records):
+  """``{civil date: record}``, the last record winning, as every selector builds it."""
+  if isinstance(records, FestivalIndex):
+    return records.by_date
+  records_by_date = {}
+  for record in records:
+    records_by_date[record.civil_date] = record
+  return records_by_date
+
+
 def select_kshaya_dates(records, tithi, masa=None, allow_adhika=False):
   """Later civil day when the tithi is skipped between sunrises.
 
     With ``masa``, check the later sunrise for Shukla and the earlier for Krishna.
     """
+  if isinstance(records, FestivalIndex):
+    return records.kshaya_dates(tithi, masa, allow_adhika)
   target_tithi = plain_tithi_number(tithi)
   masa_codes = masa_codes_for(masa, allow_adhika)
   matches = []
@@ -159,6 +439,8 @@ def select_tithi_dates(records, tithi, masa=None, allow_adhika=False):
 
     Vriddhi keeps the former date; kshaya keeps the later civil date.
     """
+  if isinstance(records, FestivalIndex):
+    return records.tithi_dates(tithi, masa, allow_adhika)
   masa_codes = masa_codes_for(masa, allow_adhika)
   sunrise_dates = []
   for record in records:
@@ -177,10 +459,11 @@ def select_plain_tithi_dates(records, masa, tithi, allow_adhika=False):
   matches = select_tithi_dates(records, tithi, masa=masa, allow_adhika=allow_adhika)
   if not allow_adhika or not matches:
     selected = matches
+  elif isinstance(records, FestivalIndex):
+    adhika_matches = [civil_date for civil_date in matches if civil_date in records.adhika_dates]
+    selected = adhika_matches if adhika_matches else matches
   else:
-    records_by_date = {}
-    for record in records:
-      records_by_date[record.civil_date] = record
+    records_by_date = _records_by_date(records)
     adhika_matches = []
     for civil_date in matches:
       record = records_by_date[civil_date]
@@ -201,18 +484,27 @@ def select_varamahalakshmi_dates(records):
   return selected
 
 
+_ECLIPSE_FINDERS = {"Lunar": "lun_eclipse_when_loc", "Solar": "sol_eclipse_when_loc"}
+
+
+@panchanga.memoized(maxsize=1024)
+def _eclipse_when_loc(kind, search_jd, geopos):
+  """``(flags, times)`` of the next ``kind`` eclipse seen from ``geopos`` after ``search_jd``."""
+  flags, times, _ = getattr(panchanga.swe, _ECLIPSE_FINDERS[kind])(search_jd, geopos)
+  return flags, tuple(times)
+
+
 def find_local_eclipses(start_jd, end_jd, geopos):
   """Locally visible partial/total/annular eclipses with maximum in ``[start_jd, end_jd)``."""
   if end_jd <= start_jd:
     return []
 
-  searches = (("Lunar", panchanga.swe.lun_eclipse_when_loc), ("Solar", panchanga.swe.sol_eclipse_when_loc))
   found = []
-  for kind, finder in searches:
+  for kind in _ECLIPSE_FINDERS:
     search_jd = start_jd - 1.0
     while search_jd < end_jd + 2.0:
       try:
-        flags, times, _ = finder(search_jd, geopos)
+        flags, times = _eclipse_when_loc(kind, search_jd, tuple(geopos))
       except Exception as error:
         log.error("Eclipse search for %s failed at JD %s: %s", kind, search_jd, error)
         break
@@ -279,6 +571,8 @@ def select_yajur_upakarma_dates(records, geopos=None, timezone_name=None):
 
 def _nija_nakshatra_dates(records, masa, nakshatra):
   """Non-adhika civil dates with ``nakshatra`` in lunar ``masa``, vriddhi-resolved."""
+  if isinstance(records, FestivalIndex):
+    return records.nija_nakshatra_dates(masa, nakshatra)
   dates = []
   masa_code = str(masa)
   for record in records:
@@ -294,6 +588,8 @@ def _nija_nakshatra_dates(records, masa, nakshatra):
 
 def _sravana_nakshatra_in_raasi_dates(records, raasi):
   """Sravana-nakshatra sunrises in solar ``raasi``, vriddhi-resolved."""
+  if isinstance(records, FestivalIndex):
+    return records.nakshatra_in_raasi_dates(SRAVANA_NAKSHATRA, raasi)
   dates = []
   for record in records:
     if record.nakshatra != SRAVANA_NAKSHATRA:
@@ -340,9 +636,7 @@ def select_onam_dates(records):
 
 def select_vaikuntha_ekadashi_dates(records):
   """Margasira/Pausha Shukla Ekadashi upavasa while the Sun is in Dhanur."""
-  records_by_date = {}
-  for record in records:
-    records_by_date[record.civil_date] = record
+  records_by_date = _records_by_date(records)
   selected = []
   for civil_date in select_tithi_dates(records, "S11"):
     record = records_by_date[civil_date]
@@ -359,6 +653,8 @@ def sankranti_raasi_by_date(records):
     Uses the same rule as Mesha/Makara festival selectors: the civil day of the
     first local sunrise at which the Sun is already in the new rāśi.
     """
+  if isinstance(records, FestivalIndex):
+    return dict(records.sankrantis())
   selected = {}
   previous_raasi = None
   for record in sorted(records, key=lambda record: record.civil_date):
@@ -392,14 +688,12 @@ def select_makara_sankranti_dates(records):
 def select_solstice_dates(records, solstice_longitude, timezone_name=None):
   """First civil sunrise after each tropical solstice moment.
 
-    Swiss Ephemeris finds the tropical Sun longitude crossing at 90° (June
-    solstice) or 270° (December solstice). The search is limited to a narrow
+    The tropical Sun longitude crossing at 90° (June solstice) or 270°
+    (December solstice) comes from ``panchanga.cardinal_point``. The search is limited to a narrow
     local-date window around the event; sunrise JDs are UT, so comparing them
     directly with the UT event moment preserves the local sunrise rule.
     """
-  records_by_date = {}
-  for record in records:
-    records_by_date[record.civil_date] = record
+  records_by_date = _records_by_date(records)
   years = []
   for civil_date in records_by_date:
     if civil_date.year not in years:
@@ -409,8 +703,7 @@ def select_solstice_dates(records, solstice_longitude, timezone_name=None):
   selected = []
   for year in years:
     start_jd = panchanga.gregorian_to_jd(panchanga.Date(year, 1, 1))
-    flags = panchanga.swe.FLG_SWIEPH | panchanga.swe.FLG_TROPICAL
-    solstice_jd = panchanga.swe.solcross_ut(float(solstice_longitude), start_jd, flags)
+    solstice_jd = panchanga.cardinal_point(start_jd, float(solstice_longitude), +1)
     solstice_date = jd_to_local_civil_date(solstice_jd, local_timezone)
     for offset in range(-2, 2):
       # Timezones can shift the displayed solstice date; the exact UT
@@ -512,8 +805,10 @@ def resolve_festivals(records, target_dates, geopos=None, timezone_name=None, en
 
     ``markers_by_date`` looks like ``{date: [1, 3]}``; ``entries`` looks like
     ``[(1, "Mar 19", "Ugadi")]``. Selectors may inspect boundary records, but
-    only dates in ``target_dates`` are printed.
+    only dates in ``target_dates`` are printed. Every rule is answered from
+    one ``FestivalIndex`` of ``records``.
     """
+  records = records if isinstance(records, FestivalIndex) else FestivalIndex(records)
   target_dates = set(target_dates)
   markers_by_date = {}
   entries = []
@@ -536,6 +831,7 @@ def resolve_festivals(records, target_dates, geopos=None, timezone_name=None, en
 
 def ekadashi_dates_from_records(records):
   """Civil days for S11 and K11 using sunrise, vriddhi, and kshaya rules."""
+  records = records if isinstance(records, FestivalIndex) else FestivalIndex(records)
   selected = set()
   for tithi in ("S11", "K11"):
     selected.update(select_tithi_dates(records, tithi))
@@ -3,11 +3,18 @@
 
 import argparse
 import calendar
+import hashlib
 import json
 import logging
+import math
+import multiprocessing
+import os
 import re
 import sys
+import threading
+from collections import Counter
 from collections import namedtuple as struct
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date as CivilDate
 from datetime import datetime
 from pathlib import Path
@@ -17,8 +24,9 @@ from reportlab.lib.colors import HexColor, white
 from reportlab.lib.pagesizes import A4, landscape
 from reportlab.pdfgen import canvas
 
-from festival_rules import (DayRecord, ekadashi_dates_from_records, find_local_eclipses, jd_to_local_civil_date,
-                            jd_to_local_datetime, julian_day_from_datetime, load_festival_selection, resolve_festivals)
+from festival_rules import (DayTable, FestivalIndex, ekadashi_dates_from_records, find_local_eclipses,
+                            jd_to_local_civil_date, jd_to_local_datetime, julian_day_from_datetime,
+                            load_festival_selection, masa_code, resolve_festivals, tithi_code)
 import panchanga
 
 MONTH_COUNT = 14
@@ -33,6 +41,10 @@ log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 FOOTER_KEY_TOP = 44.0  # baseline of first muted key line below festivals
 RULESET_VERSION = "Udaya-Vyapini-1.1"
+# Version of what a day record holds: bump it with any change to how
+# month_day_table, panchanga.masa or the limb timelines compute a day, so
+# day caches (see day_cache_key) stop serving tables from the old code.
+DAY_RECORDS_VERSION = "1"
 LAYOUT_VERSION = "A4-1.20"
 PDF_AUTHOR = "Satish BD"
 PDF_AUTHOR_EMAIL = "bdsatish@gmail.com"
@@ -602,15 +614,16 @@ def draw_solar_day_mark(pdf, x, row_y, solar_day, cell_width):
 
 
 def solar_dates_by_date(records):
-  """Map civil date → (solar rāśi, solar day, is-saṅkrānti)."""
+  """Map civil date → (solar rāśi, solar day, is-saṅkrānti) for records or a ``DayTable``."""
+  table = DayTable.from_records(records)
   result = {}
   previous_raasi = None
   solar_day = 0
-  for record in sorted(records, key=lambda record: record.civil_date):
-    raasi = int(panchanga.raasi(record.sunrise_jd))
+  for civil_date, sunrise_jd, raasi in zip(table.dates, table.sunrise, table.raasi):
+    raasi = raasi or int(panchanga.raasi(sunrise_jd))
     is_sankranti = previous_raasi is not None and raasi != previous_raasi
     solar_day = 1 if is_sankranti else solar_day + 1
-    result[record.civil_date] = (raasi, solar_day, is_sankranti)
+    result[civil_date] = (raasi, solar_day, is_sankranti)
     previous_raasi = raasi
   return result
 
@@ -638,15 +651,6 @@ def place_for_date(location, civil):
   return panchanga.Place(location.latitude, location.longitude, offset)
 
 
-def tithi_code(tithi_number):
-  code = f"S{tithi_number}" if tithi_number <= 15 else f"K{tithi_number - 15}"
-  return code
-
-
-def masa_code(masa_number, is_adhika):
-  return f"A{masa_number}" if is_adhika else str(masa_number)
-
-
 def tithi_display_parts(tithi):
   """Return ``(number_text, is_sukla)`` for a single ``S*`` / ``K*`` code."""
   return f"{int(tithi[1:]):02d}", tithi.startswith("S")
@@ -670,50 +674,325 @@ def tithi_font(is_sukla):
   return PDF_FONT_BOLD if is_sukla else PDF_FONT_BOLD_ITALIC
 
 
-def daily_records(months, location):
-  """Canonical amānta sunrise records for ordered Gregorian ``months``."""
+# Swiss Ephemeris state is per process, so threads cannot overlap its calls
+# but processes can. Month-sharded builds opt in with workers=N or
+# PANCHANGA_WORKERS; pools are kept so workers stay warm between builds.
+_process_pools = {}
+_process_pools_lock = threading.Lock()
+
+
+def worker_count(workers=None):
+  """Pool size: ``workers``, else ``$PANCHANGA_WORKERS``, else 1 (serial)."""
+  if workers is None:
+    workers = os.environ.get("PANCHANGA_WORKERS") or 1
+  workers = int(workers)
+  if workers < 1:
+    raise ValueError(f"Worker count must be at least 1, got {workers}")
+  return workers
+
+
+def process_pool(workers):
+  """Shared ``ProcessPoolExecutor`` with ``workers`` processes.
+
+  Uses forkserver (spawn on Windows/macOS without it): forking a threaded
+  web server directly is unsafe.
+  """
+  with _process_pools_lock:
+    pool = _process_pools.get(workers)
+    if pool is None:
+      method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+      pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context(method))
+      _process_pools[workers] = pool
+  return pool
+
+
+def month_shards(months, count):
+  """Split ``months`` into at most ``count`` contiguous runs of nearly equal length."""
+  months = list(months)
+  count = max(1, min(count, len(months)))
+  size, extra = divmod(len(months), count)
+  shards, start = [], 0
+  for index in range(count):
+    stop = start + size + (1 if index < extra else 0)
+    shards.append(months[start:stop])
+    start = stop
+  return shards
+
+
+def month_shard_results(function, months, workers, *args):
+  """``function(shard, selection, nakshatra_system, *args)`` for each month shard, in month order.
+
+  Each shard runs in the process pool with the caller's active coordinate
+  selection and nakshatra system passed explicitly (workers share no
+  globals).
+  """
+  context = panchanga.Panchanga()
+  pool = process_pool(workers)
+  futures = [
+    pool.submit(function, shard, context.selection, context.nakshatra_system, *args)
+    for shard in month_shards(months, workers)
+  ]
+  return [future.result() for future in futures]
+
+
+def map_month_shards(function, months, workers, *args):
+  """Concatenate the list results of ``month_shard_results``."""
   result = []
-  for year, month in months:
-    for day in range(1, calendar.monthrange(year, month)[1] + 1):
-      date = panchanga.Date(year, month, day)
-      place = place_for_date(location, date)
-      jd = panchanga.gregorian_to_jd(date)
-      sunrise = require_local_sunrise(jd, place, location.name, year, month, day)
-      if sunrise is None:
-        raise RuntimeError(format_sunrise_unavailable_message(location.name, year, month, day, place))
-      sunrise_jd = sunrise[0]
-      tithi_number = panchanga.tithi(jd, place)[0]
-      nakshatra_number = panchanga.nakshatra(jd, place)[0]
-      yoga_number = panchanga.yoga(jd, place)[0]
-      masa_number, is_adhika = panchanga.masa(jd, place, amanta=True, tithi_number=tithi_number)
-      result.append(
-        DayRecord(CivilDate(year, month, day), tithi_code(tithi_number), nakshatra_number, yoga_number,
-                  masa_code(masa_number, is_adhika), is_adhika, sunrise_jd - place.timezone / 24))
+  for shard in month_shard_results(function, months, workers, *args):
+    result.extend(shard)
   return result
 
 
+def _daily_records_shard(months, selection, nakshatra_system, location, moonrise=False):
+  with panchanga.Panchanga(selection, nakshatra_system).active():
+    return daily_records(months, location, workers=1, moonrise=moonrise)
+
+
+def month_tables(table, months):
+  """``{(year, month): DayTable}`` slices of ``table`` for each of ``months``."""
+  return {
+    (year, month): table.between(CivilDate(year, month, 1), CivilDate(year, month,
+                                                                      calendar.monthrange(year, month)[1]))
+    for year, month in months
+  }
+
+
+def daily_records(months, location, workers=None, moonrise=False):
+  """Canonical amānta sunrise ``DayTable`` for ordered Gregorian ``months``.
+
+  Each month comes from ``_month_records``, a cache keyed by month, city and
+  coordinate context, so overlapping windows (the context months of two
+  PDFs a month apart share all but one) only compute the months they do not
+  share. With more than one worker (see ``worker_count``) the missing
+  months are sharded across a process pool and their tables cached here.
+  """
+  context = panchanga.Panchanga()
+  keys = {
+    (year, month): (year, month, location, moonrise, context.selection, context.nakshatra_system)
+    for year, month in months
+  }
+  workers = worker_count(workers)
+  if workers > 1 and len(months) > 1:
+    tables = {month: _month_records.cache.get(key, None) for month, key in keys.items()}
+    missing = [month for month in keys if tables[month] is None]
+    if missing:
+      computed = DayTable()
+      for shard in month_shard_results(_daily_records_shard, missing, workers, location, moonrise):
+        computed.extend(shard)
+      for month, table in month_tables(computed, missing).items():
+        tables[month] = table
+        _month_records.cache.put(keys[month], table)
+  else:
+    tables = {month: _month_records(*key) for month, key in keys.items()}
+  result = DayTable()
+  for month in months:
+    result.extend(tables[month])
+  return result
+
+
+@panchanga.memoized(maxsize=512)
+def _month_records(year, month, location, moonrise, selection, nakshatra_system):
+  """``month_day_table`` under the given coordinate context, shared between callers (do not modify)."""
+  with panchanga.Panchanga(selection, nakshatra_system).active():
+    return month_day_table(year, month, location, moonrise)
+
+
+def month_day_table(year, month, location, moonrise=False, first_day=1, last_day=None):
+  """``DayTable`` of one Gregorian month under the active coordinate context.
+
+  Sunrises and sunsets come from one ``solar_day_series`` and sunrise tithi
+  (with its end), nakshatra and yoga are looked up in one shared
+  ``limb_timeline`` per limb instead of three Lagrange fits per day.
+  ``moonrise`` also fills the moonrise column (one rise search per day).
+  Only days ``first_day`` to ``last_day`` (default: the month's last) get a
+  row, so a day without a sunrise outside them is no error; the series and
+  timelines still span the month, so those rows match the whole month's.
+  """
+  # One seeded sunrise series per month (see solar_day_series); days it
+  # cannot place keep the single-day sunrise lookup and its errors.
+  first_jd = panchanga.gregorian_to_jd(panchanga.Date(year, month, 1))
+  month_days = calendar.monthrange(year, month)[1]
+  last_day = month_days if last_day is None else last_day
+  series = panchanga.solar_day_series(lambda date: place_for_date(location, date), first_jd, month_days)
+  days = []
+  for index in range(first_day - 1, last_day):
+    date, place = series.dates[index], series.places[index]
+    jd = first_jd + index
+    sunrise_ut = series.sunrise[index]
+    if math.isnan(sunrise_ut):
+      sunrise = require_local_sunrise(jd, place, location.name, year, month, date.day)
+      if sunrise is None:
+        raise RuntimeError(format_sunrise_unavailable_message(location.name, year, month, date.day, place))
+      sunrise_ut = sunrise[0] - place.timezone / 24
+    days.append((date, place, jd, sunrise_ut, series.sunset[index]))
+
+  # Span from civil dates, not sunrises, so every city asking for the same
+  # month hits the same memoized timelines.
+  span_start, span_end = first_jd - 2, first_jd + month_days + 1
+  timelines = {}
+  for limb in ("tithi", "nakshatra", "yoga"):
+    timelines[limb] = panchanga.limb_timeline(span_start, span_end, limb)
+  table = DayTable()
+  for date, place, jd, sunrise_ut, sunset_ut in days:
+    tithi_number, tithi_end = panchanga.limb_at(timelines["tithi"], sunrise_ut)
+    nakshatra_number = panchanga.limb_at(timelines["nakshatra"], sunrise_ut)[0]
+    yoga_number = panchanga.limb_at(timelines["yoga"], sunrise_ut)[0]
+    masa_number, is_adhika = panchanga.masa(jd, place, amanta=True, tithi_number=int(tithi_number),
+                                            sunrise_jd=sunrise_ut + place.timezone / 24)
+    moonrise_ut = math.nan
+    if moonrise:
+      moonrise_ut = panchanga.moonrise_jd(jd, place) - place.timezone / 24
+      if not jd - 1 <= moonrise_ut <= jd + 2:  # no moonrise that day
+        moonrise_ut = math.nan
+    table.append(CivilDate(date.year, date.month, date.day), tithi_number, nakshatra_number, yoga_number, masa_number,
+                 is_adhika, sunrise_ut, sunset_ut, moonrise_ut, math.nan if tithi_end is None else tithi_end,
+                 int(panchanga.raasi(sunrise_ut)))
+  return table
+
+
+def iter_day_tables(location, start_date, end_date, selection=None):
+  """Yield a ``month_day_table`` per month from ``start_date`` to ``end_date``.
+
+  Tables hold only the days in the range; days outside it get no row, so
+  they may lack a sunrise (a polar night starting after ``end_date``).
+  Months are computed one at a time under ``panchanga.Panchanga(selection)``
+  and dropped once consumed, so memory stays flat however long the range.
+  They bypass the ``daily_records`` month cache, which a long export would
+  otherwise flush.
+  """
+  if end_date < start_date:
+    raise ValueError("End date must not be before the start date.")
+  context = panchanga.Panchanga(selection)
+  count = (end_date.year - start_date.year) * 12 + end_date.month - start_date.month + 1
+  for year, month in _month_sequence(start_date.year, start_date.month, count):
+    first_day = start_date.day if (year, month) == (start_date.year, start_date.month) else 1
+    last_day = end_date.day if (year, month) == (end_date.year, end_date.month) else None
+    # Activate per month, not around the yield, so the caller never runs
+    # under this context.
+    with context.active():
+      table = month_day_table(year, month, location, first_day=first_day, last_day=last_day)
+    yield table
+
+
+def iter_days(location, start_date, end_date, selection=None):
+  """Yield the ``DayRecord`` of every day from ``start_date`` to ``end_date`` (inclusive).
+
+  A generator over ``iter_day_tables``: at most one month is held at a time.
+  """
+  for table in iter_day_tables(location, start_date, end_date, selection):
+    yield from table
+
+
+def cached_month_counts():
+  """``{city: months}`` held by the ``daily_records`` month cache, most cached first.
+
+  With ``panchanga.cache_stats()`` this shows which cities a retention
+  limit (``PANCHANGA_CACHE_LIMITS``) keeps warm.
+  """
+  cache = _month_records.cache
+  with cache.lock:
+    counts = Counter(key[2].name for key in cache.entries)
+  return dict(counts.most_common())
+
+
+def display_masa_numbers(records, amanta=True):
+  """Displayed māsa number of every row of ``records`` (a ``DayTable`` or records)."""
+  table = DayTable.from_records(records)
+  return [
+    panchanga.display_masa_number(masa, is_adhika, tithi, amanta)
+    for masa, is_adhika, tithi in zip(table.masa, table.is_adhika, table.tithi)
+  ]
+
+
 def display_masa(record, amanta=True):
   """Māsa code displayed for a canonical amānta record."""
-  masa_number = int(record.masa.lstrip("A"))
-  tithi_number = int(record.tithi[1:])
-  if record.tithi.startswith("K"):
-    tithi_number += 15
-  masa_number = panchanga.display_masa_number(masa_number, record.is_adhika, tithi_number, amanta)
-  return masa_code(masa_number, record.is_adhika)
+  return masa_code(display_masa_numbers([record], amanta)[0], record.is_adhika)
 
 
 def masa_badges_by_date(records, amanta=True):
   """Map each first visible date of a display māsa to its badge code."""
+  table = DayTable.from_records(records)
   badges = {}
   previous_masa = None
-  for record in records:
-    masa = display_masa(record, amanta=amanta)
+  for civil_date, masa_number, is_adhika in zip(table.dates, display_masa_numbers(table, amanta), table.is_adhika):
+    masa = masa_code(masa_number, is_adhika)
     if masa != previous_masa:
-      badges[record.civil_date] = masa
+      badges[civil_date] = masa
     previous_masa = masa
   return badges
 
 
+# Day tables persisted per month under a cache directory (``--day-cache`` or
+# $PANCHANGA_DAY_CACHE), so that changing the festival selection, month
+# system or layout re-renders from disk without the day-by-day astronomy.
+def day_cache_directory(directory=None):
+  """Cache root: ``directory``, else ``$PANCHANGA_DAY_CACHE``, else ``None`` (caching off)."""
+  directory = directory or os.environ.get("PANCHANGA_DAY_CACHE")
+  return Path(directory) if directory else None
+
+
+def day_cache_key(location):
+  """Folder name for ``location``'s day tables under the active coordinate context.
+
+  Hashes everything the tables depend on: coordinates, timezone, coordinate
+  selection, nakshatra system, Swiss Ephemeris version, day computation
+  (``DAY_RECORDS_VERSION``) and ruleset versions and the ``DayTable``
+  format. Any change starts a fresh folder.
+  """
+  context = panchanga.Panchanga()
+  fields = (location.latitude, location.longitude, location.timezone_name, context.selection, context.nakshatra_system,
+            panchanga.swe.version, DAY_RECORDS_VERSION, RULESET_VERSION, DayTable.FORMAT)
+  digest = hashlib.sha256(repr(fields).encode("utf-8")).hexdigest()[:24]
+  return re.sub(r"[^a-z0-9-]+", "_", location_slug(location.name)) + "-" + digest
+
+
+def _read_day_table(path):
+  try:
+    return DayTable.from_bytes(path.read_bytes())
+  except FileNotFoundError:
+    return None
+  except (OSError, ValueError) as error:
+    log.warning("Ignoring day cache file %s: %s", path, error)
+    return None
+
+
+def _write_day_table(path, table):
+  temporary = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+  try:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary.write_bytes(table.to_bytes())
+    os.replace(temporary, path)  # readers never see a partial file
+  except OSError as error:
+    log.warning("Cannot write day cache file %s: %s", path, error)
+    temporary.unlink(missing_ok=True)
+
+
+def cached_daily_records(months, location, workers=None, directory=None):
+  """``daily_records`` for ``months``, read from and saved to the day cache.
+
+  Each month is one file under ``day_cache_directory(directory)`` /
+  ``day_cache_key(location)``; only months without a readable file are
+  computed (in one ``daily_records`` call). Without a cache directory this
+  is ``daily_records``.
+  """
+  root = day_cache_directory(directory)
+  if root is None:
+    return daily_records(months, location, workers=workers)
+  folder = root / day_cache_key(location)
+  paths = {(year, month): folder / f"{year:04d}-{month:02d}.days" for year, month in months}
+  tables = {key: _read_day_table(path) for key, path in paths.items()}
+  missing = [key for key in months if tables[key] is None]
+  if missing:
+    computed = month_tables(daily_records(missing, location, workers=workers), missing)
+    for key in missing:
+      tables[key] = computed[key]
+      _write_day_table(paths[key], tables[key])
+  result = DayTable()
+  for key in months:
+    result.extend(tables[key])
+  return result
+
+
 def draw_centered(pdf, text, center_x, baseline_y, font, size, color=INK):
   pdf.setFont(font, size)
   pdf.setFillColor(color)
@@ -978,67 +1257,60 @@ def draw_page_footer(pdf, festival_entries, eclipse_line="Eclipses: None"):
 
 
 def build_pdf(location, start_year, start_month, output_path, festivals_path=None, month_system="amanta",
-              coordinate_selection="citra"):
-  """Build a calendar while holding coordinate state for the full document.
-
-  Pattern: take ``coordinate_calculation_lock``, then call ``_build_pdf_unlocked``.
-  The lock keeps ayanāṃśa / tropical mode stable for the whole PDF; the
-  ``_unlocked`` helper holds the real work and must not be called alone from
-  other threads.
+              coordinate_selection="citra", workers=None, day_cache=None):
+  """Build a calendar under one coordinate context for the full document.
+
+  Pattern: activate a ``panchanga.Panchanga`` context, then call
+  ``_build_pdf_unlocked``. The context keeps ayanāṃśa / tropical mode stable
+  for the whole PDF without blocking other threads; the ``_unlocked`` helper
+  holds the real work and expects the caller's context. ``workers`` opts
+  into the process pool for ``daily_records``; ``day_cache`` is the day
+  cache directory (see ``cached_daily_records``).
   """
-  with panchanga.coordinate_calculation_lock:
+  with panchanga.Panchanga(coordinate_selection).active():
     return _build_pdf_unlocked(location, start_year, start_month, output_path, festivals_path=festivals_path,
-                               month_system=month_system, coordinate_selection=coordinate_selection)
+                               month_system=month_system, coordinate_selection=coordinate_selection, workers=workers,
+                               day_cache=day_cache)
 
 
 def _build_pdf_unlocked(location, start_year, start_month, output_path, festivals_path=None, month_system="amanta",
-                        coordinate_selection="citra"):
+                        coordinate_selection="citra", workers=None, day_cache=None):
   ensure_pdf_fonts()
   amanta = require_month_system(month_system)
-  panchanga.set_coordinate_selection(coordinate_selection)
   months = month_range(start_year, start_month)
   context_months = context_month_range(start_year, start_month)
-  context_records = daily_records(context_months, location)
-  records_by_date = {}
-  for record in context_records:
-    records_by_date[record.civil_date] = record
+  context_table = cached_daily_records(context_months, location, workers=workers, directory=day_cache)
   range_start = CivilDate(start_year, start_month, 1)
   end_year, end_month = months[-1]
   range_end = CivilDate(end_year, end_month, calendar.monthrange(end_year, end_month)[1])
-  target_records = []
-  for record in context_records:
-    if range_start <= record.civil_date <= range_end:
-      target_records.append(record)
-  target_dates = set()
-  for record in target_records:
-    target_dates.add(record.civil_date)
+  target_table = context_table.between(range_start, range_end)
+  target_dates = set(target_table.dates)
   festivals_path = Path(festivals_path) if festivals_path is not None else DEFAULT_FESTIVALS_PATH
   enabled_names = load_festival_selection(festivals_path)
   geopos = (location.longitude, location.latitude, 0.0)
+  # One index serves the festival rules, the Ekadashi marks and the cells.
+  festival_index = FestivalIndex(context_table)
   festivals_by_date, festival_entries = resolve_festivals(
-    context_records, target_dates, geopos=geopos, timezone_name=location.timezone_name, enabled_names=enabled_names)
+    festival_index, target_dates, geopos=geopos, timezone_name=location.timezone_name, enabled_names=enabled_names)
 
   eclipse_start_jd, eclipse_end_jd = local_range_jds(start_year, start_month, end_year, end_month,
                                                      location.timezone_name)
   eclipses = find_local_eclipses(eclipse_start_jd, eclipse_end_jd, geopos)
-  sunrise_by_date = {}
-  for record in target_records:
-    sunrise_by_date[record.civil_date] = record.sunrise_jd
+  sunrise_by_date = dict(zip(target_table.dates, target_table.sunrise))
   eclipse_line = format_eclipse_line(eclipses, location.timezone_name, sunrise_by_date=sunrise_by_date)
   eclipse_dates = eclipse_civil_dates(eclipses, location.timezone_name)
-  solar_by_date = solar_dates_by_date(context_records)
+  solar_by_date = solar_dates_by_date(context_table)
   ekadashi_dates = set()
-  for value in ekadashi_dates_from_records(context_records):
+  for value in ekadashi_dates_from_records(festival_index):
     if range_start <= value <= range_end:
       ekadashi_dates.add(value)
   header_year, header_month = months[len(months) // 2]
-  header_records = []
-  for record in target_records:
-    if (record.civil_date.year, record.civil_date.month) == (header_year, header_month):
-      header_records.append(record)
-  calendar_years = calendar_year_label(header_records, amanta=amanta)
+  header_last_day = calendar.monthrange(header_year, header_month)[1]
+  header_table = target_table.between(CivilDate(header_year, header_month, 1),
+                                      CivilDate(header_year, header_month, header_last_day))
+  calendar_years = calendar_year_label(header_table, amanta=amanta)
   kali_ahargana = kali_ahargana_range(months)
-  masa_badges = masa_badges_by_date(target_records, amanta=amanta)
+  masa_badges = masa_badges_by_date(target_table, amanta=amanta)
 
   page_width, page_height = landscape(A4)
   output_path = Path(output_path)
@@ -1066,7 +1338,7 @@ def _build_pdf_unlocked(location, start_year, start_month, output_path, festival
   draw_day_column(pdf, margin, top, day_column_width)
   for index, (year, month) in enumerate(months):
     x = margin + day_column_width + index * month_width
-    draw_month(pdf, year, month, records_by_date, masa_badges, festivals_by_date, ekadashi_dates, eclipse_dates,
+    draw_month(pdf, year, month, festival_index.by_date, masa_badges, festivals_by_date, ekadashi_dates, eclipse_dates,
                solar_by_date, x, top, month_width)
 
   draw_page_footer(pdf, festival_entries, eclipse_line=eclipse_line)
@@ -1107,6 +1379,10 @@ def argument_parser():
   parser.add_argument(
     "--festivals", type=Path, default=DEFAULT_FESTIVALS_PATH, help=(f"INI file selecting which festivals to include "
                                                                     f"(default: {DEFAULT_FESTIVALS_PATH.name})"))
+  parser.add_argument("--workers", type=int, metavar="N",
+                      help="worker processes for the day-by-day pass (default: $PANCHANGA_WORKERS or 1)")
+  parser.add_argument("--day-cache", type=Path, metavar="DIR",
+                      help="directory caching the day-by-day pass (default: $PANCHANGA_DAY_CACHE, else none)")
   return parser
 
 
@@ -1123,7 +1399,8 @@ def main(argv=None):
     output_path = arguments.output or default_output_path(location, start_year, start_month, month_system=month_system,
                                                           coordinate_selection=coordinate_selection)
     generated = build_pdf(location, start_year, start_month, output_path, festivals_path=arguments.festivals,
-                          month_system=month_system, coordinate_selection=coordinate_selection)
+                          month_system=month_system, coordinate_selection=coordinate_selection, workers=worker_count(
+                            arguments.workers), day_cache=arguments.day_cache)
   except (OSError, ValueError, RuntimeError) as error:
     parser.error(str(error))
   print(generated.resolve())
@@ -25,23 +25,34 @@
 Use Swiss ephemeris to calculate tithi, nakshatra, etc.
 """
 
-from math import ceil
-from collections import namedtuple as struct
-from functools import lru_cache
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict, namedtuple as struct
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from itertools import islice
+from math import ceil, cos, floor, isnan, nan, pi, radians, sin
+import mmap
 import os
 import sys
-from threading import RLock
+from threading import Lock, RLock
+from time import monotonic
 import swisseph as swe
+try:
+  import numpy
+except ImportError:  # optional: the array kernels fall back to Python loops
+  numpy = None
 
 # ------- Global options ----------
-# Call the corresponding setter functions to modify these
+# Process-wide defaults; call the corresponding setter functions to modify
+# these. Code running under a ``Panchanga`` context uses the context's
+# selection instead, so concurrent requests never touch them.
 coordinate_flag = swe.FLG_SIDEREAL
 nakshatra_system = 'equal'
 chosen_ayanamsa = 'citra'
-# Mutable ayanāṃśa / coordinate globals above are not thread-safe alone.
-# Web and PDF code hold this lock around any calculation that calls
-# set_coordinate_selection / set_chosen_ayanamsa so concurrent requests
-# do not mix modes.
+# Kept for callers that still serialize on it; this package no longer needs
+# it now that requests carry a Panchanga context (see ephemeris_call).
 coordinate_calculation_lock = RLock()
 # ---------
 
@@ -107,12 +118,13 @@ def set_coordinate_mode(mode='sidereal'):
     print('Unknown coordinate mode. Assuming sidereal.')
 
 
+_NAKSHATRA_SYSTEMS = {'classical': 'equal', 'equal': 'equal', 'garga': 'unequal', 'unequal': 'unequal'}
+
+
 def set_nakshatra_system(system='classical'):
   global nakshatra_system
-  if system.lower() in ['classical', 'equal']:
-    nakshatra_system = 'equal'
-  elif system.lower() in ['garga', 'unequal']:
-    nakshatra_system = 'unequal'
+  if system.lower() in _NAKSHATRA_SYSTEMS:
+    nakshatra_system = _NAKSHATRA_SYSTEMS[system.lower()]
   else:
     nakshatra_system = 'equal'
     print('Unknown nakshatra system mode. Assuming classical equal spacing.')
@@ -155,8 +167,12 @@ def set_coordinate_selection(selection):
   set_coordinate_mode('sidereal')
 
 
-def set_ayanamsa_mode():
-  args = _AYANAMSA_MODES.get(chosen_ayanamsa.lower())
+def set_ayanamsa_mode(ayanamsa=None):
+  """Configure Swiss Ephemeris for ``ayanamsa`` (default: the active selection).
+
+  Process-wide; threaded code should go through ``ephemeris_call`` instead.
+  """
+  args = _AYANAMSA_MODES.get((ayanamsa or selection_mode()[0]).lower())
   if args is None:
     args = (swe.SIDM_FAGAN_BRADLEY, )
   swe.set_sid_mode(*args)
@@ -164,6 +180,107 @@ def set_ayanamsa_mode():
 
 reset_ayanamsa_mode = lambda: swe.set_sid_mode(swe.SIDM_FAGAN_BRADLEY)
 
+
+def selection_mode(selection=None):
+  """``(ayanamsa, coordinate_flag)`` for a coordinate selection key.
+
+  ``selection`` takes the same keys as ``set_coordinate_selection``; ``None``
+  returns the active ``Panchanga`` context's mode, else the module settings.
+  Nothing global is modified.
+  """
+  if selection is None:
+    context = _active_context.get()
+    if context is None:
+      return chosen_ayanamsa, coordinate_flag
+    return context.ayanamsa, context.coordinate_flag
+  if selection == 'tropical':
+    return chosen_ayanamsa, swe.FLG_TROPICAL
+  if selection not in _AYANAMSA_MODES:
+    raise ValueError('Unknown coordinate selection: {}'.format(selection))
+  return selection, swe.FLG_SIDEREAL
+
+
+def active_nakshatra_system():
+  """``'equal'`` or ``'unequal'``: the active context's system, else the module's."""
+  context = _active_context.get()
+  return nakshatra_system if context is None else context.nakshatra_system
+
+
+_active_context = ContextVar('panchanga_context', default=None)
+_ephemeris_lock = Lock()
+
+
+def ephemeris_call(ayanamsa, func, *args, **kwargs):
+  """``func(*args, **kwargs)`` with Swiss Ephemeris in the sidereal mode of ``ayanamsa``.
+
+  The sidereal mode is process-wide state inside Swiss Ephemeris, so this is
+  the only place it is switched: mode, call and reset happen under one short
+  lock. ``func`` may make several calls (a short sweep); ``ayanamsa=None``
+  means the active selection.
+  """
+  ayanamsa = ayanamsa or selection_mode()[0]
+  with _ephemeris_lock:
+    set_ayanamsa_mode(ayanamsa)
+    try:
+      return func(*args, **kwargs)
+    finally:
+      reset_ayanamsa_mode()
+
+
+class Panchanga:
+  """Coordinate context: a selection (ayanamsa key or ``'tropical'``) and a nakshatra system.
+
+  Every public function of this module is available as a method that runs
+  under the context, e.g. ``Panchanga('revati').tithi(jd, place)``; or wrap
+  a block in ``with context.active():``. Contexts are immutable and carried
+  in a ``ContextVar``, so threads with different selections need no lock and
+  leave the module defaults alone. ``None`` arguments take the currently
+  active values.
+  """
+  __slots__ = ('selection', 'ayanamsa', 'coordinate_flag', 'nakshatra_system')
+
+  def __init__(self, selection=None, nakshatra_system=None):
+    ayanamsa, coord_flag = selection_mode(selection)
+    if nakshatra_system is None:
+      system = active_nakshatra_system()
+    elif nakshatra_system.lower() in _NAKSHATRA_SYSTEMS:
+      system = _NAKSHATRA_SYSTEMS[nakshatra_system.lower()]
+    else:
+      raise ValueError('Unknown nakshatra system: {}'.format(nakshatra_system))
+    object.__setattr__(self, 'selection', 'tropical' if coord_flag == swe.FLG_TROPICAL else ayanamsa)
+    object.__setattr__(self, 'ayanamsa', ayanamsa)
+    object.__setattr__(self, 'coordinate_flag', coord_flag)
+    object.__setattr__(self, 'nakshatra_system', system)
+
+  def __setattr__(self, name, value):
+    raise AttributeError('Panchanga contexts are immutable')
+
+  def __repr__(self):
+    return 'Panchanga(selection={!r}, nakshatra_system={!r})'.format(self.selection, self.nakshatra_system)
+
+  @contextmanager
+  def active(self):
+    """Run the enclosed block under this context (thread- and task-local)."""
+    token = _active_context.set(self)
+    try:
+      yield self
+    finally:
+      _active_context.reset(token)
+
+  def __getattr__(self, name):
+    func = globals().get(name)
+    if name.startswith(('_', 'set_', 'reset_')) or getattr(func, '__module__', None) != __name__ \
+        or isinstance(func, type) or not callable(func):
+      raise AttributeError(name)
+
+    @wraps(func)
+    def method(*args, **kwargs):
+      with self.active():
+        return func(*args, **kwargs)
+
+    return method
+
+
 # Reference: https://archive.org/details/siddhantaandindiancalenderrobertsewellsankarabalkrishnadikshit1896_200_C/page/21/mode/1up
 # Longitudes of ending points of nakshatras according to Garga's unequal spacing
 garga_end_points = [
@@ -328,18 +445,18 @@ def local_time_to_jdut1(year, month, day, hour=0, minutes=0, seconds=0, timezone
 
 def nakshatra_end_point(nakshatra_number):
   """Given nakshatra_number [1..27] return the longitude at which it ends"""
-  end = garga_end_points[nakshatra_number] if nakshatra_system == 'unequal' else nakshatra_number * 360 / 27
+  end = garga_end_points[nakshatra_number] if active_nakshatra_system() == 'unequal' else nakshatra_number * 360 / 27
   return end
 
 
 def nakshatra_pada(longitude):
   """Gives nakshatra (1..27) and paada (1..4) in which given longitude lies"""
   pada = (nakshatra_pada_unequal_system(longitude)
-          if nakshatra_system == 'unequal' else nakshatra_pada_equal_spacing(longitude))
+          if active_nakshatra_system() == 'unequal' else nakshatra_pada_equal_spacing(longitude))
   return pada
 
 
-def nakshatra_pada_equal_spacing(longitude):
+def _equal_nakshatra_pada(longitude):
   # Traditional - equal division of ecliptic into 27 parts -
   # 27 nakshatras span 360°
   one_star = (360 / 27)  # = 13°20'
@@ -349,7 +466,26 @@ def nakshatra_pada_equal_spacing(longitude):
   reminder = (longitude - quotient * one_star)
   pada = int(reminder / one_pada)
   # convert 0..26 to 1..27 and 0..3 to 1..4
-  return [1 + quotient, 1 + pada]
+  return 1 + quotient, 1 + pada
+
+
+def nakshatra_pada_equal_spacing(longitude):
+  return list(_equal_nakshatra_pada(longitude))
+
+
+# Ascending pada boundaries, 4 per nakshatra, each nakshatra's 4 padas being
+# equal parts of its Garga span; the 4th is the Garga end point itself.
+_GARGA_PADA_ENDS = [
+  garga_end_points[nak - 1] + pada *
+  (garga_end_points[nak] - garga_end_points[nak - 1]) / 4 if pada < 4 else garga_end_points[nak]
+  for nak in range(1, 28) for pada in range(1, 5)
+]
+
+
+def _garga_nakshatra_pada(longitude):
+  # Padas (and so nakshatras) elapsed: boundaries at or below the longitude
+  elapsed = bisect_right(_GARGA_PADA_ENDS, longitude)
+  return 1 + elapsed // 4, 1 + elapsed % 4
 
 
 # This is more closer to observed phenomena than equal division
@@ -357,108 +493,847 @@ def nakshatra_pada_unequal_system(longitude):
   """Gives nakshatra (1..27) and paada (1..4) which given longitude lies, according to Garga system"""
   assert (longitude > 0)
   assert (longitude < 360)
+  # nak is 1..27 and pada is 1..4
+  return list(_garga_nakshatra_pada(longitude))
 
-  end_points = garga_end_points
-  # Linear search
-  for nak in range(len(end_points)):
-    if longitude < end_points[nak]: break
 
-  # there are 4 padas in between two nakshatras
-  one_pada = (end_points[nak] - end_points[nak - 1]) / 4
+# Array kernels: classify many longitudes (or phases / sums) at once with the
+# same rules as the scalar functions. Inputs are any iterable of floats (list,
+# ``array`` or NumPy array); results are int8 ``array``s, which
+# ``numpy.frombuffer(result, dtype=numpy.int8)`` wraps without a copy. With
+# NumPy installed they run vectorized (the Garga table through
+# ``searchsorted``); without it, as Python loops over the scalar rules.
+def _float_column(values):
+  """``values`` as a float64 ndarray; ndarrays and ``array('d')`` are not copied."""
+  return numpy.asarray(values if hasattr(values, '__len__') else list(values), dtype=numpy.float64)
 
-  for pada in [1, 2, 3, 4]:
-    if longitude < end_points[nak - 1] + pada * one_pada: break
 
-  # nak is 1..27 and pada is 1..4
-  return [nak, pada]
+def _int8_array(values):
+  """int8 ``array`` of a NumPy array of small whole numbers."""
+  return array('b', values.astype(numpy.int8).tobytes())
+
 
+def nakshatra_padas(longitudes, system=None):
+  """``(nakshatras, padas)`` for every longitude, as ``nakshatra_pada`` in ``system``.
 
-# @lru_cache memoizes expensive Swiss Ephemeris calls (longitudes, rise/set,
-# new/full moon). Cache sizes fit one 14-month PDF build while bounding memory
-# for long-running web servers that serve many distinct (city, date) queries.
-@lru_cache(maxsize=65536)
+  ``system`` is 'equal' or 'unequal' (Garga); ``None`` uses the active one.
+  """
+  unequal = (system or active_nakshatra_system()) == 'unequal'
+  if numpy is not None:
+    longitudes = _float_column(longitudes)
+    if unequal:
+      elapsed = numpy.searchsorted(_GARGA_PADA_ENDS, longitudes, side='right')  # as bisect_right
+      return _int8_array(1 + elapsed // 4), _int8_array(1 + elapsed % 4)
+    # trunc, as int() in _equal_nakshatra_pada
+    quotient = numpy.trunc(longitudes / (360 / 27))
+    return _int8_array(1 + quotient), _int8_array(1 + numpy.trunc((longitudes - quotient * (360 / 27)) / (360 / 108)))
+  classify = _garga_nakshatra_pada if unequal else _equal_nakshatra_pada
+  nakshatras, padas = array('b'), array('b')
+  for longitude in longitudes:
+    nak, pada = classify(longitude)
+    nakshatras.append(nak)
+    padas.append(pada)
+  return nakshatras, padas
+
+
+def tithis(phases):
+  """Tithi (1..30) for every lunar phase, as at sunrise in ``tithi``."""
+  if numpy is not None:
+    return _int8_array(numpy.ceil(_float_column(phases) / 12))
+  return array('b', [ceil(phase / 12) for phase in phases])
+
+
+def karanas(phases):
+  """Karana (1..60) for every lunar phase, as at sunrise in ``karana``."""
+  if numpy is not None:
+    return _int8_array(numpy.ceil(_float_column(phases) / 6))
+  return array('b', [ceil(phase / 6) for phase in phases])
+
+
+def yogas(totals):
+  """Yoga (1..27) for every Moon + Sun longitude sum (mod 360), as in ``yoga``."""
+  if numpy is not None:
+    return _int8_array(numpy.ceil(_float_column(totals) * 27 / 360))
+  return array('b', [ceil(total * 27 / 360) for total in totals])
+
+
+def raasis(longitudes):
+  """Rāśi (1 = Mesha .. 12 = Meena) for every solar (or any) longitude."""
+  if numpy is not None:
+    return _int8_array(numpy.ceil(_float_column(longitudes) / 30.))
+  return array('b', [ceil(longitude / 30.) for longitude in longitudes])
+
+
+def navamsas(longitudes):
+  """Navāṃśa sign (0 = Aries .. 11 = Pisces) for every longitude, as ``navamsa_from_long``."""
+  if numpy is not None:
+    return _int8_array(numpy.trunc(numpy.remainder(_float_column(longitudes) / 40, 1) * 12))
+  return array('b', [_navamsa_sign(longitude) for longitude in longitudes])
+
+
+# ------- Memoization ----------
+# Expensive Swiss Ephemeris calls (longitudes, rise/set, new/full moon) are
+# memoized in caches registered here by name, so they can be inspected
+# (cache_stats), cleared and resized at runtime from one place. The default
+# entry limits fit one 14-month PDF build; a server handling many cities
+# wants more, a small container less. Limits come from the environment:
+#
+#   PANCHANGA_CACHE_LIMITS="sunrise=16384,_planet_longitude_cached=32MB,*=8MB"
+#   PANCHANGA_CACHE_TTL="*=3600"
+#
+# A limit is an entry count or approximate bytes (KB/MB/GB); a TTL is in
+# seconds. ``*`` applies to every cache not named, and set_cache_limits()
+# changes them later. Entries are dropped least recently used first.
+#
+# A ``key`` function normalizes the arguments before lookup (the value is
+# computed from the normalized ones), so near-identical calls share an entry:
+CACHE_COORDINATE_DIGITS = 5  # latitude/longitude rounding, ~1 m: sunrise moves by milliseconds
+CACHE_JD_DIGITS = 7  # instant rounding, ~8.6 ms; see _round_jd
+CacheStats = struct('CacheStats', ['hits', 'misses', 'size', 'bytes', 'maxsize', 'maxbytes', 'ttl', 'evictions'])
+_BYTE_UNITS = {'KB': 1 << 10, 'MB': 1 << 20, 'GB': 1 << 30}
+_caches = {}  # name -> Cache
+_MISSING = object()
+
+
+def _parse_cache_settings(text, parse):
+  """``{name: parse(value)}`` from ``"name=value,..."``."""
+  settings = {}
+  for item in (text or '').split(','):
+    if item.strip():
+      name, sep, value = item.partition('=')
+      if not sep:
+        raise ValueError('Expected name=value in cache setting: {!r}'.format(item))
+      settings[name.strip()] = parse(value.strip())
+  return settings
+
+
+def _parse_cache_limit(text):
+  """``(maxsize, maxbytes)`` for ``"4096"`` or ``"32MB"``."""
+  unit = text[-2:].upper()
+  if unit in _BYTE_UNITS:
+    return None, int(float(text[:-2]) * _BYTE_UNITS[unit])
+  return int(text), None
+
+
+_cache_limits = _parse_cache_settings(os.environ.get('PANCHANGA_CACHE_LIMITS'), _parse_cache_limit)
+_cache_ttls = _parse_cache_settings(os.environ.get('PANCHANGA_CACHE_TTL'), float)
+
+
+def _approximate_bytes(value):
+  """``sys.getsizeof`` of ``value`` and, for tuples, lists and dicts, of what they hold."""
+  size = sys.getsizeof(value)
+  if isinstance(value, memoryview):
+    size += value.nbytes
+  elif isinstance(value, (tuple, list)):
+    size += sum(_approximate_bytes(item) for item in value)
+  elif isinstance(value, dict):
+    size += sum(_approximate_bytes(key) + _approximate_bytes(item) for key, item in value.items())
+  return size
+
+
+class Cache:
+  """Thread-safe LRU table of at most ``maxsize`` entries and ``maxbytes`` approximate bytes.
+
+  ``None`` leaves a limit off. Entries older than ``ttl`` seconds are
+  recomputed on their next lookup. Sizes count key and value; they are
+  only measured per entry under a byte limit, and otherwise estimated from
+  the newest entries when ``stats()`` is called.
+  """
+
+  def __init__(self, name, maxsize=None, maxbytes=None, ttl=None):
+    self.name = name
+    self.entries = OrderedDict()  # key -> (value, bytes, stored at)
+    self.lock = Lock()
+    self.hits = self.misses = self.evictions = self.bytes = 0
+    self.resize(maxsize, maxbytes, ttl)
+
+  def get(self, key, default=_MISSING):
+    """Cached value for ``key``, or ``default``."""
+    with self.lock:
+      entry = self.entries.get(key)
+      if entry is not None and (self.ttl is None or monotonic() - entry[2] < self.ttl):
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+      self.misses += 1
+      return default
+
+  def put(self, key, value):
+    size = 0 if self.maxbytes is None else _approximate_bytes((key, value))
+    with self.lock:
+      old = self.entries.pop(key, None)
+      if old is not None:
+        self.bytes -= old[1]
+      self.entries[key] = (value, size, monotonic())
+      self.bytes += size
+      self._trim()
+
+  def _trim(self):
+    while self.entries and ((self.maxsize is not None and len(self.entries) > self.maxsize) or
+                            (self.maxbytes is not None and self.bytes > self.maxbytes)):
+      self.bytes -= self.entries.popitem(last=False)[1][1]
+      self.evictions += 1
+
+  def resize(self, maxsize=None, maxbytes=None, ttl=None):
+    """Set all three limits (``None``: unlimited), dropping entries over the new ones."""
+    with self.lock:
+      if maxbytes is not None and self.maxbytes is None:  # start measuring
+        for key, (value, _size, stored) in self.entries.items():
+          self.entries[key] = (value, _approximate_bytes((key, value)), stored)
+        self.bytes = sum(entry[1] for entry in self.entries.values())
+      self.maxsize, self.maxbytes, self.ttl = maxsize, maxbytes, ttl
+      if maxbytes is None:
+        self.bytes = 0
+      self._trim()
+
+  def clear(self):
+    """Drop every entry and reset the counters."""
+    with self.lock:
+      self.entries.clear()
+      self.hits = self.misses = self.evictions = self.bytes = 0
+
+  def stats(self):
+    with self.lock:
+      size, measured = len(self.entries), self.bytes
+      if self.maxbytes is None and size:
+        sample = list(islice(reversed(self.entries.items()), 32))
+        measured = size * sum(_approximate_bytes((key, entry[0])) for key, entry in sample) // len(sample)
+      return CacheStats(self.hits, self.misses, size, measured, self.maxsize, self.maxbytes, self.ttl, self.evictions)
+
+
+def memoized(maxsize=None, maxbytes=None, ttl=None, key=None):
+  """Memoize a function in a registered ``Cache`` named after it.
+
+  Limits are the defaults; ``PANCHANGA_CACHE_LIMITS``/``_TTL`` override
+  them. Outside this module the name is ``module.function``. The wrapper
+  has ``cache``, ``cache_info()`` and ``cache_clear()`` like ``lru_cache``.
+  """
+
+  def decorate(func):
+    name = func.__name__ if func.__module__ == __name__ else '{}.{}'.format(func.__module__, func.__name__)
+    limits = _cache_limits.get(name, _cache_limits.get('*', (maxsize, maxbytes)))
+    cache = _caches[name] = Cache(name, *limits, _cache_ttls.get(name, _cache_ttls.get('*', ttl)))
+
+    @wraps(func)
+    def memo(*args):
+      args = args if key is None else key(*args)
+      value = cache.get(args)
+      if value is _MISSING:
+        value = func(*args)
+        cache.put(args, value)
+      return value
+
+    memo.cache, memo.cache_info, memo.cache_clear = cache, cache.stats, cache.clear
+    return memo
+
+  return decorate
+
+
+def _cache(name):
+  if name not in _caches:
+    raise ValueError('Unknown cache: {}'.format(name))
+  return _caches[name]
+
+
+def set_cache_limits(name, maxsize=_MISSING, maxbytes=_MISSING, ttl=_MISSING):
+  """Resize cache ``name`` (``'*'``: every cache).
+
+  Limits not given keep their value; ``None`` turns a limit off.
+  """
+  for cache in (_caches.values() if name == '*' else [_cache(name)]):
+    limits = zip((maxsize, maxbytes, ttl), (cache.maxsize, cache.maxbytes, cache.ttl))
+    cache.resize(*(current if new is _MISSING else new for new, current in limits))
+
+
+def clear_caches(name='*'):
+  """Empty cache ``name``, or every registered cache."""
+  for cache in (_caches.values() if name == '*' else [_cache(name)]):
+    cache.clear()
+
+
+def cache_stats():
+  """``{name: CacheStats}`` for every registered cache.
+
+  Counts run since the cache was last cleared; ``bytes`` is approximate
+  (``sys.getsizeof`` of keys and values, shared objects counted each time).
+  """
+  return {name: cache.stats() for name, cache in _caches.items()}
+
+
+def _place_key(jd, place):
+  """``(jd, place)`` with coordinates rounded to ``CACHE_COORDINATE_DIGITS``."""
+  lat, lon, tz = place
+  return jd, Place(round(lat, CACHE_COORDINATE_DIGITS), round(lon, CACHE_COORDINATE_DIGITS), tz)
+
+
+def _mode_key(ayanamsa, coord_flag):
+  """No ayanamsa in tropical keys: every chosen ayanamsa shares them."""
+  return (None if coord_flag == swe.FLG_TROPICAL else ayanamsa), coord_flag
+
+
+# Instants a few float steps apart (rise + 0.25 against rise + 0.5 - 0.25, or
+# a seeded sunrise against rise_trans, which agree to ~1E-7 day) share an
+# entry: at current Julian days a 1E-7 day bin spans ~200 float steps. The
+# Moon moves at most ~1.3E-6 deg in 8.6 ms, far below the ephemeris accuracy
+# and the 1 s resolution of every time shown; the solvers (_syzygy, ingresses,
+# exact limb ends, limb sweeps) call swe directly and are not rounded.
+_round_jd = lambda jd: round(jd, CACHE_JD_DIGITS)
+
+
+@memoized(maxsize=65536, key=lambda ayanamsa, coord_flag, jd, planet: _mode_key(ayanamsa, coord_flag) +
+          (_round_jd(jd), planet))
 def _planet_longitude_cached(ayanamsa, coord_flag, jd, planet):
   """Nirayana/sayana longitude of ``planet`` at ``jd`` for one coordinate mode.
 
   ``ayanamsa`` and ``coord_flag`` are part of the key so cached values stay
   valid when ``set_chosen_ayanamsa`` / ``set_coordinate_mode`` are called.
+  Without a store or Chebyshev tier the value is derived from the shared
+  tropical cache, so a second selection at the same instant costs only an
+  ayanāṃśa lookup.
   """
-  set_ayanamsa_mode()
-  longi = swe.calc_ut(jd, planet, flags=swe.FLG_SWIEPH | coord_flag)
-  reset_ayanamsa_mode()
-  return norm360(longi[0][0])  # degrees
+  if longitude_store_dir and planet in _STORE_SLOTS:
+    longitude = _stored_longitude(ayanamsa, coord_flag, jd, planet)
+    if longitude is not None:
+      return longitude
+  if _chebyshev_segments is not None and planet in _CHEBYSHEV_LAYOUT:
+    return _chebyshev_evaluate(ayanamsa, coord_flag, jd, planet)[0]
+  if coord_flag == swe.FLG_TROPICAL:
+    return _tropical_longitude_cached(jd, planet)
+  return norm360(_tropical_longitude_cached(jd, planet) - _ayanamsa_cached(ayanamsa, jd))
+
+
+# Selection-independent tier under _planet_longitude_cached: sidereal
+# longitudes are tropical minus the true ayanāṃśa (nutation included, which
+# is what FLG_SIDEREAL subtracts; agreement ~1E-9 deg). A tropical calc_ut is
+# also several times cheaper than a sidereal one for the true-star modes.
+@memoized(maxsize=65536, key=lambda jd, planet: (_round_jd(jd), planet))
+def _tropical_longitude_cached(jd, planet):
+  """Sayana longitude of ``planet`` at ``jd``, shared by every selection."""
+  longi = ephemeris_call(None, swe.calc_ut, jd, planet, flags=swe.FLG_SWIEPH | swe.FLG_TROPICAL)
+  return norm360(longi[0][0])
+
+
+@memoized(maxsize=16384, key=lambda ayanamsa, jd: (ayanamsa, _round_jd(jd)))
+def _ayanamsa_cached(ayanamsa, jd):
+  """True ayanāṃśa (degrees) of ``ayanamsa`` at ``jd``; one per instant serves Sun and Moon."""
+  return ephemeris_call(ayanamsa, swe.get_ayanamsa_ex_ut, jd, swe.FLG_SWIEPH)[1]
 
 
 def planet_longitude(jd, planet):
   """Computes nirayana (sidereal) or sayana (tropical) longitude of given planet on jd"""
-  return _planet_longitude_cached(chosen_ayanamsa, coordinate_flag, jd, planet)
+  ayanamsa, coord_flag = selection_mode()
+  return _planet_longitude_cached(ayanamsa, coord_flag, jd, planet)
 
 
 solar_longitude = lambda jd: planet_longitude(jd, swe.SUN)
 lunar_longitude = lambda jd: planet_longitude(jd, swe.MOON)
 
 
-@lru_cache(maxsize=4096)  # memoize expensive Swiss Ephemeris rise lookup
+def planet_longitudes(jds, planet, selection=None):
+  """Longitudes of ``planet`` at every Julian day in ``jds`` (float64 ``array``).
+
+  Batch form of ``planet_longitude``: the sidereal mode is set once per
+  chunk rather than per call, and nothing goes through the LRU cache.
+  ``jds`` is any iterable of floats (a list, ``range`` or NumPy array); wrap
+  the result with ``numpy.frombuffer`` to get an ndarray without a copy.
+  ``selection`` is a coordinate selection key; ``None`` uses the active
+  selection.
+  """
+  ayanamsa, coord_flag = selection_mode(selection)
+  sidereal = coord_flag != swe.FLG_TROPICAL
+  jds = [_round_jd(float(jd)) for jd in jds]  # the instants _planet_longitude_cached computes at
+  result = array('d')
+
+  def chunk(start):
+    for jd in jds[start:start + 256]:  # keep each hold of the ephemeris lock short
+      longitude = norm360(swe.calc_ut(jd, planet, flags=swe.FLG_SWIEPH | swe.FLG_TROPICAL)[0][0])
+      if sidereal:  # as in _planet_longitude_cached
+        longitude = norm360(longitude - swe.get_ayanamsa_ex_ut(jd, swe.FLG_SWIEPH)[1])
+      result.append(longitude)
+
+  for start in range(0, len(jds), 256):
+    ephemeris_call(ayanamsa, chunk, start)
+  return result
+
+
+solar_longitudes = lambda jds, selection=None: planet_longitudes(jds, swe.SUN, selection)
+lunar_longitudes = lambda jds, selection=None: planet_longitudes(jds, swe.MOON, selection)
+
+
+def ayanamsas(jds, selection=None):
+  """True ayanāṃśa (degrees) at every Julian day in ``jds`` as a float64 ``array``.
+
+  This is what a sidereal longitude is short of the tropical one (nutation
+  included), so ``tropical - ayanamsa`` gives any selection's longitudes;
+  all zeros for ``'tropical'``.
+  """
+  ayanamsa, coord_flag = selection_mode(selection)
+  jds = [_round_jd(float(jd)) for jd in jds]
+  if coord_flag == swe.FLG_TROPICAL:
+    return array('d', bytes(8 * len(jds)))
+  result = array('d')
+
+  def chunk(start):
+    for jd in jds[start:start + 256]:
+      result.append(swe.get_ayanamsa_ex_ut(jd, swe.FLG_SWIEPH)[1])
+
+  for start in range(0, len(jds), 256):
+    ephemeris_call(ayanamsa, chunk, start)
+  return result
+
+
+# ------- Chebyshev ephemeris tier ----------
+# Optional: Sun and Moon longitudes from Chebyshev fits over short segments
+# instead of one swe.calc_ut per instant. Off until set_chebyshev_cache().
+# planet: (segment length in days, nodes per segment). Measured 1900-2100
+# against Swiss Ephemeris: < 1E-8 deg for both (true-star ayanamsas included);
+# speeds agree with FLG_SPEED to ~1E-4 deg/day.
+_CHEBYSHEV_LAYOUT = {swe.SUN: (4.0, 12), swe.MOON: (4.0, 12)}
+CHEBYSHEV_MAX_ERROR = 1E-7  # degrees, ~0.0004"; well under 1 ms of lunar motion
+_chebyshev_segments = None  # OrderedDict of fitted segments while enabled
+_chebyshev_max_segments = 0
+_chebyshev_lock = Lock()
+
+
+def set_chebyshev_cache(max_segments=1024):
+  """Enable the Chebyshev Sun/Moon tier holding at most ``max_segments`` fits.
+
+  A segment spans 4 days of one body and takes ~0.5 KB, so the default
+  covers five years of Sun and Moon per coordinate mode in about half a MB.
+  Segments are fitted on first use and the least recently used one is
+  dropped when full. ``max_segments=0`` (or ``None``) switches the tier off.
+  """
+  global _chebyshev_segments, _chebyshev_max_segments
+  with _chebyshev_lock:
+    _chebyshev_segments = OrderedDict() if max_segments else None
+    _chebyshev_max_segments = max_segments or 0
+  _planet_longitude_cached.cache_clear()
+  _lunar_phase_cached.cache_clear()
+
+
+def _chebyshev_fit(ayanamsa, coord_flag, planet, index):
+  """``(coefficients, derivative coefficients)`` of segment ``index`` of ``planet``."""
+  length, count = _CHEBYSHEV_LAYOUT[planet]
+  middle, half = (index + 0.5) * length, length / 2
+  nodes = [cos(pi * (k + 0.5) / count) for k in range(count)]
+  values = ephemeris_call(
+    ayanamsa, lambda: [swe.calc_ut(middle + half * x, planet, flags=swe.FLG_SWIEPH | coord_flag)[0][0] for x in nodes])
+  for k in range(1, count):  # unwrap across 0°/360°
+    values[k] = lon_relative_to_base(values[k], values[k - 1])
+  coeffs = [
+    2 / count * sum(value * cos(pi * j * (k + 0.5) / count) for k, value in enumerate(values)) for j in range(count)
+  ]
+  coeffs[0] /= 2
+  derivs = [0.0] * (count + 1)
+  for j in range(count - 1, 0, -1):
+    derivs[j - 1] = derivs[j + 1] + 2 * j * coeffs[j] / half  # d/d(jd), in degrees/day
+  derivs[0] /= 2
+  return tuple(coeffs), tuple(derivs[:count - 1])
+
+
+def _clenshaw(coeffs, x):
+  b1 = b2 = 0.0
+  for c in reversed(coeffs[1:]):
+    b1, b2 = 2 * x * b1 - b2 + c, b1
+  return x * b1 - b2 + coeffs[0]
+
+
+def _chebyshev_evaluate(ayanamsa, coord_flag, jd, planet):
+  """``(longitude, speed)`` of ``planet`` at ``jd`` from the segment cache."""
+  length = _CHEBYSHEV_LAYOUT[planet][0]
+  index = floor(jd / length)
+  key = (None if coord_flag == swe.FLG_TROPICAL else ayanamsa, coord_flag, planet, index)
+  with _chebyshev_lock:
+    fit = _chebyshev_segments.get(key)
+    if fit is not None:
+      _chebyshev_segments.move_to_end(key)
+  if fit is None:
+    fit = _chebyshev_fit(ayanamsa, coord_flag, planet, index)
+    with _chebyshev_lock:
+      _chebyshev_segments[key] = fit
+      while len(_chebyshev_segments) > _chebyshev_max_segments:
+        _chebyshev_segments.popitem(last=False)
+  x = 2 * (jd / length - index) - 1
+  return norm360(_clenshaw(fit[0], x)), _clenshaw(fit[1], x)
+
+
+def chebyshev_longitude(jd, planet, selection=None):
+  """``(longitude, speed)`` in degrees and degrees/day of the Sun or Moon.
+
+  Served from the Chebyshev tier, which must be enabled with
+  ``set_chebyshev_cache``; error is below ``CHEBYSHEV_MAX_ERROR``.
+  """
+  if planet not in _CHEBYSHEV_LAYOUT:
+    raise ValueError('No Chebyshev fit for planet {}'.format(planet))
+  if _chebyshev_segments is None:
+    raise RuntimeError('Chebyshev cache is disabled; call set_chebyshev_cache() first')
+  ayanamsa, coord_flag = selection_mode(selection)
+  return _chebyshev_evaluate(ayanamsa, coord_flag, jd, planet)
+
+
+def chebyshev_cache_size():
+  """Number of fitted segments currently held (0 while disabled)."""
+  return len(_chebyshev_segments or ())
+
+
+# ------- Persistent longitude store ----------
+# Optional: Sun and Moon longitudes on a fixed quarter-day grid in one mmap'd
+# file per coordinate selection, shared by every process and kept across
+# restarts. Unfilled slots hold NaN and are computed on first use; a slot is
+# one aligned 8-byte write of a deterministic value, so readers and writers
+# need no lock. Enable with PANCHANGA_LONGITUDE_STORE=<dir> or
+# set_longitude_store(<dir>).
+_STORE_FORMAT = 1.0
+_STORE_GRID = (2415020.5, 0.25, 292196)  # start JD (1900-01-01 UT), step, points (to 2100)
+_STORE_HEADER = (_STORE_FORMAT, ) + _STORE_GRID
+_STORE_SLOTS = {swe.SUN: 0, swe.MOON: 1}  # interleaved per grid point
+_STORE_POINTS = 6  # Lagrange nodes; error < 3E-8 deg for the Moon
+longitude_store_dir = os.environ.get('PANCHANGA_LONGITUDE_STORE') or None
+_longitude_stores = {}  # file name -> memoryview of doubles
+_longitude_store_lock = Lock()  # only guards opening files
+
+
+def set_longitude_store(directory):
+  """Keep grid longitudes under ``directory`` (``None`` disables the store)."""
+  global longitude_store_dir
+  with _longitude_store_lock:
+    longitude_store_dir = directory
+    _longitude_stores.clear()
+  _planet_longitude_cached.cache_clear()
+  _lunar_phase_cached.cache_clear()
+
+
+def _longitude_store(ayanamsa, coord_flag):
+  """Memory-mapped grid for one coordinate selection, created NaN-filled if absent."""
+  name = 'longitudes-{}-{}.bin'.format('tropical' if coord_flag == swe.FLG_TROPICAL else ayanamsa, swe.version)
+  view = _longitude_stores.get(name)
+  if view is not None:
+    return view
+  with _longitude_store_lock:
+    view = _longitude_stores.get(name)
+    if view is None:
+      path = os.path.join(longitude_store_dir, name)
+      size = 8 * (len(_STORE_HEADER) + len(_STORE_SLOTS) * _STORE_GRID[2])
+      if not os.path.exists(path) or os.path.getsize(path) != size:
+        # Build aside and rename so no process maps a half-written file.
+        os.makedirs(longitude_store_dir, exist_ok=True)
+        scratch = '{}.{}.tmp'.format(path, os.getpid())
+        with open(scratch, 'wb') as f:
+          array('d', _STORE_HEADER).tofile(f)
+          (array('d', [nan]) * (len(_STORE_SLOTS) * _STORE_GRID[2])).tofile(f)
+        os.replace(scratch, path)
+      with open(path, 'r+b') as f:
+        view = memoryview(mmap.mmap(f.fileno(), 0)).cast('d')
+      if tuple(view[:len(_STORE_HEADER)]) != _STORE_HEADER:
+        raise ValueError('Longitude store {} has an incompatible layout'.format(path))
+      _longitude_stores[name] = view
+  return view
+
+
+def _fill_store_slots(view, ayanamsa, coord_flag, planet, indices):
+  """Compute grid ``indices`` of ``planet`` with Swiss Ephemeris and write them."""
+  start, step, _ = _STORE_GRID
+  offset = len(_STORE_HEADER) + _STORE_SLOTS[planet]
+
+  def fill(chunk):
+    for index in chunk:
+      longitude = swe.calc_ut(start + index * step, planet, flags=swe.FLG_SWIEPH | coord_flag)[0][0]
+      view[offset + len(_STORE_SLOTS) * index] = norm360(longitude)
+
+  for first in range(0, len(indices), 256):  # keep each hold of the ephemeris lock short
+    ephemeris_call(ayanamsa, fill, indices[first:first + 256])
+
+
+def _stored_longitude(ayanamsa, coord_flag, jd, planet):
+  """Longitude interpolated from the store, or ``None`` when ``jd`` is off the grid."""
+  start, step, count = _STORE_GRID
+  position = (jd - start) / step
+  first = floor(position) - _STORE_POINTS // 2 + 1
+  if first < 0 or first + _STORE_POINTS > count:
+    return None
+  view = _longitude_store(ayanamsa, coord_flag)
+  offset = len(_STORE_HEADER) + _STORE_SLOTS[planet] + len(_STORE_SLOTS) * first
+  values = [view[offset + len(_STORE_SLOTS) * k] for k in range(_STORE_POINTS)]
+  missing = [first + k for k, value in enumerate(values) if isnan(value)]
+  if missing:
+    _fill_store_slots(view, ayanamsa, coord_flag, planet, missing)
+    values = [view[offset + len(_STORE_SLOTS) * k] for k in range(_STORE_POINTS)]
+  for k in range(1, _STORE_POINTS):  # unwrap across 0°/360°
+    values[k] = lon_relative_to_base(values[k], values[k - 1])
+  x = position - first
+  longitude = 0.0
+  for k, value in enumerate(values):
+    weight = value
+    for m in range(_STORE_POINTS):
+      if m != k:
+        weight *= (x - m) / (k - m)
+    longitude += weight
+  return norm360(longitude)
+
+
+def fill_longitude_store(start_jd, end_jd, selection=None):
+  """Precompute every Sun and Moon grid point between ``start_jd`` and ``end_jd``.
+
+  Run once at deploy time (the store must be enabled) so that even the
+  first request reads only from the file.
+  """
+  if not longitude_store_dir:
+    raise RuntimeError('Longitude store is disabled; call set_longitude_store() first')
+  ayanamsa, coord_flag = selection_mode(selection)
+  start, step, count = _STORE_GRID
+  first = max(0, floor((start_jd - start) / step) - _STORE_POINTS)
+  last = min(count, ceil((end_jd - start) / step) + _STORE_POINTS)
+  view = _longitude_store(ayanamsa, coord_flag)
+  for planet, slot in _STORE_SLOTS.items():
+    offset = len(_STORE_HEADER) + slot
+    missing = [index for index in range(first, last) if isnan(view[offset + len(_STORE_SLOTS) * index])]
+    _fill_store_slots(view, ayanamsa, coord_flag, planet, missing)
+
+
+# Rise/set searches are memoized on their UT start, not on the civil date and
+# timezone offset. (A start independent of the offset would let DST share
+# searches, but rise_trans misplaces an event by seconds when the search
+# starts just after the previous one, so the start stays local midnight.)
+# The cache holds one float per event; the ``*_jd`` functions return it in
+# local time and sunrise() & co. build fresh [h, m, s] lists for display, so
+# callers can never change a cached value.
+@memoized(maxsize=16384)  # start unrounded: polar moonrise moves ~10 ms per 1E-10 day of start
+def _rise_trans_from(start, planet, rsmi, lat, lon):
+  """UT of the first ``rsmi`` event of ``planet`` after UT ``start`` (0.0 when there is none)."""
+  return swe.rise_trans(start, planet, geopos=(lon, lat, 0), rsmi=rsmi)[1][0]
+
+
+def _rise_trans_ut(jd, place, planet, rsmi):
+  """UT of the first ``rsmi`` event of ``planet`` after local midnight of civil day ``jd``."""
+  lat, lon, tz = _place_key(jd, place)[1]
+  return _rise_trans_from(jd - tz / 24, planet, rsmi, lat, lon)
+
+
 def sunrise(jd, place):
   """Sunrise when centre of disc is at horizon for given date and place"""
   lat, lon, tz = place
-  result = swe.rise_trans(jd - tz / 24, swe.SUN, geopos=(lon, lat, 0), rsmi=_rise_flags + swe.CALC_RISE)
-  rise = result[1][0]  # julian-day number
+  rise = _rise_trans_ut(jd, place, swe.SUN, _rise_flags + swe.CALC_RISE)  # julian-day number
   # Convert to local time
   return [rise + tz / 24., to_dms((rise - jd) * 24 + tz)]
 
 
-@lru_cache(maxsize=4096)  # memoize expensive Swiss Ephemeris set lookup
+def sunrise_jd(jd, place):
+  """Local Julian day of sunrise, as ``sunrise(jd, place)[0]``."""
+  return _rise_trans_ut(jd, place, swe.SUN, _rise_flags + swe.CALC_RISE) + place.timezone / 24.
+
+
 def sunset(jd, place):
   """Sunset when centre of disc is at horizon for given date and place"""
   lat, lon, tz = place
-  result = swe.rise_trans(jd - tz / 24, swe.SUN, geopos=(lon, lat, 0), rsmi=_rise_flags + swe.CALC_SET)
-  setting = result[1][0]  # julian-day number
+  setting = _rise_trans_ut(jd, place, swe.SUN, _rise_flags + swe.CALC_SET)  # julian-day number
   # Convert to local time
   return [setting + tz / 24., to_dms((setting - jd) * 24 + tz)]
 
 
+def sunset_jd(jd, place):
+  """Local Julian day of sunset, as ``sunset(jd, place)[0]``."""
+  return _rise_trans_ut(jd, place, swe.SUN, _rise_flags + swe.CALC_SET) + place.timezone / 24.
+
+
 def moonrise(jd, place):
   """Moonrise when centre of disc is at horizon for given date and place"""
   rise = moonrise_jd(jd, place)
   return to_dms((rise - jd) * 24)
 
 
-@lru_cache(maxsize=4096)  # memoize expensive Swiss Ephemeris moonrise lookup
 def moonrise_jd(jd, place):
   """Local Julian day of the first moonrise after local midnight."""
-  lat, lon, tz = place
-  result = swe.rise_trans(jd - tz / 24, swe.MOON, geopos=(lon, lat, 0), rsmi=_rise_flags + swe.CALC_RISE)
-  rise = result[1][0]  # julian-day number
+  rise = _rise_trans_ut(jd, place, swe.MOON, _rise_flags + swe.CALC_RISE)  # julian-day number
   # Convert to local time
-  return rise + tz / 24.
+  return rise + place.timezone / 24.
 
 
 def moonset(jd, place):
   """Moonset when centre of disc is at horizon for given date and place"""
-  lat, lon, tz = place
-  result = swe.rise_trans(jd - tz / 24, swe.MOON, geopos=(lon, lat, 0), rsmi=_rise_flags + swe.CALC_SET)
-  setting = result[1][0]  # julian-day number
+  setting = _rise_trans_ut(jd, place, swe.MOON, _rise_flags + swe.CALC_SET)  # julian-day number
   # Convert to local time
-  return to_dms((setting - jd) * 24 + tz)
+  return to_dms((setting - jd) * 24 + place.timezone)
+
+
+SolarDaySeries = struct('SolarDaySeries', ['dates', 'places', 'sunrise', 'sunset', 'next_sunrise', 'gaps'])
+
+_EARTH_ROTATION = 360.9856  # degrees/day relative to the stars
+
+
+def _solar_altitude(jd_ut, geopos):
+  """True altitude of the Sun's centre under ``_rise_flags`` geometry and its rate (deg/day).
+
+  Geocentric, ecliptic latitude dropped, no refraction: what rise_trans
+  solves for with BIT_HINDU_RISING. At the horizon the rate is
+  -rotation * cos(latitude) * sin(azimuth from south).
+  """
+  sun = swe.calc_ut(jd_ut, swe.SUN, flags=swe.FLG_SWIEPH)[0]
+  azimuth, altitude, _ = swe.azalt(jd_ut, swe.ECL2HOR, geopos, 0, 0, (sun[0], 0.0, sun[2]))
+  return altitude, -_EARTH_ROTATION * cos(radians(geopos[1])) * sin(radians(azimuth))
+
+
+def _seeded_solar_event(guess, geopos, rising, start, stop):
+  """Newton from ``guess`` to a sunrise (sunset) in ``[start, stop)``, else ``None``.
+
+  ``None`` also when the Sun only grazes the horizon or the iteration lands
+  on the other event, so callers fall back to ``swe.rise_trans``.
+  """
+  jd = guess
+  for _ in range(6):
+    altitude, rate = _solar_altitude(jd, geopos)
+    if abs(rate) < 1 or (rate > 0) != rising:
+      return None
+    step = -altitude / rate
+    jd += step
+    if abs(step) < 1E-8:
+      return jd if start <= jd < stop else None
+  return None
+
+
+def solar_day_series(place, start_date, days):
+  """Sunrise, sunset and next sunrise (UT Julian days) for ``days`` consecutive civil days.
+
+  ``place`` is a ``Place`` or a callable mapping a ``Date`` to that day's
+  ``Place`` (so DST offsets can change per day, e.g.
+  ``functools.partial(place_for_date, location)``). ``start_date`` is a
+  ``Date`` (or anything with year/month/day) or the Julian day of its local
+  midnight, as taken by ``sunrise``.
+
+  Each event is found by Newton's method seeded from the previous day's
+  event, a few cheap evaluations instead of a full ``swe.rise_trans`` search;
+  the first day and any day where that fails use the cached ``sunrise`` /
+  ``sunset``. An event counts for a day only between its local midnights.
+  Polar days and nights are not errors: the missing values are NaN and the
+  day indices are listed in ``gaps``.
+  """
+  place_for = place if callable(place) else (lambda date: place)
+  if isinstance(start_date, (int, float)):
+    first_jd = start_date
+  else:
+    first_jd = gregorian_to_jd(Date(start_date.year, start_date.month, start_date.day))
+  dates, places, midnights = [], [], []
+  for index in range(days + 2):  # one more day for next_sunrise, one for its window
+    date = Date(*jd_to_gregorian(first_jd + index)[:3])
+    dates.append(date)
+    places.append(place_for(date))
+    midnights.append(first_jd + index - places[-1].timezone / 24)
+
+  def series(rising, count):
+    events = array('d')
+    for index in range(count):
+      day_place = places[index]
+      geopos = (day_place.longitude, day_place.latitude, 0)
+      start, stop = midnights[index], midnights[index + 1]
+      event = None
+      if index and not isnan(events[-1]):
+        guess = events[-1] + 1
+        if index > 1 and not isnan(events[-2]):
+          guess = 2 * events[-1] - events[-2]
+        event = _seeded_solar_event(guess, geopos, rising, start, stop)
+      if event is None:
+        cold = (sunrise if rising else sunset)(first_jd + index, day_place)[0] - day_place.timezone / 24
+        event = cold if start <= cold < stop else nan
+      events.append(event)
+    return events
+
+  rises = series(True, days + 1)
+  sets = series(False, days)
+  gaps = [index for index in range(days) if isnan(rises[index]) or isnan(sets[index]) or isnan(rises[index + 1])]
+  return SolarDaySeries(dates[:days], places[:days], rises[:days], sets, rises[1:], gaps)
+
+
+# One civil day's samples, shared by tithi, nakshatra, yoga, karana, lunar_masa
+# and varjyam: the UT sunrise and Moon / Sun longitudes at sunrise + offsets,
+# with their phase (Moon - Sun) and sum (Moon + Sun). Building it costs exactly
+# 2 * len(offsets) longitude lookups, however many of those functions run.
+# The phase comes from the selection-independent elongation cache, so tithi
+# and karana are identical (and computed once) in every selection.
+DayFrame = struct('DayFrame', ['jd', 'place', 'rise', 'offsets', 'lunar', 'solar', 'phase', 'total'])
+
+DAY_FRAME_OFFSETS = (0.0, 0.25, 0.5, 0.75, 1.0)
+
+
+def day_frame(jd, place, selection=None):
+  """``DayFrame`` for civil day ``jd`` at ``place`` in ``selection`` (default: active)."""
+  return _day_frame_cached(jd, place, *selection_mode(selection))
+
+
+@memoized(maxsize=4096,
+          key=lambda jd, place, ayanamsa, coord_flag: _place_key(jd, place) + _mode_key(ayanamsa, coord_flag))
+def _day_frame_cached(jd, place, ayanamsa, coord_flag):
+  rise = sunrise_jd(jd, place) - place.timezone / 24
+  times = [rise + offset for offset in DAY_FRAME_OFFSETS]
+  lunar = tuple(_planet_longitude_cached(ayanamsa, coord_flag, t, swe.MOON) for t in times)
+  solar = tuple(_planet_longitude_cached(ayanamsa, coord_flag, t, swe.SUN) for t in times)
+  phase = tuple(_lunar_phase_cached(t) for t in times)
+  total = tuple((moon + sun) % 360 for moon, sun in zip(lunar, solar))
+  return DayFrame(jd, place, rise, DAY_FRAME_OFFSETS, lunar, solar, phase, total)
+
+
+def _frame_motions(frame):
+  """Moon and Sun motion (degrees) since sunrise at each later frame offset."""
+  lunar_long_diff = [(moon - frame.lunar[0]) % 360 for moon in frame.lunar[1:]]
+  solar_long_diff = [(sun - frame.solar[0]) % 360 for sun in frame.solar[1:]]
+  return lunar_long_diff, solar_long_diff
+
+
+# Limb end times: 'fast' inverts the day frame's Lagrange fit (no further
+# ephemeris calls); 'exact' refines each boundary by Newton iteration on the
+# speeds swe.calc_ut returns, to EXACT_TOLERANCE days.
+PRECISIONS = ('fast', 'exact')
+EXACT_TOLERANCE = 1E-8  # ~1 ms
+
+# Which day frame series each limb's angle is read from.
+_FRAME_ANGLES = {'tithi': 'phase', 'karana': 'phase', 'nakshatra': 'lunar', 'yoga': 'total'}
+
+
+def _is_exact(precision):
+  """True for ``'exact'``, False for ``'fast'``; ``ValueError`` otherwise."""
+  if precision not in PRECISIONS:
+    raise ValueError('Unknown precision: {}'.format(precision))
+  return precision == 'exact'
+
+
+def _exact_crossing(limb, frame, target, previous=None):
+  """``(jd, speed)`` at which ``limb`` first reaches ``target`` after sunrise.
+
+  The first boundary is seeded from the frame's angle at sunrise and its mean
+  rate over the first sample step. For the next (kshaya) boundary pass
+  ``previous = (jd, speed, target)`` of the one before. Uses the active
+  coordinate mode (tropical for ``ELONGATION_LIMBS``).
+  """
+  ayanamsa, coord_flag = _limb_mode(limb)
+  flags = swe.FLG_SWIEPH | swe.FLG_SPEED | coord_flag
+  if previous is None:
+    series = getattr(frame, _FRAME_ANGLES[limb])
+    start, angle = frame.rise, series[0]
+    speed = ((series[1] - series[0]) % 360) / (frame.offsets[1] - frame.offsets[0])
+  else:
+    start, speed, angle = previous
+  return ephemeris_call(ayanamsa, _limb_crossing, limb, target % 360, start, angle, speed, flags, EXACT_TOLERANCE)
 
 
 # Tithi doesn't depend on Ayanamsa
-def tithi(jd, place):
-  """Tithi at sunrise for given date and place. Also returns tithi's end time."""
+def tithi(jd, place, frame=None, precision='fast'):
+  """Tithi at sunrise for given date and place. Also returns tithi's end time.
+
+  ``frame`` is this day's ``day_frame`` if the caller already has it.
+  ``precision`` is ``'fast'`` or ``'exact'`` (see ``PRECISIONS``).
+  """
+  exact = _is_exact(precision)
   tz = place.timezone
   # 1. Find time of sunrise
-  rise = sunrise(jd, place)[0] - tz / 24
+  frame = frame or day_frame(jd, place)
+  rise = frame.rise
 
   # 2. Find tithi at this JDN
-  moon_phase = lunar_phase(rise)
+  moon_phase = frame.phase[0]
   today = ceil(moon_phase / 12)
   degrees_left = today * 12 - moon_phase
 
-  # 3. Compute longitudinal differences at intervals of 0.25 days from sunrise
-  offsets = [0.25, 0.5, 0.75, 1.0]
-  lunar_long_diff = [(lunar_longitude(rise + t) - lunar_longitude(rise)) % 360 for t in offsets]
-  solar_long_diff = [(solar_longitude(rise + t) - solar_longitude(rise)) % 360 for t in offsets]
+  # 3. Longitudinal differences at intervals of 0.25 days from sunrise
+  offsets = list(frame.offsets[1:])
+  lunar_long_diff, solar_long_diff = _frame_motions(frame)
   relative_motion = [moon - sun for (moon, sun) in zip(lunar_long_diff, solar_long_diff)]
 
   # 4. Find end time by 4-point inverse Lagrange interpolation
@@ -466,11 +1341,14 @@ def tithi(jd, place):
   x = offsets
   # compute fraction of day (after sunrise) needed to traverse 'degrees_left'
   approx_end = inverse_lagrange(x, y, degrees_left)
+  if exact:
+    end_jd, speed = _exact_crossing('tithi', frame, today * 12)
+    approx_end = end_jd - rise
   ends = (rise + approx_end - jd) * 24 + tz
   answer = [int(today), to_dms(ends)]
 
   # 5. Check for skipped tithi
-  moon_phase_tmrw = lunar_phase(rise + 1)
+  moon_phase_tmrw = frame.phase[-1]
   tomorrow = ceil(moon_phase_tmrw / 12)
   isSkipped = (tomorrow - today) % 30 > 1
   if isSkipped:
@@ -478,6 +1356,9 @@ def tithi(jd, place):
     leap_tithi = today + 1
     degrees_left = leap_tithi * 12 - moon_phase
     approx_end = inverse_lagrange(x, y, degrees_left)
+    if exact:
+      end_jd, speed = _exact_crossing('tithi', frame, leap_tithi * 12, (end_jd, speed, today * 12))
+      approx_end = end_jd - rise
     ends = (rise + approx_end - jd) * 24 + place.timezone
     leap_tithi = 1 if today == 30 else leap_tithi
     answer += [int(leap_tithi), to_dms(ends)]
@@ -485,16 +1366,19 @@ def tithi(jd, place):
   return answer
 
 
-def nakshatra(jd, place):
+def nakshatra(jd, place, frame=None, precision='fast'):
   """Current nakshatra as of julian day (jd)
      1 = Asvini, 2 = Bharani, ..., 27 = Revati
+     ``frame`` and ``precision`` as in ``tithi``.
   """
+  exact = _is_exact(precision)
   # 1. Find time of sunrise
   lat, lon, tz = place
-  rise = sunrise(jd, place)[0] - tz / 24.  # Sunrise at UT 00:00
+  frame = frame or day_frame(jd, place)
+  rise = frame.rise  # Sunrise at UT 00:00
 
-  offsets = [0.0, 0.25, 0.5, 0.75, 1.0]
-  longitudes = [lunar_longitude(rise + t) for t in offsets]
+  offsets = list(frame.offsets)
+  longitudes = list(frame.lunar)
 
   # 2. Today's nakshatra is when offset = 0
   # There are 27 Nakshatras spanning 360 degrees
@@ -504,6 +1388,9 @@ def nakshatra(jd, place):
   y = unwrap_angles(longitudes)
   x = offsets
   approx_end = inverse_lagrange(x, y, nakshatra_end_point(nak))
+  if exact:
+    end_jd, speed = _exact_crossing('nakshatra', frame, nakshatra_end_point(nak))
+    approx_end = end_jd - rise
   ends = (rise - jd + approx_end) * 24 + tz
   answer = [int(nak), to_dms(ends)]
 
@@ -513,6 +1400,10 @@ def nakshatra(jd, place):
   if isSkipped:
     leap_nak = nak + 1
     approx_end = inverse_lagrange(offsets, longitudes, nakshatra_end_point(leap_nak))
+    if exact:
+      previous = (end_jd, speed, nakshatra_end_point(nak))
+      end_jd, speed = _exact_crossing('nakshatra', frame, nakshatra_end_point(leap_nak), previous)
+      approx_end = end_jd - rise
     ends = (rise - jd + approx_end) * 24 + tz
     leap_nak = 1 if nak == 27 else leap_nak
     answer += [int(leap_nak), to_dms(ends)]
@@ -520,28 +1411,28 @@ def nakshatra(jd, place):
   return answer
 
 
-def yoga(jd, place):
+def yoga(jd, place, frame=None, precision='fast'):
   """Yoga at given jd and place.
      1 = Vishkambha, 2 = Priti, ..., 27 = Vaidhrti
+     ``frame`` and ``precision`` as in ``tithi``.
   """
+  exact = _is_exact(precision)
   # 1. Find time of sunrise
   lat, lon, tz = place
-  rise = sunrise(jd, place)[0] - tz / 24.  # Sunrise at UT 00:00
+  frame = frame or day_frame(jd, place)
+  rise = frame.rise  # Sunrise at UT 00:00
 
   # 2. Find the Nirayana longitudes and add them
-  lunar_long = lunar_longitude(rise)
-  solar_long = solar_longitude(rise)
-  total = (lunar_long + solar_long) % 360
+  total = frame.total[0]
   # There are 27 Yogas spanning 360 degrees
   yog = ceil(total * 27 / 360)
 
   # 3. Find how many longitudes is there left to be swept
   degrees_left = yog * (360 / 27) - total
 
-  # 3. Compute longitudinal sums at intervals of 0.25 days from sunrise
-  offsets = [0.25, 0.5, 0.75, 1.0]
-  lunar_long_diff = [(lunar_longitude(rise + t) - lunar_longitude(rise)) % 360 for t in offsets]
-  solar_long_diff = [(solar_longitude(rise + t) - solar_longitude(rise)) % 360 for t in offsets]
+  # 3. Longitudinal sums at intervals of 0.25 days from sunrise
+  offsets = list(frame.offsets[1:])
+  lunar_long_diff, solar_long_diff = _frame_motions(frame)
   total_motion = [moon + sun for (moon, sun) in zip(lunar_long_diff, solar_long_diff)]
 
   # 4. Find end time by 4-point inverse Lagrange interpolation
@@ -549,13 +1440,14 @@ def yoga(jd, place):
   x = offsets
   # compute fraction of day (after sunrise) needed to traverse 'degrees_left'
   approx_end = inverse_lagrange(x, y, degrees_left)
+  if exact:
+    end_jd, speed = _exact_crossing('yoga', frame, yog * 360 / 27)
+    approx_end = end_jd - rise
   ends = (rise + approx_end - jd) * 24 + tz
   answer = [int(yog), to_dms(ends)]
 
   # 5. Check for skipped yoga
-  lunar_long_tmrw = lunar_longitude(rise + 1)
-  solar_long_tmrw = solar_longitude(rise + 1)
-  total_tmrw = (lunar_long_tmrw + solar_long_tmrw) % 360
+  total_tmrw = frame.total[-1]
   tomorrow = ceil(total_tmrw * 27 / 360)
   isSkipped = (tomorrow - yog) % 27 > 1
   if isSkipped:
@@ -563,6 +1455,9 @@ def yoga(jd, place):
     leap_yog = yog + 1
     degrees_left = leap_yog * (360 / 27) - total
     approx_end = inverse_lagrange(x, y, degrees_left)
+    if exact:
+      end_jd, speed = _exact_crossing('yoga', frame, leap_yog * 360 / 27, (end_jd, speed, yog * 360 / 27))
+      approx_end = end_jd - rise
     ends = (rise + approx_end - jd) * 24 + tz
     leap_yog = 1 if yog == 27 else leap_yog
     answer += [int(leap_yog), to_dms(ends)]
@@ -570,21 +1465,26 @@ def yoga(jd, place):
   return answer
 
 
-def karana(jd, place):
-  """Returns the karana and their ending times. (from 1 to 60)"""
+def karana(jd, place, frame=None, precision='fast'):
+  """Returns the karana and their ending times. (from 1 to 60)
+
+  Sampled from the UT sunrise like ``tithi`` (it shares the ``day_frame``);
+  ``precision`` as in ``tithi``.
+  """
+  exact = _is_exact(precision)
   tz = place.timezone
   # 1. Find time of sunrise
-  rise = sunrise(jd, place)[0]
+  frame = frame or day_frame(jd, place)
+  rise = frame.rise
 
   # 2. Find karana at this JDN
-  moon_phase = lunar_phase(rise)
+  moon_phase = frame.phase[0]
   today = ceil(moon_phase / 6)
   degrees_left = today * 6 - moon_phase
 
-  # 3. Compute longitudinal differences at intervals of 0.25 days from sunrise
-  offsets = [0.25, 0.5, 0.75, 1.0]
-  lunar_long_diff = [(lunar_longitude(rise + t) - lunar_longitude(rise)) % 360 for t in offsets]
-  solar_long_diff = [(solar_longitude(rise + t) - solar_longitude(rise)) % 360 for t in offsets]
+  # 3. Longitudinal differences at intervals of 0.25 days from sunrise
+  offsets = list(frame.offsets[1:])
+  lunar_long_diff, solar_long_diff = _frame_motions(frame)
   relative_motion = [moon - sun for (moon, sun) in zip(lunar_long_diff, solar_long_diff)]
 
   # 4. Find end time by 4-point inverse Lagrange interpolation
@@ -592,6 +1492,8 @@ def karana(jd, place):
   x = offsets
   # compute fraction of day (after sunrise) needed to traverse 'degrees_left'
   approx_end = inverse_lagrange(x, y, degrees_left)
+  if exact:
+    approx_end = _exact_crossing('karana', frame, today * 6)[0] - rise
   ends = (rise + approx_end - jd) * 24 + tz
   answer = [int(today), to_dms(ends)]
 
@@ -603,7 +1505,7 @@ def vaara(jd):
   return int(ceil(jd + 1) % 7)
 
 
-def lunar_masa(jd, place, tithi_number=None):
+def lunar_masa(jd, place, tithi_number=None, sunrise_jd=None, frame=None):
   """New-moon–bounded māsa at sunrise: (tithi, last_new_moon, masa_num, is_adhika).
 
   ``masa_num`` is 1 = Chaitra … 12 = Phālguna from the solar rāśi of the
@@ -611,11 +1513,20 @@ def lunar_masa(jd, place, tithi_number=None):
 
   This māsa identity (including adhika) is the same under amānta and
   pūrṇimānta labeling; only the civil name of ordinary kṛṣṇa differs.
-  Optional ``tithi_number`` skips a second ``tithi()`` call.
+  Optional ``tithi_number`` skips a second ``tithi()`` call and optional
+  ``sunrise_jd`` (local, as ``sunrise()[0]``) the sunrise lookup; a
+  ``frame`` (``day_frame``) supplies both. Inside ``EVENT_TABLE_SPAN`` the
+  māsa comes from the māsa index (``masa_month``).
   """
+  if frame is not None:
+    tithi_number = tithi(jd, place, frame)[0] if tithi_number is None else tithi_number
+    sunrise_jd = frame.rise + place.timezone / 24 if sunrise_jd is None else sunrise_jd
   ti = tithi(jd, place)[0] if tithi_number is None else tithi_number
-  critical = sunrise(jd, place)[0]
+  critical = sunrise(jd, place)[0] if sunrise_jd is None else sunrise_jd
   last_new_moon = new_moon(critical, ti, -1)
+  if EVENT_TABLE_SPAN[0] <= last_new_moon < EVENT_TABLE_SPAN[1]:
+    month = masa_month(last_new_moon)
+    return ti, last_new_moon, month.masa, month.is_adhika
   next_new_moon = new_moon(critical, ti, +1)
   this_solar_month = raasi(last_new_moon)
   next_solar_month = raasi(next_new_moon)
@@ -626,7 +1537,7 @@ def lunar_masa(jd, place, tithi_number=None):
   return ti, last_new_moon, int(masa_num), is_adhika
 
 
-def masa(jd, place, amanta=True, tithi_number=None):
+def masa(jd, place, amanta=True, tithi_number=None, sunrise_jd=None):
   """Returns lunar month and if it is adhika or not.
      Set amanta = False for Purnimanta month.
      1 = Chaitra, 2 = Vaisakha, ..., 12 = Phalguna
@@ -640,9 +1551,10 @@ def masa(jd, place, amanta=True, tithi_number=None):
      adhika month name. Away from adhika, śukla matches amānta and kṛṣṇa takes
      the next month (amānta Māgha-kṛṣṇa = pūrṇimānta Phālguna-kṛṣṇa).
 
-     Optional ``tithi_number`` skips a second ``tithi()`` call.
+     Optional ``tithi_number`` / ``sunrise_jd`` skip recomputing them
+     (see ``lunar_masa``).
   """
-  ti, _, maasa, is_leap_month = lunar_masa(jd, place, tithi_number=tithi_number)
+  ti, _, maasa, is_leap_month = lunar_masa(jd, place, tithi_number=tithi_number, sunrise_jd=sunrise_jd)
   maasa = display_masa_number(maasa, is_leap_month, ti, amanta)
   return [int(maasa), is_leap_month]
 
@@ -672,17 +1584,22 @@ def new_moon(jd, tithi_, opt=-1):
   """Returns JDN, where
      opt = -1:  JDN < jd such that lunar_phase(JDN) = 360 degrees
      opt = +1:  JDN >= jd such that lunar_phase(JDN) = 360 degrees
+
+     ``tithi_`` places the event to within days; inside ``LUNATION_SPAN``
+     the nearest one is then looked up in the lunation table.
   """
   if opt == -1: start = jd - tithi_  # previous new moon
   if opt == +1: start = jd + (30 - tithi_)  # next new moon
-  # Bucket by whole civil day: consecutive days re-derive nearly the same
+  if LUNATION_SPAN[0] <= start < LUNATION_SPAN[1]:
+    return _nearest_lunation(start, 0)
+  # Outside the table, bucket by whole civil day: consecutive days re-derive nearly the same
   # ``start`` while searching for the same event, and the interpolated event
   # time is essentially independent of which day asks for it. Memoizing per
   # bucket turns ~15 identical bisections per event into one.
   return _phase_event_cached(round(start), 360)
 
 
-@lru_cache(maxsize=4096)  # memoize expensive Swiss Ephemeris phase-event search
+@memoized(maxsize=4096)  # memoize expensive Swiss Ephemeris phase-event search
 def _phase_event_cached(day, target_degrees):
   # Search within a span of (day +- 2) days
   x = [-2 + offset / 4 for offset in range(17)]
@@ -701,27 +1618,519 @@ def full_moon(jd, tithi_, opt=-1):
      opt = +1:  JDN >= jd such that lunar_phase(JDN) = 180 degrees
 
      On pūrṇimā (tithi 15), opt=+1 is the current full moon (at/after jd),
-     not the one a synodic month later.
+     not the one a synodic month later. Looked up like ``new_moon``.
   """
   if opt == -1:  # previous full moon
     start = jd - (tithi_ - 15) if tithi_ > 15 else jd - (tithi_ + 15)
   if opt == +1:  # next full moon (including today when tithi_ == 15)
     start = jd + (15 - tithi_) if tithi_ <= 15 else jd - tithi_ + 45
+  if LUNATION_SPAN[0] <= start < LUNATION_SPAN[1]:
+    return _nearest_lunation(start, 1)
   # Bucket by whole civil day for the same reason as new_moon().
   return _phase_event_cached(round(start), 180)
 
 
-def raasi(jd):
-  """Zodiac of given jd. 1 = Mesha, ... 12 = Meena"""
+class _EventTable:
+  """Instants of numbered, strictly ordered events ``n`` in ``[first, last]``, in one sorted array.
+
+  ``solve(ns)`` returns the instants of consecutive events ``ns``; it runs
+  once per block of ``_EVENT_BLOCK`` on first use, so a lookup never pays
+  for the whole table. Events outside the span are solved on every call.
+  """
+  __slots__ = ('solve', 'first', 'jds', 'lock')
+
+  def __init__(self, solve, first, last):
+    self.solve = solve
+    self.first = first
+    self.jds = array('d', [nan]) * (last - first + 1)
+    self.lock = Lock()
+
+  def __getitem__(self, n):
+    index = n - self.first
+    if not 0 <= index < len(self.jds):
+      return self.solve([n])[0]
+    self.fill(n, n + 1)
+    return self.jds[index]
+
+  def fill(self, start, stop):
+    """Solve every missing block holding one of the events ``[start, stop)``."""
+    for index in range(max(start - self.first, 0), min(stop - self.first, len(self.jds))):
+      if not isnan(self.jds[index]):
+        continue
+      with self.lock:
+        if isnan(self.jds[index]):
+          block = range(index - index % _EVENT_BLOCK, min(index - index % _EVENT_BLOCK + _EVENT_BLOCK, len(self.jds)))
+          for slot, jd in zip(block, self.solve([self.first + slot for slot in block])):
+            self.jds[slot] = jd
+
+  def bisect(self, jd, start, stop):
+    """Number of the first event after ``jd``, which must fall among events ``[start, stop)``."""
+    self.fill(start, stop)
+    return self.first + bisect_right(self.jds, jd, start - self.first, stop - self.first)
+
+
+_EVENT_BLOCK = 64
+# Lunation and saṅkrānti tables cover 1800-2200; outside it events are solved directly.
+EVENT_TABLE_SPAN = (gregorian_to_jd(Date(1800, 1, 1)), gregorian_to_jd(Date(2200, 1, 1)))
+LUNATION_SPAN = EVENT_TABLE_SPAN
+
+# Every new and full moon, each solved exactly once: event n is the new moon
+# (even n) or full moon (odd n) n half lunations after the mean new moon of
+# 2000-01-06 (Meeus, ch. 49).
+Lunation = struct('Lunation', ['jd', 'phase'])
+
+_SYNODIC_MONTH = 29.530588861
+_LUNATION_EPOCH = 2451550.09766
+
+
+def _syzygy(n):
+  """Exact UT of half lunation ``n``: Newton on the elongation and its rate.
+
+  Tropical longitudes: the phase does not depend on the ayanāṃśa.
+  """
+  target = 180 * (n % 2)
+  jd = _LUNATION_EPOCH + n * _SYNODIC_MONTH / 2
+  for _ in range(10):
+    sun = swe.calc_ut(jd, swe.SUN, flags=swe.FLG_SWIEPH | swe.FLG_SPEED)[0]
+    moon = swe.calc_ut(jd, swe.MOON, flags=swe.FLG_SWIEPH | swe.FLG_SPEED)[0]
+    step = -((moon[0] - sun[0] - target + 180) % 360 - 180) / (moon[3] - sun[3])
+    jd += step
+    if abs(step) < 1E-9:
+      break
+  return jd
+
+
+_half_lunation_number = lambda jd: floor(2 * (jd - _LUNATION_EPOCH) / _SYNODIC_MONTH)
+_lunation_table = _EventTable(lambda ns: [_syzygy(n) for n in ns],
+                              _half_lunation_number(EVENT_TABLE_SPAN[0]) - 3,
+                              _half_lunation_number(EVENT_TABLE_SPAN[1]) + 3)
+
+
+def _nearest_lunation(jd, parity):
+  """Tabulated new (``parity`` 0) or full (1) moon nearest ``jd``, found by bisection."""
+  estimate = _half_lunation_number(jd)
+  after = _lunation_table.bisect(jd, estimate - 3, estimate + 4)
+  if after % 2 != parity:
+    after += 1
+  return min(_lunation_table[after - 2], _lunation_table[after], key=lambda event: abs(event - jd))
+
+
+def lunations(start_jd, end_jd):
+  """Yields ``Lunation(jd, phase)`` for every new (phase 360) and full (180) moon in ``[start_jd, end_jd)``.
+
+  Served from the lunation table inside ``LUNATION_SPAN``.
+  """
+  n = _half_lunation_number(start_jd) - 2
+  while True:
+    jd = _lunation_table[n]
+    if jd >= end_jd:
+      return
+    if jd >= start_jd:
+      yield Lunation(jd, 180 if n % 2 else 360)
+    n += 1
+
+
+# Saṅkrāntis: the Sun's ingress into each rāśi, one table per coordinate
+# selection ('tropical' or an ayanamsa). Event n enters rāśi n % 12 + 1;
+# n is counted so that 30 n is the Sun's mean longitude on the event.
+Sankranti = struct('Sankranti', ['jd', 'raasi'])
+
+_J2000 = 2451545.0
+_SOLAR_RATES = {True: 360 / 365.242190, False: 360 / 365.256363}  # deg/day: tropical, sidereal year
+_sankranti_tables = {}
+
+
+def _solve_ingresses(ayanamsa, coord_flag, anchor, rate, ns):
+  """Exact UT of ingresses ``ns``: Newton on the Sun's longitude and speed, one ephemeris hold."""
+
+  def solve():
+    jds = []
+    for n in ns:
+      jd = _J2000 + (30 * n - anchor) / rate
+      for _ in range(10):
+        sun = swe.calc_ut(jd, swe.SUN, flags=swe.FLG_SWIEPH | swe.FLG_SPEED | coord_flag)[0]
+        step = -((sun[0] - 30 * (n % 12) + 180) % 360 - 180) / sun[3]
+        jd += step
+        if abs(step) < 1E-9:
+          break
+      jds.append(jd)
+    return jds
+
+  return ephemeris_call(ayanamsa, solve)
+
+
+def _sankranti_table(selection=None):
+  """``(table, number)`` of one selection's saṅkrāntis; ``number(jd)`` estimates the last one before ``jd``."""
+  ayanamsa, coord_flag = selection_mode(selection)
+  key = 'tropical' if coord_flag == swe.FLG_TROPICAL else ayanamsa
+  entry = _sankranti_tables.get(key)
+  if entry is None:
+    anchor = ephemeris_call(ayanamsa, swe.calc_ut, _J2000, swe.SUN, flags=swe.FLG_SWIEPH | coord_flag)[0][0]
+    rate = _SOLAR_RATES[coord_flag == swe.FLG_TROPICAL]
+    number = lambda jd: floor((anchor + rate * (jd - _J2000)) / 30)
+    table = _EventTable(lambda ns: _solve_ingresses(ayanamsa, coord_flag, anchor, rate, ns),
+                        number(EVENT_TABLE_SPAN[0]) - 3,
+                        number(EVENT_TABLE_SPAN[1]) + 3)
+    entry = _sankranti_tables.setdefault(key, (table, number))
+  return entry
+
+
+def _last_sankranti(jd, selection=None):
+  """Number of the last saṅkrānti at or before ``jd`` (bisection in the table)."""
+  table, number = _sankranti_table(selection)
+  estimate = number(jd)
+  if EVENT_TABLE_SPAN[0] <= jd < EVENT_TABLE_SPAN[1]:
+    return table.bisect(jd, estimate - 2, estimate + 3) - 1
+  n = estimate + 2
+  while table[n] > jd:
+    n -= 1
+  return n
+
+
+def sankrantis(start_jd, end_jd, selection=None):
+  """Yields ``Sankranti(jd, raasi)`` for every solar ingress in ``[start_jd, end_jd)``.
+
+  Exact UT instants from the saṅkrānti table of ``selection`` (default: the
+  active one), so printing them costs no extra ephemeris calls.
+  """
+  table, number = _sankranti_table(selection)
+  n = number(start_jd) - 2
+  while True:
+    jd = table[n]
+    if jd >= end_jd:
+      return
+    if jd >= start_jd:
+      yield Sankranti(jd, n % 12 + 1)
+    n += 1
+
+
+# Equinoxes and solstices are the tropical saṅkrāntis into Aries, Cancer,
+# Libra and Capricorn, so they come from the 'tropical' table.
+CardinalPoint = struct('CardinalPoint', ['jd', 'longitude'])
+
+
+def cardinal_point(jd, longitude, opt=+1):
+  """UT instant the tropical Sun reaches ``longitude``, where
+     longitude = 0 / 90 / 180 / 270: March equinox / June solstice /
+                 September equinox / December solstice
+     opt = +1:  first one at or after jd
+     opt = -1:  last one before jd
+  """
+  if longitude % 90:
+    raise ValueError('Cardinal points are at 0, 90, 180 or 270 degrees, not {}'.format(longitude))
+  table = _sankranti_table('tropical')[0]
+  target = int(longitude) // 30 % 12
+  n = _last_sankranti(jd, 'tropical')
+  if opt == -1:
+    if table[n] >= jd:
+      n -= 1
+    return table[n - (n - target) % 12]
+  if table[n] < jd:
+    n += 1
+  return table[n + (target - n) % 12]
+
+
+def cardinal_points(start_jd, end_jd):
+  """Yields ``CardinalPoint(jd, longitude)`` for every equinox and solstice in ``[start_jd, end_jd)``."""
+  for ingress in sankrantis(start_jd, end_jd, 'tropical'):
+    if ingress.raasi % 3 == 1:
+      yield CardinalPoint(ingress.jd, (ingress.raasi - 1) * 30)
+
+
+def raasi(jd, selection=None):
+  """Zodiac of given jd. 1 = Mesha, ... 12 = Meena
+
+  Inside ``EVENT_TABLE_SPAN`` the last saṅkrānti is looked up in the
+  saṅkrānti table of ``selection`` (default: the active one) instead of
+  computing the Sun's longitude.
+  """
+  if EVENT_TABLE_SPAN[0] <= jd < EVENT_TABLE_SPAN[1]:
+    return _last_sankranti(jd, selection) % 12 + 1
   # 12 rasis occupy 360 degrees, so each one is 30 degrees
-  return ceil(solar_longitude(jd) / 30.)
+  return ceil(_planet_longitude_cached(*selection_mode(selection), jd, swe.SUN) / 30.)
+
+
+# Māsa index: one packed code per lunation and selection, derived from the
+# lunation and saṅkrānti tables a block at a time (number | 16 adhika |
+# 32 kṣaya; 0 means not built yet).
+MasaMonth = struct('MasaMonth', ['start_jd', 'end_jd', 'masa', 'is_adhika', 'is_kshaya'])
+
+_MASA_BLOCK = 32
+_ADHIKA_BIT, _KSHAYA_BIT = 16, 32
+_first_masa = -(-_lunation_table.first // 2)
+_masa_count = (_lunation_table.first + len(_lunation_table.jds) - 1) // 2 - _first_masa
+_masa_indexes = {}
+_masa_lock = Lock()
+
+
+def _selection_key(selection=None):
+  ayanamsa, coord_flag = selection_mode(selection)
+  return 'tropical' if coord_flag == swe.FLG_TROPICAL else ayanamsa
+
+
+def _pack_masa(k, key):
+  """Code of the lunation starting at new moon ``2 k``: rāśi of both new moons."""
+  this_raasi = _last_sankranti(_lunation_table[2 * k], key) % 12 + 1
+  next_raasi = _last_sankranti(_lunation_table[2 * k + 2], key) % 12 + 1
+  code = this_raasi % 12 + 1
+  if this_raasi == next_raasi:
+    code |= _ADHIKA_BIT
+  if (next_raasi - this_raasi) % 12 == 2:
+    code |= _KSHAYA_BIT
+  return code
+
+
+def _masa_code(k, selection=None):
+  key = _selection_key(selection)
+  codes = _masa_indexes.get(key)
+  if codes is None:
+    codes = _masa_indexes.setdefault(key, array('b', bytes(_masa_count)))
+  index = k - _first_masa
+  if not codes[index]:
+    with _masa_lock:
+      start = index - index % _MASA_BLOCK
+      for slot in range(start, min(start + _MASA_BLOCK, len(codes))):
+        if not codes[slot]:
+          codes[slot] = _pack_masa(_first_masa + slot, key)
+  return codes[index]
+
+
+def masa_month(jd, selection=None):
+  """``MasaMonth`` (new moon to new moon, UT) containing ``jd``, from the māsa index.
+
+  ``masa`` is 1 = Chaitra … 12 = Phālguna from the rāśi of the starting new
+  moon; ``is_adhika`` when no saṅkrānti falls inside, ``is_kshaya`` when two
+  do (the next māsa name is skipped). Raises ``ValueError`` outside
+  ``EVENT_TABLE_SPAN``.
+  """
+  if not EVENT_TABLE_SPAN[0] <= jd < EVENT_TABLE_SPAN[1]:
+    raise ValueError('No masa index outside Julian days {} to {}'.format(*EVENT_TABLE_SPAN))
+  estimate = _half_lunation_number(jd)
+  k = (_lunation_table.bisect(jd, estimate - 3, estimate + 4) - 1) // 2
+  code = _masa_code(k, selection)
+  return MasaMonth(_lunation_table[2 * k], _lunation_table[2 * k + 2], code % _ADHIKA_BIT, bool(code & _ADHIKA_BIT),
+                   bool(code & _KSHAYA_BIT))
+
+
+def masa_months(start_jd, end_jd, selection=None):
+  """Yields every ``MasaMonth`` overlapping ``[start_jd, end_jd)`` (see ``masa_month``)."""
+  month = masa_month(start_jd, selection)
+  while month.start_jd < end_jd:
+    yield month
+    if month.end_jd >= EVENT_TABLE_SPAN[1]:
+      return
+    month = masa_month(month.end_jd, selection)
+
+
+# Multi-selection comparison: nakshatra, yoga, rāśi and māsa of many
+# selections at once. Sun and Moon are computed once in tropical longitudes;
+# each selection adds only an ayanāṃśa series, subtracted per instant.
+SelectionLimbs = struct('SelectionLimbs',
+                        ['selection', 'ayanamsas', 'nakshatras', 'yogas', 'raasis', 'masas', 'adhikas'])
+
+
+def _last_new_moon_number(jd):
+  """Even half-lunation number of the last new moon at or before ``jd``."""
+  n = _half_lunation_number(jd) + 2
+  n -= n % 2
+  while _lunation_table[n] > jd:
+    n -= 2
+  return n
+
+
+def compare_selections(jds, selections, system=None):
+  """``[SelectionLimbs, ...]``, one per selection, at every UT instant in ``jds`` (typically sunrises).
+
+  ``nakshatras`` (in ``system``, as ``nakshatra_padas``), ``yogas`` and
+  ``raasis`` (of the Sun) are int8 arrays; ``masas`` and ``adhikas`` follow
+  ``lunar_masa`` from the rāśis of the new moons around each instant. Costs
+  one tropical Sun/Moon pass plus one ayanāṃśa series per selection.
+  """
+  jds = array('d', jds)
+  solar = solar_longitudes(jds, 'tropical')
+  lunar = lunar_longitudes(jds, 'tropical')
+  numbers = [_last_new_moon_number(jd) for jd in jds]
+  events = sorted(set(numbers) | {n + 2 for n in numbers})
+  event_jds = array('d', [_lunation_table[n] for n in events])
+  event_solar = solar_longitudes(event_jds, 'tropical')
+  result = []
+  for selection in selections:
+    shifts = ayanamsas(jds, selection)
+    moon = [(longitude - shift) % 360 for longitude, shift in zip(lunar, shifts)]
+    sun = [(longitude - shift) % 360 for longitude, shift in zip(solar, shifts)]
+    event_shifts = ayanamsas(event_jds, selection)
+    raasi_at = dict(
+      zip(events, raasis([(longitude - shift) % 360 for longitude, shift in zip(event_solar, event_shifts)])))
+    masas = array('b', [raasi_at[n] % 12 + 1 for n in numbers])
+    adhikas = [raasi_at[n] == raasi_at[n + 2] for n in numbers]
+    totals = [(m + s) % 360 for m, s in zip(moon, sun)]
+    result.append(
+      SelectionLimbs(selection, shifts,
+                     nakshatra_padas(moon, system)[0], yogas(totals), raasis(sun), masas, adhikas))
+  return result
 
 
 def lunar_phase(jd):
-  solar_long = solar_longitude(jd)
-  lunar_long = lunar_longitude(jd)
-  moon_phase = (lunar_long - solar_long) % 360
-  return moon_phase
+  """Moon - Sun elongation (0..360) at ``jd``: the same in every coordinate selection."""
+  return _lunar_phase_cached(jd)
+
+
+@memoized(maxsize=65536, key=lambda jd: (_round_jd(jd), ))
+def _lunar_phase_cached(jd):
+  """``lunar_phase`` from the tropical tier, cached once for all selections."""
+  solar_long = _planet_longitude_cached(None, swe.FLG_TROPICAL, jd, swe.SUN)
+  lunar_long = _planet_longitude_cached(None, swe.FLG_TROPICAL, jd, swe.MOON)
+  return (lunar_long - solar_long) % 360
+
+
+def lunar_phases(jds, selection=None):
+  """``lunar_phase`` for every Julian day in ``jds`` as a float64 ``array``.
+
+  Computed from tropical longitudes whatever ``selection`` is, since the
+  elongation does not depend on the ayanāṃśa.
+  """
+  jds = array('d', jds)
+  solar = solar_longitudes(jds, 'tropical')
+  lunar = lunar_longitudes(jds, 'tropical')
+  return array('d', [(moon - sun) % 360 for moon, sun in zip(lunar, solar)])
+
+
+# Tithi, karana, nakshatra and yoga boundaries are global instants: the same
+# for every city. Sweeping a whole span once and looking sunrises up against
+# it replaces the per-day Lagrange fits in bulk (calendar) computations.
+Transition = struct('Transition', ['jd', 'number'])
+LimbTimeline = struct('LimbTimeline', ['limb', 'start_jd', 'end_jd', 'first_number', 'jds', 'numbers'])
+
+LIMBS = ('tithi', 'karana', 'nakshatra', 'yoga')
+# Limbs that follow the Moon-Sun elongation: solved in tropical longitudes and
+# shared by every selection.
+ELONGATION_LIMBS = ('tithi', 'karana')
+# Upper bound of |f''| / (2 f') in 1/day for any limb angle f (Moon-driven).
+_NEWTON_CURVATURE = 0.05
+
+
+def limb_starts(limb):
+  """Ascending start longitudes (degrees) of every division of ``limb``."""
+  if limb == 'tithi':
+    return [12 * k for k in range(30)]
+  if limb == 'karana':
+    return [6 * k for k in range(60)]
+  if limb == 'nakshatra' and active_nakshatra_system() == 'unequal':
+    return garga_end_points[:-1]
+  if limb in ('nakshatra', 'yoga'):
+    return [k * 360 / 27 for k in range(27)]
+  raise ValueError('Unknown limb: {}'.format(limb))
+
+
+def _limb_mode(limb, selection=None):
+  """``selection_mode`` for ``limb``: tropical for ``ELONGATION_LIMBS``; no ayanamsa when tropical."""
+  if limb in ELONGATION_LIMBS:
+    return None, swe.FLG_TROPICAL
+  ayanamsa, coord_flag = selection_mode(selection)
+  return (None if coord_flag == swe.FLG_TROPICAL else ayanamsa), coord_flag
+
+
+def _limb_angle(jd, limb, flags):
+  """Angle swept by ``limb`` at ``jd`` and its rate in degrees/day.
+
+  Tithi and karana follow the Moon-Sun elongation, yoga their sum, and
+  nakshatra the Moon alone. Runs inside ``ephemeris_call``.
+  """
+  moon = swe.calc_ut(jd, swe.MOON, flags=flags)[0]
+  if limb == 'nakshatra':
+    return norm360(moon[0]), moon[3]
+  sun = swe.calc_ut(jd, swe.SUN, flags=flags)[0]
+  if limb == 'yoga':
+    return (moon[0] + sun[0]) % 360, moon[3] + sun[3]
+  return (moon[0] - sun[0]) % 360, moon[3] - sun[3]
+
+
+def _limb_crossing(limb, target, jd, angle, speed, flags, tolerance):
+  """First instant after ``jd`` at which ``limb`` reaches ``target`` degrees.
+
+  Newton iteration on the speed that ``swe.calc_ut`` returns alongside the
+  longitude. Convergence is quadratic with an error below
+  ``_NEWTON_CURVATURE * step**2`` (lunar acceleration over speed), so the
+  loop stops as soon as that bound is under ``tolerance``: usually two
+  evaluations from a linear guess. Returns ``(crossing_jd, speed_there)``.
+  """
+  guess = jd + ((target - angle) % 360) / speed
+  for _ in range(8):
+    angle, speed = _limb_angle(guess, limb, flags)
+    step = ((target - angle + 180) % 360 - 180) / speed
+    guess += step
+    if _NEWTON_CURVATURE * step * step < tolerance:
+      break
+  return guess, speed
+
+
+def _limb_sweep(start_jd, end_jd, limb, selection, tolerance):
+  """``(first_number, [Transition, ...])`` for ``limb`` over ``[start_jd, end_jd)``."""
+  starts = limb_starts(limb)
+  ayanamsa, coord_flag = _limb_mode(limb, selection)
+  flags = swe.FLG_SWIEPH | swe.FLG_SPEED | coord_flag
+  found = []
+  angle, speed = ephemeris_call(ayanamsa, _limb_angle, start_jd, limb, flags)
+  index = bisect_right(starts, angle) - 1
+  first_number = index + 1
+  jd = start_jd
+  while True:
+    index = (index + 1) % len(starts)
+    target = starts[index]
+    # One lock hold per boundary, so long sweeps do not stall other threads.
+    jd, speed = ephemeris_call(ayanamsa, _limb_crossing, limb, target, jd, angle, speed, flags, tolerance)
+    if jd >= end_jd:
+      break
+    angle = target
+    found.append(Transition(jd, index + 1))
+  return first_number, found
+
+
+def transitions(start_jd, end_jd, limb, selection=None, tolerance=1E-8):
+  """Every ``limb`` boundary in ``[start_jd, end_jd)`` as ``Transition(jd, number)``.
+
+  ``limb`` is one of ``LIMBS``; ``number`` is the division that begins at
+  ``jd`` (1..30 tithi, 1..60 karana, 1..27 nakshatra/yoga), in UT. Kshaya
+  divisions simply appear as two boundaries on the same civil day.
+  ``tolerance`` is in days; ``selection`` as in ``planet_longitudes``.
+  """
+  return _limb_sweep(start_jd, end_jd, limb, selection, tolerance)[1]
+
+
+def limb_timeline(start_jd, end_jd, limb, selection=None, tolerance=1E-8):
+  """``LimbTimeline`` for ``limb`` over ``[start_jd, end_jd)``; see ``limb_at``.
+
+  Build one per span and share it between days and cities: sunrise values
+  and end times then cost a binary search instead of ephemeris calls.
+  Timelines are memoized, so callers that derive the span from civil dates
+  (not from a city's sunrise) share one sweep across a multi-city batch.
+  """
+  ayanamsa, coord_flag = _limb_mode(limb, selection)
+  system = active_nakshatra_system() if limb == 'nakshatra' else None
+  return _cached_limb_timeline(start_jd, end_jd, limb, ayanamsa, coord_flag, system, tolerance)
+
+
+@memoized(maxsize=64)  # a few spans x limbs x selections
+def _cached_limb_timeline(start_jd, end_jd, limb, ayanamsa, coord_flag, system, tolerance):
+  """``limb_timeline`` memoized on the resolved mode (``system`` = nakshatra system)."""
+  selection = 'tropical' if coord_flag == swe.FLG_TROPICAL else ayanamsa
+  first_number, found = _limb_sweep(start_jd, end_jd, limb, selection, tolerance)
+  jds = memoryview(array('d', [item.jd for item in found])).toreadonly()  # shared by every caller
+  numbers = memoryview(array('b', [item.number for item in found])).toreadonly()
+  return LimbTimeline(limb, start_jd, end_jd, first_number, jds, numbers)
+
+
+def limb_at(timeline, jd):
+  """``(number, end_jd)`` of the division in force at UT ``jd``.
+
+  ``end_jd`` is ``None`` when the division outlasts the timeline.
+  """
+  if not timeline.start_jd <= jd < timeline.end_jd:
+    raise ValueError('JD {} is outside the {} timeline'.format(jd, timeline.limb))
+  index = bisect_right(timeline.jds, jd)
+  number = timeline.numbers[index - 1] if index else timeline.first_number
+  end_jd = timeline.jds[index] if index < len(timeline.jds) else None
+  return number, end_jd
 
 
 def _barhaspatya_ss(kali):
@@ -841,23 +2250,32 @@ def previous_masa_was_adhika(last_new_moon, is_adhika):
   """Whether the previous new-moon-bounded māsa was adhika."""
   if is_adhika:
     return False
+  if EVENT_TABLE_SPAN[0] <= last_new_moon - 1 < EVENT_TABLE_SPAN[1]:
+    return masa_month(last_new_moon - 1).is_adhika
   previous_new_moon = new_moon(last_new_moon - 1, 29, -1)
   return raasi(previous_new_moon) == raasi(last_new_moon)
 
 
 def day_duration(jd, place):
-  srise = sunrise(jd, place)[0]  # julian day num
-  sset = sunset(jd, place)[0]  # julian day num
+  srise = sunrise_jd(jd, place)
+  sset = sunset_jd(jd, place)
   diff = (sset - srise) * 24  # In hours
   return [diff, to_dms(diff)]
 
 
 def solar_times_utc(jd, place):
-  """Today's sunrise/sunset and tomorrow's sunrise as UTC Julian days."""
+  """Today's sunrise/sunset and tomorrow's sunrise as UTC Julian days.
+
+  Taken from a one-day ``solar_day_series`` (tomorrow seeded from today);
+  polar gaps keep the plain ``sunrise`` / ``sunset`` values.
+  """
+  series = solar_day_series(place, jd, 1)
+  if not series.gaps:
+    return series.sunrise[0], series.sunset[0], series.next_sunrise[0]
   timezone = place.timezone / 24
-  today_sunrise = sunrise(jd, place)[0] - timezone
-  today_sunset = sunset(jd, place)[0] - timezone
-  tomorrow_sunrise = sunrise(jd + 1, place)[0] - timezone
+  today_sunrise = sunrise_jd(jd, place) - timezone
+  today_sunset = sunset_jd(jd, place) - timezone
+  tomorrow_sunrise = sunrise_jd(jd + 1, place) - timezone
   return today_sunrise, today_sunset, tomorrow_sunrise
 
 
@@ -967,7 +2385,7 @@ def abhijit_muhurta(jd, place):
   return [(start_time - jd) * 24 + tz, (end_time - jd) * 24 + tz]
 
 
-def varjyam(jd, place):
+def varjyam(jd, place, frame=None):
   """Varjyam (Vishaghati) timings for the day.
   Returns a list of [start_time, end_time] in [h, m, s] format for all 
   varjyam periods that overlap with the day (sunrise to next sunrise).
@@ -980,8 +2398,9 @@ def varjyam(jd, place):
     0, 50, 24, 30, 40, 14, 21, 30, 20, 32, 30, 20, 18, 21, 20, 14, 14, 10, 14, 56, 24, 20, 10, 10, 18, 16, 24, 30
   ]
   tz = place.timezone
-  srise1 = sunrise(jd, place)[0] - tz / 24.
-  srise2 = sunrise(jd + 1, place)[0] - tz / 24.
+  frame = frame or day_frame(jd, place)
+  srise1 = frame.rise
+  srise2 = sunrise_jd(jd + 1, place) - tz / 24.
 
   # Sample Moon on a 0.40d grid (shared for all nakshatras). Coarser than
   # nakshatra/tithi's 0.25d; local 5-point Lagrange still lands within ~1s.
@@ -997,8 +2416,8 @@ def varjyam(jd, place):
   longitudes = unwrap_angles(longitudes)
 
   naks = set()
-  for t in [srise1, srise1 + 0.5, srise2]:
-    naks.add(nakshatra_pada(lunar_longitude(t))[0])
+  for longitude in [frame.lunar[0], frame.lunar[2], lunar_longitude(srise2)]:
+    naks.add(nakshatra_pada(longitude)[0])
 
   def moon_crossing(target_lon):
     """JD when Moon longitude hits ``target_lon``, via local 5-point Lagrange."""
@@ -1095,16 +2514,14 @@ def ascendant(jd, place):
   """Lagna (=ascendant) calculation at any given time & place"""
   lat, lon, tz = place
   jd_utc = jd - (tz / 24.)
-  set_ayanamsa_mode()  # needed for swe.houses_ex()
-
   # returns two arrays, cusps and ascmc, where ascmc[0] = Ascendant
-  lagna = swe.houses_ex(jd_utc, lat, lon, flags=swe.FLG_SIDEREAL)[1][0]
+  # (swe.houses_ex() needs the sidereal mode)
+  lagna = ephemeris_call(None, swe.houses_ex, jd_utc, lat, lon, flags=swe.FLG_SIDEREAL)[1][0]
   # 12 zodiac signs span 360°, so each one takes 30°
   # 0 = Mesha, 1 = Vrishabha, ..., 11 = Meena
   constellation = int(lagna / 30)
   coordinates = to_dms(lagna % 30)
 
-  reset_ayanamsa_mode()
   return [constellation, coordinates, nakshatra_pada(lagna)]
 
 
@@ -1114,6 +2531,10 @@ def navamsa_from_long(longitude):
   """Calculates the navamsa-sign in which given longitude falls
   0 = Aries, 1 = Taurus, ..., 11 = Pisces
   """
+  return _navamsa_sign(longitude)
+
+
+def _navamsa_sign(longitude):
   one_pada = (360 / (12 * 9))  # There are also 108 navamsas
   one_sign = 12 * one_pada  # = 40 degrees exactly
   signs_elapsed = longitude / one_sign
@@ -1146,13 +2567,12 @@ def sidereal_saptarshi_nakshatra(jd):
 
     Returns dict with mean nakshatra, pada, longitude, and individual stars.
     """
-  set_ayanamsa_mode()
   flags = swe.FLG_SWIEPH | swe.FLG_SIDEREAL
 
   longitudes = []
   individual = []
   for star in saptarshi_stars:
-    result = swe.fixstar_ut(star, jd, flags=flags)
+    result = ephemeris_call(None, swe.fixstar_ut, star, jd, flags=flags)
     longi = norm360(result[0][0])
     longitudes.append(longi)
     nak, pada = nakshatra_pada(longi)
@@ -1161,8 +2581,6 @@ def sidereal_saptarshi_nakshatra(jd):
   mean_long = sum(longitudes) / len(longitudes)
   mean_nak, mean_pada = nakshatra_pada(mean_long)
 
-  reset_ayanamsa_mode()
-
   return {'mean_nakshatra': mean_nak, 'mean_pada': mean_pada, 'mean_longitude': mean_long, 'individual': individual}
 
 
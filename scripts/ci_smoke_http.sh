@@ -101,6 +101,23 @@ assert float(data["ayanamsa_degrees"]) > 0
 print("raman ok:", data["ayanamsa"], f"{data['ayanamsa_degrees']}°")
 PY
 
+echo "smoke: GET /api/panchanga/compare"
+compare_json="$(curl -fsS --max-time 30 \
+  --get "${BASE_URL}/api/panchanga/compare" \
+  --data-urlencode "city=Bengaluru, IN" \
+  --data-urlencode "start=15/01/2026" \
+  --data-urlencode "end=17/01/2026")"
+python3 - "${compare_json}" <<'PY'
+import json, sys
+data = json.loads(sys.argv[1])
+assert len(data["days"]) == 3, data["days"]
+keys = [item["key"] for item in data["selections"]]
+assert "citra" in keys and "tropical" in keys, keys
+for day in data["days"]:
+    assert set(day["selections"]) == set(keys), day
+print("compare ok:", len(keys), "selections x", len(data["days"]), "days")
+PY
+
 echo "smoke: POST /generate"
 pdf_tmp="$(mktemp --suffix=.pdf)"
 cleanup() { rm -f "${pdf_tmp}"; }
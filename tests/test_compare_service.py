@@ -0,0 +1,57 @@
+"""Multi-selection comparison table and its JSON API."""
+
+import unittest
+from unittest import mock
+
+import panchanga
+from webapp.app import app
+from webapp.compare_service import compare_panchanga, require_selections
+from webapp.day_panchanga import compute_day_panchanga
+
+
+class ComparePanchangaTests(unittest.TestCase):
+
+  def test_matches_the_day_api_for_every_selection(self):
+    table = compare_panchanga("Bengaluru", "20/07/2023", "22/07/2023", selections=["citra", "raman", "tropical"])
+    self.assertEqual([row["date"] for row in table["days"]], ["20/07/2023", "21/07/2023", "22/07/2023"])
+    for row in table["days"]:
+      for selection, values in row["selections"].items():
+        day = compute_day_panchanga("Bengaluru", row["date"], coordinate_selection=selection)
+        self.assertEqual(values["nakshatra"]["name"], day["nakshatra"][0]["name"])
+        self.assertEqual(values["yoga"]["name"], day["yoga"][0]["name"])
+        self.assertEqual(values["masa"]["number"], day["masa_number"])
+        self.assertEqual(values["masa"]["is_adhika"], day["is_adhika"])
+        self.assertEqual(row["tithi"]["name"], day["tithi"][0]["name"])
+        if selection != "tropical":  # true vs mean ayanāṃśa: within nutation
+          self.assertAlmostEqual(values["ayanamsa_degrees"], day["ayanamsa_degrees"], delta=0.01)
+
+  def test_selections_share_one_longitude_pass(self):
+    with mock.patch("panchanga.swe.calc_ut", wraps=panchanga.swe.calc_ut) as calc:
+      compare_panchanga("Bengaluru", "05/01/2024", selections=["citra"])
+      single = calc.call_count
+      calc.reset_mock()
+      compare_panchanga("Bengaluru", "05/01/2024")
+    self.assertEqual(calc.call_count, single)
+
+  def test_rejects_bad_ranges_and_selections(self):
+    with self.assertRaisesRegex(ValueError, "End date"):
+      compare_panchanga("Bengaluru", "05/01/2024", "04/01/2024")
+    with self.assertRaisesRegex(ValueError, "At most"):
+      compare_panchanga("Bengaluru", "01/01/2024", "01/03/2025")
+    with self.assertRaisesRegex(ValueError, "Coordinate selection"):
+      require_selections("citra,bogus")
+    self.assertEqual(require_selections(" revati, citra,revati"), ["revati", "citra"])
+
+  def test_flask_route(self):
+    response = app.test_client().get("/api/panchanga/compare?city=Bengaluru&start=21/04/2023&selections=citra,tropical")
+    self.assertEqual(response.status_code, 200)
+    payload = response.get_json()
+    self.assertEqual([item["key"] for item in payload["selections"]], ["citra", "tropical"])
+    self.assertEqual(set(payload["days"][0]["selections"]), {"citra", "tropical"})
+    response = app.test_client().get("/api/panchanga/compare?city=Murmansk&start=01/01/2025")
+    self.assertEqual(response.status_code, 400)
+    self.assertIn("error", response.get_json())
+
+
+if __name__ == "__main__":
+  unittest.main()
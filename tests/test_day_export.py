@@ -0,0 +1,88 @@
+"""Streaming day iterator and the CSV / JSON Lines export CLI."""
+
+import contextlib
+from datetime import date
+import io
+import json
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import unittest
+from unittest import mock
+
+import generate_panchanga_calendar as calendar_module
+import panchanga
+from export_panchanga_days import FIELDS, export_days, main
+from generate_panchanga_calendar import daily_records, iter_day_tables, iter_days, load_location
+
+
+class IterDaysTests(unittest.TestCase):
+
+  def setUp(self):
+    self.location = load_location("Bengaluru")
+
+  def test_matches_daily_records_cut_to_the_range(self):
+    table = daily_records([(2026, 1), (2026, 2), (2026, 3)], self.location)
+    days = list(iter_days(self.location, date(2026, 1, 20), date(2026, 3, 5)))
+    self.assertEqual(days, list(table.between(date(2026, 1, 20), date(2026, 3, 5))))
+    self.assertEqual([len(chunk)
+                      for chunk in iter_day_tables(self.location, date(2026, 1, 20), date(2026, 3, 5))], [12, 28, 5])
+
+  def test_is_lazy_and_keeps_the_selection_to_itself(self):
+    selection = panchanga.Panchanga().selection
+    with mock.patch("generate_panchanga_calendar.month_day_table",
+                    wraps=calendar_module.month_day_table) as month_table:
+      days = iter_days(self.location, date(1950, 1, 1), date(2049, 12, 31), "tropical")
+      first = next(days)
+      self.assertEqual(month_table.call_count, 1)
+      self.assertEqual(panchanga.Panchanga().selection, selection)
+    with panchanga.Panchanga("tropical").active():
+      self.assertEqual(first, daily_records([(1950, 1)], self.location)[0])
+
+  def test_polar_night_outside_the_range_is_skipped(self):
+    murmansk = load_location("Murmansk")  # no sunrise from late November
+    days = list(iter_days(murmansk, date(2026, 11, 1), date(2026, 11, 5)))
+    self.assertEqual([day.civil_date for day in days], [date(2026, 11, day) for day in range(1, 6)])
+    self.assertEqual(list(iter_days(murmansk, date(2027, 1, 25), date(2027, 1, 31)))[-1].civil_date, date(2027, 1, 31))
+    with self.assertRaisesRegex(RuntimeError, "27/11/2026"):
+      list(iter_days(murmansk, date(2026, 11, 20), date(2026, 11, 30)))
+
+  def test_rejects_reversed_ranges(self):
+    with self.assertRaisesRegex(ValueError, "End date"):
+      next(iter_days(self.location, date(2026, 2, 1), date(2026, 1, 31)))
+
+
+class ExportDaysTests(unittest.TestCase):
+
+  def test_csv_and_json_lines_carry_the_same_rows(self):
+    location = load_location("Bengaluru")
+    text = io.StringIO()
+    export_days(location, date(2026, 2, 27), date(2026, 3, 2), text)
+    lines = text.getvalue().splitlines()
+    self.assertEqual(lines[0], ",".join(FIELDS))
+    self.assertEqual([line.split(",")[0]
+                      for line in lines[1:]], ["2026-02-27", "2026-02-28", "2026-03-01", "2026-03-02"])
+    text = io.StringIO()
+    export_days(location, date(2026, 2, 27), date(2026, 3, 2), text, "jsonl")
+    rows = [json.loads(line) for line in text.getvalue().splitlines()]
+    self.assertEqual([list(row) for row in rows], [list(FIELDS)] * 4)
+    self.assertEqual([str(row[key]) for key in FIELDS for row in rows[:1]], lines[1].split(","))
+
+  def test_cli_writes_a_file_or_stdout(self):
+    with TemporaryDirectory() as root:
+      path = Path(root) / "days.jsonl"
+      main(["--city", "Bengaluru", "--start", "2026-02-28", "--format", "jsonl", "-o", str(path)])
+      self.assertEqual(json.loads(path.read_text(encoding="utf-8"))["date"], "2026-02-28")
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+      main(["--city", "Bengaluru", "--start", "2026-02-28", "--end", "2026-03-01", "--ayanamsa", "tropical"])
+    self.assertEqual(len(output.getvalue().splitlines()), 3)
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+      main(["--city", "Murmansk", "--start", "2026-11-01", "--end", "2026-11-05"])
+    self.assertEqual(len(output.getvalue().splitlines()), 6)
+    with self.assertRaises(SystemExit), contextlib.redirect_stderr(io.StringIO()):
+      main(["--city", "Bengaluru", "--start", "28/02/2026"])
+
+
+if __name__ == "__main__":
+  unittest.main()
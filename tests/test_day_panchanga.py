@@ -1,7 +1,7 @@
 """Day WebUI panchanga API: māsa labels and convention-free ṛtus."""
 
 import unittest
-from threading import Event, Lock, Thread
+from threading import Event, Thread
 from unittest.mock import patch
 
 import panchanga
@@ -51,48 +51,54 @@ class DayPanchangaMasaRituTests(unittest.TestCase):
     self.assertEqual(stub.call_count, 1)
     self.assertEqual(stubbed["varjyam"], [{"start": "01:02:03", "end": "04:05:06"}])
 
-  def test_coordinate_lock_covers_the_full_day_calculation(self):
-    first_selected = Event()
-    second_started = Event()
-    release_first = Event()
-    calls = []
-    calls_lock = Lock()
+  def test_exact_precision_keeps_the_same_segments(self):
+    fast = compute_day_panchanga("Bengaluru", "21/04/2023")
+    exact = compute_day_panchanga("Bengaluru", "21/04/2023", precision="exact")
+    for limb in ("tithi", "nakshatra", "yoga", "karana"):
+      self.assertEqual([item["name"] for item in exact[limb]], [item["name"] for item in fast[limb]])
+    with self.assertRaises(ValueError):
+      compute_day_panchanga("Bengaluru", "21/04/2023", precision="slow")
+
+  def test_concurrent_selections_do_not_block_or_mix(self):
+    expected = {
+      selection: compute_day_panchanga("Bengaluru", "21/04/2023", coordinate_selection=selection)
+      for selection in ("tropical", "citra")
+    }
+    tropical_paused = Event()
+    release_tropical = Event()
+    results = {}
     errors = []
-    original_set_selection = panchanga.set_coordinate_selection
-
-    def blocking_set_selection(selection):
-      with calls_lock:
-        calls.append(selection)
-        first_call = len(calls) == 1
-      if first_call:
-        first_selected.set()
-        if not release_first.wait(5):
-          raise AssertionError("timed out waiting for first calculation")
-      return original_set_selection(selection)
-
-    def run(selection, started=None):
-      if started is not None:
-        started.set()
+    original_tithi = panchanga.tithi
+
+    def pausing_tithi(jd, place, frame=None, precision="fast"):
+      if panchanga.Panchanga().selection == "tropical":
+        tropical_paused.set()
+        if not release_tropical.wait(5):
+          raise AssertionError("timed out waiting for the citra request")
+      return original_tithi(jd, place, frame, precision)
+
+    def run(selection):
       try:
-        compute_day_panchanga("Bengaluru", "21/04/2023", coordinate_selection=selection)
+        results[selection] = compute_day_panchanga("Bengaluru", "21/04/2023", coordinate_selection=selection)
       except BaseException as error:  # pragma: no cover - assertion below reports it
         errors.append(error)
 
-    with patch.object(panchanga, "set_coordinate_selection", side_effect=blocking_set_selection):
+    with patch.object(panchanga, "tithi", side_effect=pausing_tithi):
       first = Thread(target=run, args=("tropical", ))
-      second = Thread(target=run, args=("citra", second_started))
       first.start()
-      self.assertTrue(first_selected.wait(5))
+      self.assertTrue(tropical_paused.wait(5))
+      # The tropical request is mid-calculation; citra must still complete.
+      second = Thread(target=run, args=("citra", ))
       second.start()
-      self.assertTrue(second_started.wait(5))
-      self.assertEqual(calls, ["tropical"])
-      release_first.set()
-      first.join(10)
       second.join(10)
+      self.assertFalse(second.is_alive())
+      release_tropical.set()
+      first.join(10)
 
-    self.assertFalse(first.is_alive() or second.is_alive())
+    self.assertFalse(first.is_alive())
     self.assertEqual(errors, [])
-    self.assertEqual(calls, ["tropical", "citra"])
+    self.assertEqual(results, expected)
+    self.assertEqual(panchanga.coordinate_flag, panchanga.swe.FLG_SIDEREAL)
 
   def test_purnimanta_renames_ordinary_krishna_masa(self):
     amanta = compute_day_panchanga("Bengaluru", "10/02/2023", month_system="amanta")
@@ -23,6 +23,9 @@ def _times(maximum):
 class FindLocalEclipsesTests(unittest.TestCase):
     geopos = (77.6, 13.0, 0.0)
 
+    def setUp(self):
+        panchanga.clear_caches("festival_rules._eclipse_when_loc")
+
     def test_purely_penumbral_lunar_is_omitted(self):
         with mock.patch(
                 "festival_rules.panchanga.swe.lun_eclipse_when_loc", side_effect=[
@@ -126,6 +129,9 @@ class FormatEclipseLineTests(unittest.TestCase):
 
 class EclipseCivilDatesTests(unittest.TestCase):
 
+    def setUp(self):
+        panchanga.clear_caches("festival_rules._eclipse_when_loc")
+
     def test_marks_only_local_date_of_maximum(self):
         from datetime import date, datetime
         from zoneinfo import ZoneInfo
@@ -11,7 +11,9 @@ import panchanga
 
 from festival_rules import (
   DayRecord,
+  DayTable,
   FESTIVAL_RULES,
+  FestivalIndex,
   all_festival_names,
   ekadashi_dates_from_records,
   format_festival_dates,
@@ -276,7 +278,7 @@ class FestivalSelectionTests(unittest.TestCase):
     months, month_data = covering_months_and_data()
     records = canonical_records(months, month_data)
     with mock.patch("festival_rules.panchanga.raasi", side_effect=fake_raasi), \
-            mock.patch("festival_rules.panchanga.swe.solcross_ut", return_value=-1.0), \
+            mock.patch("festival_rules.panchanga.cardinal_point", return_value=-1.0), \
             mock.patch("festival_rules.jd_to_local_civil_date", return_value=date(2030, 1, 1)):
       by_date, entries = resolve_festivals(records, {record.civil_date for record in records}, enabled_names=enabled)
     self.assertNotIn("Ugadi", [name for _marker, _dates, name in entries])
@@ -333,6 +335,12 @@ class SelectPlainTithiTests(unittest.TestCase):
   def test_ugadi_prefers_adhika_chaitra(self):
     self.assertEqual(select_plain_tithi_dates(self.records, 1, "S1", allow_adhika=True), [date(2030, 3, 10)])
 
+  def test_index_reads_the_adhika_column(self):
+    index = FestivalIndex(self.records)
+    self.assertEqual(index.adhika_dates, {date(2030, 3, 10), date(2030, 5, 1)})
+    index.by_date = {}  # row views are not consulted
+    self.assertEqual(select_plain_tithi_dates(index, 1, "S1", allow_adhika=True), [date(2030, 3, 10)])
+
   def test_ugadi_keeps_nija_when_no_adhika(self):
     records = [
       festival_record(date(2030, 4, 9), "S1", masa="1"),
@@ -413,6 +421,101 @@ class SelectKshayaTests(unittest.TestCase):
     self.assertEqual(select_kshaya_dates(records, "S3", masa=2), [])
 
 
+class FestivalIndexTests(unittest.TestCase):
+  """One index per record table answers every rule as the list selectors do."""
+
+  def setUp(self):
+    months, month_data = covering_months_and_data()
+    records = canonical_records(months, month_data)
+    # A kshaya S3 (S2 -> S4) and a duplicated date, in shuffled order.
+    records += [
+      festival_record(date(2031, 5, 1), "S2", masa="2"),
+      festival_record(date(2031, 5, 2), "S4", masa="2"),
+      festival_record(date(2031, 5, 2), "S4", masa="2", nakshatra=22),
+    ]
+    self.records = records[::2] + records[1::2]
+    self.index = FestivalIndex(self.records)
+
+  def test_queries_match_the_record_selectors(self):
+    with mock.patch("festival_rules.panchanga.raasi", side_effect=fake_raasi):
+      for rule in FESTIVAL_RULES:
+        if rule.masa is not None:
+          for allow_adhika in (False, True):
+            self.assertEqual(select_plain_tithi_dates(self.index, rule.masa, rule.tithi, allow_adhika),
+                             select_plain_tithi_dates(self.records, rule.masa, rule.tithi, allow_adhika), rule.name)
+      for tithi in ("S3", "K15", "S1"):
+        self.assertEqual(select_kshaya_dates(self.index, tithi, 2), select_kshaya_dates(self.records, tithi, 2))
+        self.assertEqual(select_tithi_dates(self.index, tithi), select_tithi_dates(self.records, tithi))
+      for selector in (select_onam_dates, select_rig_upakarma_dates, select_sama_upakarma_dates,
+                       select_vaikuntha_ekadashi_dates, select_mesha_sankranti_dates, select_makara_sankranti_dates):
+        self.assertEqual(selector(self.index), selector(self.records), selector.__name__)
+      self.assertEqual(sankranti_raasi_by_date(self.index), sankranti_raasi_by_date(self.records))
+
+  def test_rasi_is_computed_once_per_sunrise(self):
+    with mock.patch("festival_rules.panchanga.raasi", side_effect=fake_raasi) as raasi:
+      select_mesha_sankranti_dates(self.index)
+      select_makara_sankranti_dates(self.index)
+      select_onam_dates(self.index)
+    self.assertEqual(raasi.call_count, len({record.sunrise_jd for record in self.records}))
+
+  def test_lookups_read_the_columns(self):
+    with mock.patch("festival_rules.panchanga.raasi", side_effect=fake_raasi), \
+        mock.patch.object(DayTable, "__getitem__", side_effect=AssertionError("row view built")):
+      index = FestivalIndex(self.records)
+      for selector in (select_onam_dates, select_rig_upakarma_dates, select_sama_upakarma_dates,
+                       select_mesha_sankranti_dates, ekadashi_dates_from_records):
+        selector(index)
+      select_plain_tithi_dates(index, 1, "S1", allow_adhika=True)
+    self.assertEqual(index.by_date[date(2031, 5, 2)].nakshatra, 22)
+
+
+class DayTableTests(unittest.TestCase):
+  """Typed day columns with ``DayRecord`` row views."""
+
+  def setUp(self):
+    self.records = [
+      festival_record(date(2030, 3, 10), "S1", masa="A1", is_adhika=True, nakshatra=4, yoga=9, sunrise_jd=1.5),
+      festival_record(date(2030, 3, 11), "K15", masa="12", nakshatra=27, yoga=2, sunrise_jd=2.5),
+      festival_record(date(2030, 3, 9), "S14", masa="12", nakshatra=3, sunrise_jd=0.5),
+    ]
+    self.table = DayTable.from_records(self.records)
+
+  def test_records_round_trip_through_integer_columns(self):
+    self.assertEqual(list(self.table), sorted(self.records))
+    self.assertEqual(list(self.table.tithi), [14, 1, 30])
+    self.assertEqual(list(self.table.masa), [12, 1, 12])
+    self.assertEqual(list(self.table.is_adhika), [0, 1, 0])
+    self.assertEqual(self.table[-1], self.records[1])
+    self.assertIs(DayTable.from_records(self.table), self.table)
+
+  def test_slices_and_date_ranges_are_tables(self):
+    self.assertEqual(list(self.table.between(date(2030, 3, 10), date(2030, 4, 1))), self.records[:2])
+    self.assertEqual(len(self.table.between(date(2030, 4, 1), date(2030, 4, 30))), 0)
+    self.assertEqual(self.table[1:], self.table.between(date(2030, 3, 10), date(2030, 3, 11)))
+    self.assertEqual(self.table.dates, [date(2030, 3, 9), date(2030, 3, 10), date(2030, 3, 11)])
+
+  def test_bytes_round_trip_and_reject_other_data(self):
+    self.table.moonrise[1] = 3.25
+    self.assertEqual(DayTable.from_bytes(self.table.to_bytes()), self.table)
+    self.assertEqual(len(DayTable.from_bytes(DayTable().to_bytes())), 0)
+    for data in (b"", self.table.to_bytes()[:-1], self.table.to_bytes() + b"\0", b"XXXX" + self.table.to_bytes()[4:]):
+      with self.assertRaises(ValueError):
+        DayTable.from_bytes(data)
+
+  def test_daily_records_fill_the_time_columns(self):
+    location = load_location("Bengaluru")
+    table = daily_records([(2026, 2)], location)
+    self.assertEqual(len(table), 28)
+    for sunrise, sunset, tithi_end, raasi in zip(table.sunrise, table.sunset, table.tithi_end, table.raasi):
+      self.assertEqual(raasi, panchanga.raasi(sunrise))
+      self.assertLess(sunrise, sunset)
+      self.assertLess(sunrise, tithi_end)
+      self.assertLess(tithi_end - sunrise, 1.2)
+    self.assertTrue(all(moonrise != moonrise for moonrise in table.moonrise))  # NaN unless asked for
+    table = daily_records([(2026, 2)], location, moonrise=True)
+    self.assertEqual(sum(moonrise == moonrise for moonrise in table.moonrise), 28)
+
+
 class FormatFestivalDatesTests(unittest.TestCase):
 
   def test_formats_empty_single_range_and_scattered(self):
@@ -428,9 +531,9 @@ class ResolveFestivalsTests(unittest.TestCase):
     self.raasi_patcher = mock.patch("festival_rules.panchanga.raasi", side_effect=fake_raasi)
     self.raasi_patcher.start()
     self.addCleanup(self.raasi_patcher.stop)
-    self.solcross_patcher = mock.patch("festival_rules.panchanga.swe.solcross_ut", return_value=-1.0)
-    self.solcross_patcher.start()
-    self.addCleanup(self.solcross_patcher.stop)
+    self.cardinal_point_patcher = mock.patch("festival_rules.panchanga.cardinal_point", return_value=-1.0)
+    self.cardinal_point_patcher.start()
+    self.addCleanup(self.cardinal_point_patcher.stop)
     self.solstice_date_patcher = mock.patch("festival_rules.jd_to_local_civil_date", return_value=date(2030, 1, 1))
     self.solstice_date_patcher.start()
     self.addCleanup(self.solstice_date_patcher.stop)
@@ -956,10 +1059,10 @@ class SolsticeTests(unittest.TestCase):
                       sunrise_jd=december_solstice + 0.25),
     ]
 
-    def solcross(longitude, _start_jd, _flags):
+    def cardinal_point(_start_jd, longitude, _opt=+1):
       return {90.0: june_solstice, 270.0: december_solstice}[float(longitude)]
 
-    with mock.patch("festival_rules.panchanga.swe.solcross_ut", side_effect=solcross):
+    with mock.patch("festival_rules.panchanga.cardinal_point", side_effect=cardinal_point):
       north = (0.0, 45.0, 0.0)
       south = (0.0, -45.0, 0.0)
       self.assertEqual(select_uttarayana_dates(records, geopos=north, timezone_name="UTC"), [date(2030, 12, 22)])
@@ -5,6 +5,9 @@ bottom of ``panchanga.py``.
 """
 
 import os
+from math import isnan
+import tempfile
+import threading
 import unittest
 from unittest import mock
 import swisseph as swe
@@ -19,7 +22,7 @@ from panchanga import (
   default_se_ephe_path, get_planet_name, to_dms, to_dms_prec, unwrap_angles, lon_relative_to_base, inverse_lagrange,
   bisection_search, sidereal_saptarshi_nakshatra, saptarshi_nakshatra_traditional, set_nakshatra_system,
   set_chosen_ayanamsa, set_ayanamsa_mode, set_coordinate_mode, set_coordinate_selection, reset_ayanamsa_mode,
-  solar_longitude)
+  solar_longitude, norm180)
 
 bangalore = Place(12.972, 77.594, +5.5)
 shillong = Place(25.569, 91.883, +5.5)
@@ -641,10 +644,11 @@ class EphemerisCacheTests(PanchangaTestCase):
   def setUp(self):
     super().setUp()
     panchanga._planet_longitude_cached.cache_clear()
+    panchanga._tropical_longitude_cached.cache_clear()
+    panchanga._ayanamsa_cached.cache_clear()
+    panchanga._lunar_phase_cached.cache_clear()
     panchanga._phase_event_cached.cache_clear()
-    sunrise.cache_clear()
-    sunset.cache_clear()
-    moonrise_jd.cache_clear()
+    panchanga._rise_trans_from.cache_clear()
 
   def test_planet_longitude_cache_is_ayanamsa_aware(self):
     jd = gregorian_to_jd(Date(2023, 7, 25))
@@ -656,65 +660,625 @@ class EphemerisCacheTests(PanchangaTestCase):
     self.assertNotEqual(citra, lahiri)
     self.assertEqual(citra, solar_longitude(jd))
 
+  def test_selections_share_the_tropical_tier(self):
+    jd = gregorian_to_jd(Date(2023, 7, 25))
+    citra = solar_longitude(jd)
+    with mock.patch("panchanga.swe.calc_ut", wraps=swe.calc_ut) as calc:
+      revati = panchanga.Panchanga("revati").solar_longitude(jd)
+      tropical = panchanga.Panchanga("tropical").solar_longitude(jd)
+    self.assertEqual(calc.call_count, 0)
+    self.assertEqual(tropical, panchanga._tropical_longitude_cached(jd, swe.SUN))
+    self.assertAlmostEqual(tropical - citra, panchanga._ayanamsa_cached("citra", jd), places=9)
+    self.assertNotAlmostEqual(citra, revati)
+    panchanga.set_ayanamsa_mode()
+    expected = swe.calc_ut(jd, swe.SUN, flags=swe.FLG_SWIEPH | swe.FLG_SIDEREAL)[0][0]
+    panchanga.reset_ayanamsa_mode()
+    self.assertAlmostEqual(citra, expected, places=8)
+
+  def test_tithi_and_karana_are_computed_once_for_all_selections(self):
+    panchanga._day_frame_cached.cache_clear()
+    citra = [tithi(date2, bangalore), karana(date2, bangalore)]
+    for selection in ("revati", "lahiri", "tropical"):
+      context = panchanga.Panchanga(selection)
+      with mock.patch("panchanga.swe.calc_ut", wraps=swe.calc_ut) as calc:
+        self.assertEqual([context.tithi(date2, bangalore), context.karana(date2, bangalore)], citra)
+      self.assertEqual(calc.call_count, 0)
+      self.assertEqual(context.lunar_phase(date2), lunar_phase(date2))
+    self.assertIs(panchanga.limb_timeline(date2, date2 + 3, "tithi", "tropical"),
+                  panchanga.limb_timeline(date2, date2 + 3, "tithi", "revati"))
+
   def test_sunrise_and_sunset_cache_hit_on_repeat(self):
     first_rise = sunrise(date2, bangalore)
     first_set = sunset(date2, bangalore)
-    rise_hits = sunrise.cache_info().hits
-    set_hits = sunset.cache_info().hits
+    hits = panchanga._rise_trans_from.cache_info().hits
     self.assertEqual(sunrise(date2, bangalore), first_rise)
     self.assertEqual(sunset(date2, bangalore), first_set)
-    self.assertEqual(sunrise.cache_info().hits, rise_hits + 1)
-    self.assertEqual(sunset.cache_info().hits, set_hits + 1)
+    self.assertEqual(panchanga._rise_trans_from.cache_info().hits, hits + 2)
+
+  def test_cached_values_cannot_be_changed_by_callers(self):
+    first = sunrise(date2, bangalore)
+    first[1][0] = 99
+    self.assertEqual(sunrise(date2, bangalore)[1], [6, 49, 46])
+    self.assertEqual(panchanga.sunrise_jd(date2, bangalore), first[0])
+    self.assertEqual(panchanga.sunset_jd(date2, bangalore), sunset(date2, bangalore)[0])
+    self.assertIsInstance(panchanga._rise_trans_from.cache.entries.popitem()[1][0], float)
+    timeline = panchanga.limb_timeline(date2, date2 + 2, "tithi")
+    with self.assertRaises(TypeError):
+      timeline.jds[0] = 0.0
 
   def test_solar_times_utc_matches_cached_local_rise_and_set(self):
     timezone = bangalore.timezone / 24
-    expected = (
-      sunrise(date2, bangalore)[0] - timezone,
-      sunset(date2, bangalore)[0] - timezone,
-      sunrise(date2 + 1, bangalore)[0] - timezone,
-    )
-    self.assertEqual(solar_times_utc(date2, bangalore), expected)
+    today_rise, today_set, tomorrow_rise = solar_times_utc(date2, bangalore)
+    self.assertEqual(today_rise, sunrise(date2, bangalore)[0] - timezone)
+    self.assertEqual(today_set, sunset(date2, bangalore)[0] - timezone)
+    # Tomorrow is seeded from today rather than searched from midnight.
+    self.assertAlmostEqual(tomorrow_rise, sunrise(date2 + 1, bangalore)[0] - timezone, delta=1E-7)
 
   def test_moonrise_jd_cache_hit_on_repeat(self):
     first = moonrise_jd(date2, bangalore)
-    hits = moonrise_jd.cache_info().hits
+    hits = panchanga._rise_trans_from.cache_info().hits
     self.assertEqual(moonrise_jd(date2, bangalore), first)
-    self.assertEqual(moonrise_jd.cache_info().hits, hits + 1)
-
-  def test_new_moon_day_bucket_shared_across_adjacent_days(self):
-    """Nearest-day search centres must collide within one synodic span."""
-    jd_a = gregorian_to_jd(Date(2026, 1, 10))
-    jd_b = gregorian_to_jd(Date(2026, 1, 11))
-    crit_a = sunrise(jd_a, bangalore)[0]
-    crit_b = sunrise(jd_b, bangalore)[0]
-    ti_a = tithi(jd_a, bangalore)[0]
-    ti_b = tithi(jd_b, bangalore)[0]
-    panchanga._phase_event_cached.cache_clear()
-    last_a = new_moon(crit_a, ti_a, -1)
-    next_a = new_moon(crit_a, ti_a, +1)
-    misses_after_first_day = panchanga._phase_event_cached.cache_info().misses
-    last_b = new_moon(crit_b, ti_b, -1)
-    next_b = new_moon(crit_b, ti_b, +1)
-    self.assertEqual(last_a, last_b)
-    self.assertEqual(next_a, next_b)
-    # Second civil day should reuse both day-buckets (prev + next).
-    self.assertEqual(panchanga._phase_event_cached.cache_info().misses, misses_after_first_day)
-    self.assertGreaterEqual(panchanga._phase_event_cached.cache_info().hits, 2)
-
-  def test_full_moon_day_bucket_shared_across_adjacent_days(self):
+    self.assertEqual(panchanga._rise_trans_from.cache_info().hits, hits + 1)
+
+  def test_keys_are_quantized(self):
+    first = sunrise(date2, bangalore)
+    jd = gregorian_to_jd(Date(2023, 7, 25)) + 0.25
+    longitude = solar_longitude(jd)
+    noisy = Place(bangalore.latitude + 1E-9, bangalore.longitude - 1E-9, bangalore.timezone)
+    self.assertNotEqual(jd + 3E-10, jd)  # a few float steps at this Julian day
+    with mock.patch("panchanga.swe.rise_trans", wraps=swe.rise_trans) as rise, \
+         mock.patch("panchanga.swe.calc_ut", wraps=swe.calc_ut) as calc:
+      self.assertEqual(sunrise(date2, noisy), first)
+      self.assertEqual(solar_longitude(jd + 3E-10), longitude)
+      self.assertEqual(solar_longitude(jd - 3E-8), longitude)
+      self.assertEqual(solar_longitude(jd + 0.5 - 0.25 - 0.25 + 0.25 - 0.25), longitude)
+    self.assertEqual(rise.call_count, 0)
+    self.assertEqual(calc.call_count, 0)
+    with mock.patch("panchanga.swe.calc_ut", wraps=swe.calc_ut) as calc:
+      self.assertAlmostEqual(solar_longitude(jd + 1E-7), longitude, delta=1E-6)
+    self.assertEqual(calc.call_count, 1)  # the next bin is a new instant
+
+  def test_rise_searches_are_memoized_in_ut(self):
+    sunrise(date2, bangalore)
+    moonset(date2, bangalore)
+    with mock.patch("panchanga.swe.rise_trans", wraps=swe.rise_trans) as rise:
+      sunrise(date2, bangalore)
+      moonset(date2, bangalore)
+    self.assertEqual(rise.call_count, 0)
+
+  def test_cache_stats(self):
+    sunrise(date2, bangalore)
+    sunrise(date2, bangalore)
+    stats = panchanga.cache_stats()["_rise_trans_from"]
+    self.assertEqual(stats[:3], (1, 1, 1))
+    self.assertEqual((stats.maxsize, stats.evictions), (16384, 0))
+    self.assertGreater(stats.bytes, 0)
+    self.assertIn("_planet_longitude_cached", panchanga.cache_stats())
+
+  def test_new_moon_shared_across_adjacent_days(self):
+    """Adjacent days' tithi estimates resolve to the same tabulated events."""
     jd_a = gregorian_to_jd(Date(2026, 1, 10))
     jd_b = gregorian_to_jd(Date(2026, 1, 11))
     crit_a = sunrise(jd_a, bangalore)[0]
     crit_b = sunrise(jd_b, bangalore)[0]
     ti_a = tithi(jd_a, bangalore)[0]
     ti_b = tithi(jd_b, bangalore)[0]
-    panchanga._phase_event_cached.cache_clear()
-    prev_a = full_moon(crit_a, ti_a, -1)
-    next_a = full_moon(crit_a, ti_a, +1)
+    self.assertEqual(new_moon(crit_a, ti_a, -1), new_moon(crit_b, ti_b, -1))
+    self.assertEqual(new_moon(crit_a, ti_a, +1), new_moon(crit_b, ti_b, +1))
+    self.assertEqual(full_moon(crit_a, ti_a, -1), full_moon(crit_b, ti_b, -1))
+    self.assertEqual(full_moon(crit_a, ti_a, +1), full_moon(crit_b, ti_b, +1))
+    self.assertEqual(panchanga._phase_event_cached.cache_info().misses, 0)
+
+  def test_phase_event_bucket_outside_lunation_table(self):
+    jd = gregorian_to_jd(Date(1750, 3, 10))
+    first = new_moon(jd, 10, -1)
     misses = panchanga._phase_event_cached.cache_info().misses
-    self.assertEqual(prev_a, full_moon(crit_b, ti_b, -1))
-    self.assertEqual(next_a, full_moon(crit_b, ti_b, +1))
+    self.assertEqual(new_moon(jd + 1, 11, -1), first)
     self.assertEqual(panchanga._phase_event_cached.cache_info().misses, misses)
+    self.assertGreaterEqual(panchanga._phase_event_cached.cache_info().hits, 1)
+
+
+class CacheRegistryTests(PanchangaTestCase):
+  """Registered caches: limits in entries, bytes or age, changed at runtime."""
+
+  def test_entry_and_byte_limits_evict_least_recently_used(self):
+    cache = panchanga.Cache("test", maxsize=2)
+    for key in "abc":
+      cache.put(key, 1.0)
+    self.assertIs(cache.get("a"), panchanga._MISSING)
+    self.assertEqual(cache.get("b"), 1.0)
+    cache.resize(maxbytes=cache.stats().bytes)
+    self.assertEqual(cache.stats().size, 2)
+    cache.put("d", 2.0)
+    self.assertEqual(list(cache.entries), ["b", "d"])  # c was least recently used
+    self.assertEqual(cache.stats().evictions, 2)
+    cache.resize(maxsize=1)
+    self.assertEqual(list(cache.entries), ["d"])
+
+  def test_ttl_recomputes_old_entries(self):
+    cache = panchanga.Cache("test", ttl=10)
+    with mock.patch("panchanga.monotonic", return_value=100.0):
+      cache.put("a", 1.0)
+      self.assertEqual(cache.get("a"), 1.0)
+    with mock.patch("panchanga.monotonic", return_value=110.0):
+      self.assertIs(cache.get("a"), panchanga._MISSING)
+
+  def test_set_cache_limits_and_clear_caches(self):
+    self.addCleanup(panchanga.set_cache_limits, "_rise_trans_from", maxsize=16384)
+    panchanga.set_cache_limits("_rise_trans_from", maxsize=1)
+    sunrise(date1, bangalore)
+    sunrise(date2, bangalore)
+    self.assertEqual(panchanga._rise_trans_from.cache_info().size, 1)
+    panchanga.clear_caches("_rise_trans_from")
+    self.assertEqual(panchanga._rise_trans_from.cache_info().misses, 0)
+    with self.assertRaisesRegex(ValueError, "Unknown cache"):
+      panchanga.clear_caches("bogus")
+
+  def test_set_cache_limits_keeps_limits_not_given(self):
+    self.addCleanup(panchanga.set_cache_limits, "*", ttl=None)
+    panchanga.set_cache_limits("*", ttl=3600)
+    stats = panchanga._rise_trans_from.cache_info()
+    self.assertEqual((stats.maxsize, stats.maxbytes, stats.ttl), (16384, None, 3600))
+    self.addCleanup(panchanga.set_cache_limits, "_rise_trans_from", maxsize=16384)
+    panchanga.set_cache_limits("_rise_trans_from", maxsize=None)
+    self.assertEqual(panchanga._rise_trans_from.cache_info()[4:7], (None, None, 3600))
+
+  def test_environment_settings(self):
+    limits = panchanga._parse_cache_settings("sunrise=16384, *=32MB", panchanga._parse_cache_limit)
+    self.assertEqual(limits, {"sunrise": (16384, None), "*": (None, 32 << 20)})
+    self.assertEqual(panchanga._parse_cache_settings("*=3600", float), {"*": 3600.0})
+    with self.assertRaisesRegex(ValueError, "name=value"):
+      panchanga._parse_cache_settings("16384", panchanga._parse_cache_limit)
+
+  def test_vedic_and_festival_caches_are_registered(self):
+    import festival_rules  # noqa: F401
+    import vedic  # noqa: F401
+    self.assertIn("vedic._tropical_nakshatra_boundaries", panchanga.cache_stats())
+    self.assertIn("festival_rules._eclipse_when_loc", panchanga.cache_stats())
+
+
+class LunationTableTests(PanchangaTestCase):
+  """Exactly solved new and full moons, 1800-2200."""
+
+  def test_lunations_alternate_and_hit_their_phase(self):
+    events = list(panchanga.lunations(date2, date2 + 60))
+    self.assertEqual(len(events), 4)
+    for earlier, later in zip(events, events[1:]):
+      self.assertNotEqual(earlier.phase, later.phase)
+      self.assertTrue(13 < later.jd - earlier.jd < 16.5)
+    for event in events:
+      self.assertAlmostEqual(abs(norm180((lunar_phase(event.jd) - event.phase) % 360)), 0, delta=1E-6)
+
+  def test_lookup_matches_lagrange_search(self):
+    ti = tithi(date2, bangalore)[0]
+    start = date2 - ti
+    self.assertAlmostEqual(new_moon(date2, ti, -1), panchanga._phase_event_cached(round(start), 360), delta=1E-5)
+
+  def test_lunations_outside_table_are_solved_directly(self):
+    events = list(panchanga.lunations(gregorian_to_jd(Date(2300, 1, 1)), gregorian_to_jd(Date(2300, 2, 1))))
+    self.assertIn(len(events), (2, 3))
+
+
+class SankrantiTableTests(PanchangaTestCase):
+  """Solar ingress tables per coordinate selection."""
+
+  def test_twelve_ingresses_a_year_at_their_longitude(self):
+    events = list(panchanga.sankrantis(date2, date2 + 365))
+    self.assertEqual(len(events), 12)
+    for earlier, later in zip(events, events[1:]):
+      self.assertEqual(later.raasi, earlier.raasi % 12 + 1)
+    for event in events:
+      longitude = solar_longitude(event.jd)
+      self.assertAlmostEqual(abs(norm180((longitude - 30 * (event.raasi - 1)) % 360)), 0, delta=1E-6)
+
+  def test_raasi_switches_at_the_tabulated_instant(self):
+    event = next(panchanga.sankrantis(date2, date2 + 40))
+    self.assertEqual(raasi(event.jd - 1E-4), (event.raasi + 10) % 12 + 1)
+    self.assertEqual(raasi(event.jd + 1E-4), event.raasi)
+
+  def test_cardinal_points_match_solcross(self):
+    points = list(panchanga.cardinal_points(date2, date2 + 365))
+    self.assertEqual([point.longitude for point in points], [0, 90, 180, 270])
+    for point in points:
+      self.assertAlmostEqual(point.jd, swe.solcross_ut(float(point.longitude), date2, swe.FLG_SWIEPH), delta=1E-7)
+    june = points[1].jd
+    self.assertEqual(panchanga.cardinal_point(june, 90, +1), june)
+    self.assertLess(panchanga.cardinal_point(june, 90, -1), june - 360)
+    self.assertEqual(panchanga.cardinal_point(june + 1, 90, -1), june)
+    with self.assertRaises(ValueError):
+      panchanga.cardinal_point(june, 45)
+
+  def test_tables_follow_the_selection(self):
+    sidereal = next(panchanga.sankrantis(date2, date2 + 40, 'citra'))
+    tropical = next(panchanga.sankrantis(date2, date2 + 40, 'tropical'))
+    self.assertEqual(sidereal.raasi, tropical.raasi)
+    self.assertGreater(sidereal.jd - tropical.jd, 20)
+    with panchanga.Panchanga('tropical').active():
+      self.assertEqual(raasi(tropical.jd + 1E-4), tropical.raasi)
+
+
+class MasaIndexTests(PanchangaTestCase):
+  """New-moon-bounded months from the lunation and saṅkrānti tables."""
+
+  def test_month_matches_lunar_masa(self):
+    ti, last_new_moon, masa_num, is_adhika = lunar_masa(date2, bangalore)
+    month = panchanga.masa_month(last_new_moon)
+    self.assertEqual((month.start_jd, month.masa, month.is_adhika), (last_new_moon, masa_num, is_adhika))
+    self.assertLess(month.start_jd, date2)
+    self.assertGreater(month.end_jd, date2)
+
+  def test_adhika_and_kshaya_months(self):
+    months = list(panchanga.masa_months(gregorian_to_jd(Date(1963, 1, 1)), gregorian_to_jd(Date(1964, 6, 1))))
+    for earlier, later in zip(months, months[1:]):
+      self.assertEqual(earlier.end_jd, later.start_jd)
+    self.assertEqual([month.masa for month in months if month.is_adhika], [8, 1])
+    kshaya = [month for month in months if month.is_kshaya]
+    self.assertEqual(len(kshaya), 1)
+    following = months[months.index(kshaya[0]) + 1]
+    self.assertEqual(following.masa, kshaya[0].masa % 12 + 2)
+
+  def test_outside_the_table_raises(self):
+    with self.assertRaises(ValueError):
+      panchanga.masa_month(gregorian_to_jd(Date(1700, 1, 1)))
+
+
+class DayFrameTests(PanchangaTestCase):
+  """One shared set of sunrise samples per civil day."""
+
+  def setUp(self):
+    super().setUp()
+    panchanga._planet_longitude_cached.cache_clear()
+    panchanga._tropical_longitude_cached.cache_clear()
+    panchanga._lunar_phase_cached.cache_clear()
+    panchanga._day_frame_cached.cache_clear()
+
+  def test_limbs_share_one_frame_of_ten_longitudes(self):
+    sunrise(date2, bangalore)
+    with mock.patch("panchanga.swe.calc_ut", wraps=swe.calc_ut) as calc:
+      results = [tithi(date2, bangalore), nakshatra(date2, bangalore), yoga(date2, bangalore), karana(date2, bangalore)]
+    self.assertEqual(calc.call_count, 2 * len(panchanga.DAY_FRAME_OFFSETS))
+    frame = panchanga.day_frame(date2, bangalore)
+    self.assertEqual(panchanga._day_frame_cached.cache_info().misses, 1)
+    explicit = [
+      tithi(date2, bangalore, frame),
+      nakshatra(date2, bangalore, frame),
+      yoga(date2, bangalore, frame),
+      karana(date2, bangalore, frame)
+    ]
+    self.assertEqual(explicit, results)
+
+  def test_frame_samples_from_the_ut_sunrise(self):
+    frame = panchanga.day_frame(date2, bangalore)
+    self.assertEqual(frame.rise, sunrise(date2, bangalore)[0] - bangalore.timezone / 24)
+    self.assertEqual(frame.lunar[0], panchanga.lunar_longitude(frame.rise))
+    self.assertAlmostEqual(frame.phase[0], lunar_phase(frame.rise))
+    self.assertEqual(lunar_masa(date2, bangalore, frame=frame), lunar_masa(date2, bangalore))
+
+  def test_frames_are_per_selection(self):
+    sidereal = panchanga.day_frame(date2, bangalore, 'citra')
+    tropical = panchanga.day_frame(date2, bangalore, 'tropical')
+    self.assertNotAlmostEqual(sidereal.lunar[0], tropical.lunar[0])
+    self.assertAlmostEqual(sidereal.phase[0], tropical.phase[0], places=6)
+
+
+class ExactPrecisionTests(PanchangaTestCase):
+  """``precision='exact'`` end times from the speed-based root solver."""
+
+  apr24 = gregorian_to_jd(Date(2010, 4, 24))
+
+  def test_exact_ends_match_limb_transitions(self):
+    for name, limb in (('tithi', tithi), ('nakshatra', nakshatra), ('yoga', yoga), ('karana', karana)):
+      frame = panchanga.day_frame(self.apr24, bangalore)
+      exact = limb(self.apr24, bangalore, frame, 'exact')
+      self.assertEqual(exact[0::2], limb(self.apr24, bangalore, frame)[0::2])
+      found = panchanga.transitions(frame.rise, frame.rise + 1.5, name)
+      for boundary, hms in zip(found, exact[1::2]):
+        self.assertAlmostEqual(from_dms(*hms), (boundary.jd - self.apr24) * 24 + 5.5, delta=1 / 3600)
+
+  def test_kshaya_tithi_chains_on_from_the_first_end(self):
+    result = tithi(self.apr24, bangalore, precision='exact')
+    self.assertEqual(result[0::2], [10, 11])
+    self.assertLess(from_dms(*result[1]), from_dms(*result[3]))
+
+  def test_a_few_evaluations_per_boundary(self):
+    frame = panchanga.day_frame(self.apr24, bangalore)
+    with mock.patch("panchanga.swe.calc_ut", wraps=swe.calc_ut) as calc:
+      tithi(self.apr24, bangalore, frame, 'exact')
+    # Two boundaries, Moon and Sun per evaluation.
+    self.assertLessEqual(calc.call_count, 2 * 2 * 4)
+
+  def test_unknown_precision(self):
+    with self.assertRaises(ValueError):
+      tithi(date2, bangalore, precision='slow')
+
+
+class ClassificationKernelTests(PanchangaTestCase):
+  """Array kernels agree with the scalar classifiers."""
+
+  longitudes = [0.5 + step * 3.7 for step in range(97)] + [13 + 20 / 60, 53 + 20 / 60, 359.99]
+
+  def test_nakshatra_padas_both_systems(self):
+    for system, scalar in (("equal", panchanga.nakshatra_pada_equal_spacing),
+                           ("unequal", panchanga.nakshatra_pada_unequal_system)):
+      naks, padas = panchanga.nakshatra_padas(self.longitudes, system)
+      self.assertEqual(naks.typecode, "b")
+      self.assertEqual([[nak, pada] for nak, pada in zip(naks, padas)], [scalar(lon) for lon in self.longitudes])
+
+  def test_nakshatra_padas_follow_active_system(self):
+    set_nakshatra_system("unequal")
+    self.assertEqual(panchanga.nakshatra_padas([20.5])[0][0], 3)
+    set_nakshatra_system("equal")
+    self.assertEqual(panchanga.nakshatra_padas([20.5])[0][0], 2)
+
+  def test_limb_raasi_and_navamsa_kernels(self):
+    self.assertEqual(list(panchanga.tithis([0.1, 12.0, 359.9])), [1, 1, 30])
+    self.assertEqual(list(panchanga.karanas([0.1, 6.5, 359.9])), [1, 2, 60])
+    self.assertEqual(list(panchanga.yogas([0.1, 359.9])), [1, 27])
+    self.assertEqual(list(panchanga.raasis([0.1, 45.0, 359.9])), [1, 2, 12])
+    self.assertEqual(list(panchanga.navamsas(self.longitudes)), [navamsa_from_long(lon) for lon in self.longitudes])
+
+  @unittest.skipIf(panchanga.numpy is None, "NumPy is not installed")
+  def test_numpy_path_matches_the_loops(self):
+    # Boundaries of every division, and a hair either side of them
+    edges = panchanga._GARGA_PADA_ENDS[:-1] + [step * 10 / 3 for step in range(1, 108)]
+    edges += [step * 6.0 for step in range(1, 60)] + [step * 40 / 12 for step in range(1, 108)]
+    values = self.longitudes + [edge + shift for edge in edges for shift in (-1E-12, 0.0, 1E-12)]
+
+    def classify():
+      return (panchanga.nakshatra_padas(values, "equal"), panchanga.nakshatra_padas(iter(values), "unequal"),
+              panchanga.tithis(values), panchanga.karanas(values), panchanga.yogas(values), panchanga.raasis(values),
+              panchanga.navamsas(values))
+
+    vectorized = classify()
+    with mock.patch("panchanga.numpy", None):
+      self.assertEqual(classify(), vectorized)
+    self.assertEqual(vectorized[2].typecode, "b")
+
+
+class BatchLongitudeTests(PanchangaTestCase):
+  """Array forms of the longitude and phase helpers."""
+
+  jds = [date2 + step / 4 for step in range(12)]
+
+  def test_planet_longitudes_match_scalar_calls(self):
+    lunar = panchanga.lunar_longitudes(self.jds)
+    solar = panchanga.solar_longitudes(self.jds)
+    self.assertEqual(lunar.typecode, "d")
+    self.assertEqual(list(lunar), [panchanga.lunar_longitude(jd) for jd in self.jds])
+    self.assertEqual(list(solar), [solar_longitude(jd) for jd in self.jds])
+
+  def test_lunar_phases_match_scalar_calls(self):
+    phases = panchanga.lunar_phases(self.jds)
+    for jd, phase in zip(self.jds, phases):
+      self.assertAlmostEqual(phase, lunar_phase(jd), places=9)
+
+  def test_selection_does_not_touch_globals(self):
+    tropical = panchanga.planet_longitudes(self.jds, swe.SUN, selection="tropical")
+    self.assertEqual(panchanga.coordinate_flag, swe.FLG_SIDEREAL)
+    self.assertEqual(panchanga.chosen_ayanamsa, "citra")
+    set_coordinate_selection("tropical")
+    self.addCleanup(set_coordinate_selection, "citra")
+    self.assertEqual(list(tropical), [solar_longitude(jd) for jd in self.jds])
+
+  def test_accepts_any_iterable_and_rejects_unknown_selection(self):
+    self.assertEqual(len(panchanga.solar_longitudes(range(2451545, 2451548))), 3)
+    self.assertEqual(len(panchanga.solar_longitudes([])), 0)
+    with self.assertRaisesRegex(ValueError, "Unknown coordinate selection"):
+      panchanga.solar_longitudes(self.jds, selection="bogus")
+
+
+class CompareSelectionsTests(PanchangaTestCase):
+  """Every selection's limbs from one tropical pass plus ayanāṃśa series."""
+
+  def test_matches_each_selection_computed_alone(self):
+    jds = [date2 + 5 * step for step in range(8)]
+    rises = [panchanga.day_frame(jd, bangalore).rise for jd in jds]
+    for limbs in panchanga.compare_selections(rises, ["citra", "lahiri", "tropical"]):
+      context = panchanga.Panchanga(limbs.selection)
+      for index, jd in enumerate(jds):
+        masa_num, is_adhika = context.lunar_masa(jd, bangalore)[2:]
+        self.assertEqual(limbs.nakshatras[index], context.nakshatra(jd, bangalore)[0])
+        self.assertEqual(limbs.yogas[index], context.yoga(jd, bangalore)[0])
+        self.assertEqual(limbs.raasis[index], context.raasi(rises[index]))
+        self.assertEqual((limbs.masas[index], limbs.adhikas[index]), (masa_num, is_adhika))
+
+  def test_ayanamsa_series(self):
+    jds = [date1, date2]
+    self.assertEqual(list(panchanga.ayanamsas(jds, "tropical")), [0.0, 0.0])
+    for jd, shift in zip(jds, panchanga.ayanamsas(jds, "citra")):
+      self.assertAlmostEqual(shift, panchanga._ayanamsa_cached("citra", jd), places=12)
+
+
+class CoordinateContextTests(PanchangaTestCase):
+  """Panchanga context objects instead of mutable module globals."""
+
+  def test_methods_match_module_functions_under_same_globals(self):
+    context = panchanga.Panchanga("tropical", nakshatra_system="garga")
+    from_context = (context.nakshatra(date2, bangalore), context.raasi(date2), context.solar_longitude(date2))
+    set_coordinate_selection("tropical")
+    set_nakshatra_system("garga")
+    self.addCleanup(set_coordinate_selection, "citra")
+    self.assertEqual(from_context, (nakshatra(date2, bangalore), raasi(date2), solar_longitude(date2)))
+
+  def test_context_leaves_module_defaults_alone(self):
+    with panchanga.Panchanga("revati", nakshatra_system="unequal").active():
+      self.assertEqual(panchanga.selection_mode(), ("revati", swe.FLG_SIDEREAL))
+      self.assertEqual(nakshatra_pada(from_dms(23, 0)), [3, 1])
+    self.assertEqual(panchanga.chosen_ayanamsa, "citra")
+    self.assertEqual(panchanga.coordinate_flag, swe.FLG_SIDEREAL)
+    self.assertEqual(nakshatra_pada(from_dms(23, 0)), [2, 3])
+
+  def test_context_is_local_to_the_thread(self):
+    seen = []
+    with panchanga.Panchanga("tropical").active():
+      worker = threading.Thread(target=lambda: seen.append(panchanga.selection_mode()))
+      worker.start()
+      worker.join()
+    self.assertEqual(seen, [("citra", swe.FLG_SIDEREAL)])
+
+  def test_rejects_unknown_values_setters_and_mutation(self):
+    with self.assertRaisesRegex(ValueError, "Unknown coordinate selection"):
+      panchanga.Panchanga("bogus")
+    with self.assertRaisesRegex(ValueError, "Unknown nakshatra system"):
+      panchanga.Panchanga(nakshatra_system="bogus")
+    context = panchanga.Panchanga()
+    self.assertEqual(repr(context), "Panchanga(selection='citra', nakshatra_system='equal')")
+    for name in ("set_coordinate_selection", "_planet_longitude_cached", "swe", "Place"):
+      with self.assertRaises(AttributeError):
+        getattr(context, name)
+    with self.assertRaises(AttributeError):
+      context.selection = "tropical"
+
+
+class LimbTimelineTests(PanchangaTestCase):
+  """Global limb-boundary sweeps and their lookups."""
+
+  def test_tithi_transitions_sit_on_phase_boundaries(self):
+    found = panchanga.transitions(date2, date2 + 5, "tithi")
+    self.assertGreaterEqual(len(found), 4)
+    for item in found:
+      self.assertAlmostEqual(norm180(lunar_phase(item.jd) - 12 * (item.number - 1)), 0, delta=1E-4)
+    for previous, item in zip(found, found[1:]):
+      self.assertEqual(item.number, previous.number % 30 + 1)
+
+  def test_nakshatra_transitions_follow_selected_system(self):
+    set_nakshatra_system("unequal")
+    self.addCleanup(set_nakshatra_system, "equal")
+    starts = panchanga.limb_starts("nakshatra")
+    for item in panchanga.transitions(date1, date1 + 10, "nakshatra"):
+      self.assertAlmostEqual(norm180(panchanga.lunar_longitude(item.jd) - starts[item.number - 1]), 0, delta=1E-4)
+
+  def test_limb_at_matches_sunrise_tithi(self):
+    rise = sunrise(date2, bangalore)[0] - bangalore.timezone / 24
+    timeline = panchanga.limb_timeline(date2 - 2, date2 + 2, "tithi")
+    number, end_jd = panchanga.limb_at(timeline, rise)
+    self.assertEqual(number, tithi(date2, bangalore)[0])
+    self.assertGreater(end_jd, rise)
+    self.assertIs(panchanga.limb_timeline(date2 - 2, date2 + 2, "tithi"), timeline)
+
+  def test_limb_at_rejects_outside_span_and_unknown_limb(self):
+    timeline = panchanga.limb_timeline(date2, date2 + 1, "yoga")
+    with self.assertRaisesRegex(ValueError, "outside"):
+      panchanga.limb_at(timeline, date2 + 1)
+    with self.assertRaisesRegex(ValueError, "Unknown limb"):
+      panchanga.transitions(date2, date2 + 1, "vaara")
+
+
+class ChebyshevCacheTests(PanchangaTestCase):
+  """Optional Chebyshev-segment tier for Sun and Moon longitudes."""
+
+  def setUp(self):
+    super().setUp()
+    panchanga.set_chebyshev_cache()
+    self.addCleanup(panchanga.set_chebyshev_cache, 0)
+
+  def test_matches_swiss_ephemeris_within_bound(self):
+    flags = swe.FLG_SWIEPH | swe.FLG_SPEED | swe.FLG_SIDEREAL
+    for planet in (swe.SUN, swe.MOON):
+      for step in range(40):
+        jd = date3 + step * 0.37
+        longitude, speed = panchanga.chebyshev_longitude(jd, planet)
+        panchanga.set_ayanamsa_mode()
+        expected = swe.calc_ut(jd, planet, flags=flags)[0]
+        panchanga.reset_ayanamsa_mode()
+        self.assertLess(abs(norm180(longitude - expected[0])), panchanga.CHEBYSHEV_MAX_ERROR)
+        self.assertAlmostEqual(speed, expected[3], delta=1E-3)
+
+  def test_scalar_longitudes_route_through_segments(self):
+    expected = panchanga.chebyshev_longitude(date1 + 0.3, swe.MOON)[0]
+    with mock.patch("panchanga.swe.calc_ut", side_effect=AssertionError("ephemeris called")):
+      self.assertEqual(panchanga.lunar_longitude(date1 + 0.3), expected)
+      self.assertEqual(panchanga.lunar_longitude(date1 + 0.1), panchanga.chebyshev_longitude(date1 + 0.1, swe.MOON)[0])
+
+  def test_segments_are_evicted_least_recently_used(self):
+    panchanga.set_chebyshev_cache(2)
+    for offset in (0, 10, 0, 20):
+      panchanga.chebyshev_longitude(date2 + offset, swe.SUN)
+    self.assertEqual(panchanga.chebyshev_cache_size(), 2)
+    with mock.patch("panchanga.swe.calc_ut", side_effect=AssertionError("ephemeris called")):
+      panchanga.chebyshev_longitude(date2, swe.SUN)
+
+  def test_disabled_and_unsupported_bodies_raise(self):
+    with self.assertRaisesRegex(ValueError, "No Chebyshev fit"):
+      panchanga.chebyshev_longitude(date2, swe.MARS)
+    panchanga.set_chebyshev_cache(0)
+    self.assertEqual(panchanga.chebyshev_cache_size(), 0)
+    with self.assertRaisesRegex(RuntimeError, "disabled"):
+      panchanga.chebyshev_longitude(date2, swe.SUN)
+
+
+class LongitudeStoreTests(PanchangaTestCase):
+  """Persistent memory-mapped longitude grid."""
+
+  def setUp(self):
+    super().setUp()
+    directory = tempfile.TemporaryDirectory()
+    self.addCleanup(directory.cleanup)
+    self.addCleanup(panchanga.set_longitude_store, None)
+    panchanga.set_longitude_store(directory.name)
+    self.directory = directory.name
+
+  def test_interpolates_close_to_swiss_ephemeris(self):
+    for step in range(20):
+      jd = date2 + step * 0.173
+      stored = panchanga._stored_longitude("citra", swe.FLG_SIDEREAL, jd, swe.MOON)
+      panchanga.set_ayanamsa_mode()
+      expected = swe.calc_ut(jd, swe.MOON, flags=swe.FLG_SWIEPH | swe.FLG_SIDEREAL)[0][0]
+      panchanga.reset_ayanamsa_mode()
+      self.assertLess(abs(norm180(stored - expected)), 1E-7)
+
+  def test_filled_grid_survives_reopening(self):
+    panchanga.fill_longitude_store(date1, date1 + 2)
+    expected = panchanga.lunar_longitude(date1 + 0.6)
+    self.assertEqual(os.listdir(self.directory), ["longitudes-citra-{}.bin".format(swe.version)])
+    panchanga.set_longitude_store(self.directory)  # as a fresh process would
+    with mock.patch("panchanga.swe.calc_ut", side_effect=AssertionError("ephemeris called")):
+      self.assertEqual(panchanga.lunar_longitude(date1 + 0.6), expected)
+      panchanga.solar_longitude(date1 + 1.3)
+
+  def test_off_grid_dates_fall_back_to_swiss_ephemeris(self):
+    jd = gregorian_to_jd(Date(1850, 1, 1))
+    panchanga.set_ayanamsa_mode()
+    expected = swe.calc_ut(jd, swe.SUN, flags=swe.FLG_SWIEPH | swe.FLG_SIDEREAL)[0][0]
+    panchanga.reset_ayanamsa_mode()
+    self.assertAlmostEqual(solar_longitude(jd), expected, places=8)
+    self.assertEqual(os.listdir(self.directory), [])
+
+  def test_fill_requires_enabled_store(self):
+    panchanga.set_longitude_store(None)
+    with self.assertRaisesRegex(RuntimeError, "disabled"):
+      panchanga.fill_longitude_store(date2, date2 + 1)
+
+
+class SolarDaySeriesTests(PanchangaTestCase):
+  """Seeded sunrise/sunset series with explicit polar gaps."""
+
+  def test_series_matches_rise_trans(self):
+    series = panchanga.solar_day_series(helsinki, Date(2013, 1, 18), 40)
+    self.assertEqual(series.gaps, [])
+    self.assertEqual(series.dates[1], Date(2013, 1, 19))
+    for index in range(40):
+      jd = date2 + index
+      self.assertAlmostEqual(series.sunrise[index], sunrise(jd, helsinki)[0] - helsinki.timezone / 24, delta=1E-7)
+      self.assertAlmostEqual(series.sunset[index], sunset(jd, helsinki)[0] - helsinki.timezone / 24, delta=1E-7)
+    self.assertEqual(series.next_sunrise[:39], series.sunrise[1:])
+
+  def test_per_day_places_follow_dst(self):
+    summer = Place(helsinki.latitude, helsinki.longitude, 3.0)
+    place_for = lambda date: summer if (date.month, date.day) >= (3, 31) else helsinki
+    series = panchanga.solar_day_series(place_for, Date(2013, 3, 29), 4)
+    self.assertEqual(series.places, [helsinki, helsinki, summer, summer])
+    for index, place in enumerate(series.places):
+      jd = gregorian_to_jd(Date(2013, 3, 29)) + index
+      self.assertAlmostEqual(series.sunrise[index], sunrise(jd, place)[0] - place.timezone / 24, delta=1E-7)
+
+  def test_polar_night_is_reported_as_gaps(self):
+    tromso = Place(69.65, 18.96, 1.0)
+    series = panchanga.solar_day_series(tromso, Date(2013, 11, 20), 10)
+    self.assertTrue(series.gaps)
+    for index in series.gaps:
+      self.assertTrue(isnan(series.sunrise[index]) or isnan(series.sunset[index]) or isnan(series.next_sunrise[index]))
+    self.assertNotIn(0, series.gaps)
 
 
 class MuhurtaTests(PanchangaTestCase):
@@ -28,9 +28,11 @@ from generate_panchanga_calendar import (
   TITHI_COLUMN_RATIO,
   argument_parser,
   build_pdf,
+  cached_daily_records,
   calendar_year_label,
   context_month_range,
   daily_records,
+  day_cache_key,
   default_output_path,
   display_masa,
   draw_month,
@@ -45,11 +47,13 @@ from generate_panchanga_calendar import (
   kali_ahargana_range,
   load_location,
   month_range,
+  month_shards,
   sankranti_key_line,
   solar_dates_by_date,
   tithi_display_parts,
   tithi_font,
   tithi_ink,
+  worker_count,
 )
 
 
@@ -392,6 +396,7 @@ class DailyRecordsCacheHookTests(unittest.TestCase):
 
     location = load_location("Bengaluru")
     panchanga.set_chosen_ayanamsa("citra")
+    calendar_module._month_records.cache_clear()
     with mock.patch.object(calendar_module.panchanga, "masa", return_value=[1, False]) as masa_mock:
       daily_records([(2026, 1)], location)
     self.assertTrue(masa_mock.called)
@@ -402,5 +407,155 @@ class DailyRecordsCacheHookTests(unittest.TestCase):
       self.assertLessEqual(kwargs["tithi_number"], 30)
 
 
+class ParallelDailyRecordsTests(unittest.TestCase):
+  """Opt-in process-pool sharding of ``daily_records``."""
+
+  def test_month_shards_are_contiguous_and_balanced(self):
+    months = list(month_range(2026, 11))
+    shards = month_shards(months, 4)
+    self.assertEqual([len(shard) for shard in shards], [4, 4, 3, 3])
+    self.assertEqual([month for shard in shards for month in shard], months)
+    self.assertEqual(month_shards(months[:2], 8), [[months[0]], [months[1]]])
+
+  def test_worker_count_defaults_to_serial_and_reads_environment(self):
+    with mock.patch.dict("os.environ", {}, clear=True):
+      self.assertEqual(worker_count(), 1)
+    with mock.patch.dict("os.environ", {"PANCHANGA_WORKERS": "3"}):
+      self.assertEqual(worker_count(), 3)
+      self.assertEqual(worker_count(2), 2)
+    with self.assertRaisesRegex(ValueError, "at least 1"):
+      worker_count(0)
+
+  def test_pool_matches_serial_records_for_pinned_selection(self):
+    import generate_panchanga_calendar as calendar_module
+    import panchanga
+
+    location = load_location("Bengaluru")
+    months = [(2026, 1), (2026, 2), (2026, 3)]
+    with panchanga.Panchanga("tropical").active():
+      calendar_module._month_records.cache_clear()
+      serial = daily_records(months, location, workers=1)
+      calendar_module._month_records.cache_clear()
+      pooled = daily_records(months, location, workers=2)
+      self.assertEqual(pooled, serial)
+      self.assertEqual(daily_records(months[1:], location), serial[31:])
+    stats = calendar_module._month_records.cache_info()
+    self.assertEqual((stats.hits, stats.misses, stats.size), (2, 3, 3))
+
+
+class MonthRecordCacheTests(unittest.TestCase):
+  """``daily_records`` assembles windows from months cached per city and context."""
+
+  def setUp(self):
+    import generate_panchanga_calendar as calendar_module
+
+    self.location = load_location("Bengaluru")
+    self.cache = calendar_module._month_records
+    self.cache.cache_clear()
+
+  def test_sliding_windows_reuse_shared_months(self):
+    import panchanga
+
+    first = daily_records([(2026, 1), (2026, 2)], self.location)
+    with mock.patch("panchanga.swe.calc_ut") as calc:
+      self.assertEqual(daily_records([(2026, 2)], self.location), first[31:])
+    calc.assert_not_called()
+    daily_records([(2026, 2), (2026, 3)], self.location)
+    stats = panchanga.cache_stats()["generate_panchanga_calendar._month_records"]
+    self.assertEqual((stats.hits, stats.misses, stats.size), (2, 3, 3))
+
+  def test_months_are_cached_per_context_and_moonrise(self):
+    import math
+
+    import panchanga
+
+    citra = daily_records([(2026, 1)], self.location)
+    with panchanga.Panchanga("tropical").active():
+      tropical = daily_records([(2026, 1)], self.location)
+    self.assertNotEqual(list(citra.nakshatra), list(tropical.nakshatra))
+    self.assertTrue(math.isnan(citra.moonrise[0]))
+    self.assertFalse(math.isnan(daily_records([(2026, 1)], self.location, moonrise=True).moonrise[0]))
+    self.assertEqual(self.cache.cache_info().size, 3)
+
+  def test_byte_limit_counts_the_day_columns(self):
+    import sys
+
+    import panchanga
+
+    name = "generate_panchanga_calendar._month_records"
+    self.addCleanup(panchanga.set_cache_limits, name, maxbytes=None)
+    panchanga.set_cache_limits(name, maxbytes=8000)
+    table = daily_records([(2026, 1), (2026, 2), (2026, 3)], self.location)
+    self.assertGreater(sys.getsizeof(table), len(table.to_bytes()))
+    stats = panchanga.cache_stats()[name]
+    self.assertLessEqual(stats.bytes, 8000)
+    self.assertEqual((stats.size, stats.evictions), (2, 1))
+
+  def test_counts_cached_months_per_city(self):
+    import generate_panchanga_calendar as calendar_module
+
+    daily_records([(2026, 1), (2026, 2)], self.location)
+    daily_records([(2026, 1)], load_location("Chennai"))
+    self.assertEqual(calendar_module.cached_month_counts(), {self.location.name: 2, "Chennai, IN": 1})
+
+
+class DayCacheTests(unittest.TestCase):
+  """Day tables persisted per month under a versioned key."""
+
+  def setUp(self):
+    self.location = load_location("Bengaluru")
+    self.months = [(2026, 1), (2026, 2)]
+    self.directory = TemporaryDirectory()
+    self.addCleanup(self.directory.cleanup)
+    self.root = Path(self.directory.name)
+
+  def test_second_read_skips_the_daily_pass(self):
+    import generate_panchanga_calendar as calendar_module
+
+    first = cached_daily_records(self.months, self.location, directory=self.root)
+    self.assertEqual(first, daily_records(self.months, self.location))
+    with mock.patch("generate_panchanga_calendar.daily_records", wraps=calendar_module.daily_records) as records:
+      again = cached_daily_records(self.months, self.location, directory=self.root)
+      records.assert_not_called()
+      cached_daily_records([(2026, 2), (2026, 3)], self.location, directory=self.root)
+      records.assert_called_once_with([(2026, 3)], self.location, workers=None)
+    self.assertEqual(again, first)
+    self.assertEqual(len(list((self.root / day_cache_key(self.location)).glob("*.days"))), 3)
+
+  def test_key_follows_the_coordinate_context(self):
+    import panchanga
+
+    keys = set()
+    for selection, system in (("citra", "equal"), ("raman", "equal"), ("tropical", "equal"), ("citra", "unequal")):
+      with panchanga.Panchanga(selection, system).active():
+        keys.add(day_cache_key(self.location))
+    self.assertEqual(len(keys), 4)
+    with mock.patch("generate_panchanga_calendar.RULESET_VERSION", "other"):
+      self.assertNotIn(day_cache_key(self.location), keys)
+    with mock.patch("generate_panchanga_calendar.DAY_RECORDS_VERSION", "other"):
+      self.assertNotIn(day_cache_key(self.location), keys)
+
+  def test_unreadable_files_are_recomputed(self):
+    first = cached_daily_records(self.months, self.location, directory=self.root)
+    path = self.root / day_cache_key(self.location) / "2026-01.days"
+    path.write_bytes(path.read_bytes()[:-3])
+    with self.assertLogs("generate_panchanga_calendar", "WARNING"):
+      self.assertEqual(cached_daily_records(self.months, self.location, directory=self.root), first)
+    self.assertEqual(cached_daily_records(self.months, self.location, directory=self.root), first)
+
+  def test_rerendering_reads_the_cache(self):
+    import generate_panchanga_calendar as calendar_module
+
+    output = self.root / "calendar.pdf"
+    with mock.patch("generate_panchanga_calendar.find_local_eclipses", return_value=[]):
+      build_pdf(self.location, 2026, 3, output, day_cache=self.root)
+      with mock.patch("generate_panchanga_calendar.daily_records", wraps=calendar_module.daily_records) as records, \
+              mock.patch("panchanga.swe.calc_ut", wraps=calendar_module.panchanga.swe.calc_ut) as calc:
+        build_pdf(self.location, 2026, 3, output, month_system="purnimanta", day_cache=self.root)
+    records.assert_not_called()
+    self.assertEqual(calc.call_count, 0)
+    self.assertIn(b"purnimanta masa", output.read_bytes())
+
+
 if __name__ == "__main__":
   unittest.main()
@@ -64,6 +64,25 @@ class FlaskGenerationTests(unittest.TestCase):
     self.assertIn(b"Invalid request", response.data)
 
 
+class CacheStatsRouteTests(unittest.TestCase):
+
+  def test_reports_caches_and_cached_months(self):
+    generate_pdf({"city": "Bengaluru, IN", "start": "2026-03"})
+    payload = app.test_client().get("/api/cache-stats").get_json()
+    stats = payload["caches"]["generate_panchanga_calendar._month_records"]
+    self.assertEqual(set(stats), {"hits", "misses", "size", "bytes", "maxsize", "maxbytes", "ttl", "evictions"})
+    self.assertEqual(stats["size"], sum(payload["cached_months"]))
+    self.assertNotIn("cached_months_by_city", payload)
+    self.assertNotIn(b"Bengaluru", app.test_client().get("/api/cache-stats").data)
+
+  def test_lists_city_names_only_when_configured(self):
+    generate_pdf({"city": "Bengaluru, IN", "start": "2026-03"})
+    with mock.patch.dict(os.environ, {"PANCHANGA_CACHE_STATS_CITIES": "1"}):
+      payload = app.test_client().get("/api/cache-stats").get_json()
+    self.assertGreaterEqual(payload["cached_months_by_city"]["Bengaluru, IN"], 16)
+    self.assertEqual(list(payload["cached_months_by_city"].values()), payload["cached_months"])
+
+
 class CgiGenerationTests(unittest.TestCase):
 
   def test_adapter_returns_shared_pdf(self):
@@ -205,6 +224,10 @@ class IcsServiceTests(unittest.TestCase):
     self.assertIn(b"BEGIN:VCALENDAR", response.data)
     self.assertIn(b"BEGIN:VEVENT", response.data)
 
+  def test_ics_rejects_polar_night(self):
+    with self.assertRaisesRegex(ValueError, "27/11/2026"):
+      generate_ics(load_location("Murmansk"), 2026, 11)
+
   def test_ics_flask_endpoint_rejects_bad_city(self):
     response = app.test_client().get("/api/panchanga.ics?city=NoSuchPlace&start=2026-03")
     self.assertEqual(response.status_code, 400)
@@ -53,6 +53,10 @@ class SunriseUnavailableTests(unittest.TestCase):
       compute_day_panchanga("Murmansk", "01/07/2025")
     self.assertIn("midnight sun", str(raised.exception))
 
+  def test_day_api_surfaces_polar_night_starting_tomorrow(self):
+    with self.assertRaisesRegex(ValueError, "on 27/11/2026: no local sunrise"):
+      compute_day_panchanga("Murmansk", "26/11/2026")
+
 
 class MoonEventGapTests(unittest.TestCase):
 
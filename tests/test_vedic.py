@@ -30,3 +30,20 @@ class TropicalFixedStarTests(unittest.TestCase):
   def test_boundary_rule_remains_strict(self):
     with mock.patch("vedic.swe.fixstar_ut", return_value=((200.0, ), None)):
       self.assertEqual(vedic.tropical_long_fixed_stars(2450000.5, 20.0), (27, 20.0))
+
+
+class SolsticeTests(unittest.TestCase):
+
+  def test_previous_solstices_are_exact_tropical_crossings(self):
+    jd = vedic.gregorian_to_jd(vedic.Date(2024, 3, 1))
+    winter = vedic.solstice(jd, +1)
+    summer = vedic.solstice(jd, -1)
+    self.assertEqual(vedic.jd_to_gregorian(winter)[:3], (2023, 12, 22))
+    self.assertEqual(vedic.jd_to_gregorian(summer)[:3], (2023, 6, 21))
+    self.assertAlmostEqual(vedic.tropical_solar_longitude(winter), 270, delta=1E-6)
+    self.assertAlmostEqual(vedic.tropical_solar_longitude(summer), 90, delta=1E-6)
+
+  def test_ritu_tropical_follows_the_equinox(self):
+    equinox = vedic.cardinal_point(vedic.gregorian_to_jd(vedic.Date(2024, 1, 1)), 0)
+    self.assertEqual(vedic.ritu_tropical(equinox - 1E-4), 5)
+    self.assertEqual(vedic.ritu_tropical(equinox + 1E-4), 0)
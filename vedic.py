@@ -1,24 +1,15 @@
-from functools import lru_cache
-
 from panchanga import *
 
 
 def solstice(jd, opt=+1):
   """Finds the julian day of previous occurence of
-    winter solstice (opt = +1) or summer solstice (opt = -1)."""
+    winter solstice (opt = +1) or summer solstice (opt = -1).
+
+    "Previous" allows up to 25 days past ``jd``; the exact instant comes from
+    the tropical (NOT sidereal!) event table, see ``cardinal_point``."""
   if opt == -1: sun_longitude = 90  # degrees, summer solstice
   if opt == +1: sun_longitude = 270  # degrees, winter solstice
-  flag = swe.FLG_SWIEPH | swe.FLG_TROPICAL  # NOT sidereal!
-  # Search in a span of 400 days before today
-  start = jd - 400
-  stop = jd + 25
-  while stop >= start:
-    longi = swe.calc_ut(stop, swe.SUN, flags=flag)[0][0]
-    # difference less than 0.0005 degrees
-    if abs(longi - sun_longitude) <= 5E-3:
-      return stop
-    stop -= 1E-2
-  return None
+  return cardinal_point(jd + 25, sun_longitude, -1)
 
 
 def vedic_month(jd, place):
@@ -27,13 +18,13 @@ def vedic_month(jd, place):
   lunar_month = 29.530589  # days
   month = ceil(abs(jd - uttarayana_moment) / lunar_month)
   ti = tithi(jd, place)[0]
-  critical = sunrise(jd, place)[0]  # - tz/24 ?
+  critical = sunrise_jd(jd, place)  # - tz/24 ?
   next_new_moon = new_moon(critical, ti, +1)
   if jd < next_new_moon: month = 12
   return month
 
 
-@lru_cache(maxsize=4096)
+@memoized(maxsize=4096)
 def _tropical_nakshatra_boundaries(jd):
   """Descending ``(nakshatra, longitude)`` boundaries anchored to Spica."""
   # other potential are Magha, Pushya, Satabhisha, Mrigashira, Revati, etc.
@@ -106,8 +97,7 @@ def tropical_solar_longitude(jd):
 
 def tropical_raasi(jd):
   """Tropical (sayana) rasi of sun on given day. 1 = Aries,...,12 = Pisces (tropical)"""
-  longi = swe.calc_ut(jd, swe.SUN, flags=swe.FLG_SWIEPH | swe.FLG_TROPICAL)[0][0]
-  return ceil(longi / 30)
+  return raasi(jd, 'tropical')
 
 
 # rename = True will give lunar "masa" almost exactly same result as
@@ -123,7 +113,7 @@ def tropical_raasi(jd):
 def tropical_month_tithi(jd, place, rename=False):
   """Tropical (sayana) month and tithi. 1 = Caitra,...,12 = Phalguna"""
   ti = tithi(jd, place)  # does not depend on tropical or sidereal
-  critical = sunrise(jd, place)[0]  # - tz/24 ?
+  critical = sunrise_jd(jd, place)  # - tz/24 ?
   last_new_moon = new_moon(critical, ti[0], -1)  # doesn't depend on ayanamsa
   next_new_moon = new_moon(critical, ti[0], +1)  # doesn't depend on ayanamsa
   this_solar_month = tropical_raasi(last_new_moon)
@@ -144,7 +134,7 @@ def tropical_nakshatra(jd, place, equal=True):
   """
   # 1. Find time of sunrise
   lat, lon, tz = place
-  rise = sunrise(jd, place)[0] - tz / 24.  # Sunrise at UT 00:00
+  rise = sunrise_jd(jd, place) - tz / 24.  # Sunrise at UT 00:00
 
   offsets = [0.0, 0.25, 0.5, 0.75, 1.0]
   longitudes = [tropical_lunar_longitude(rise + t) for t in offsets]
@@ -216,9 +206,7 @@ def seasonal_ayanamsa(jd):
     using Swiss Ephemeris's built-in function, wrapped to [-180, 180).
     Positive means tropical is ahead of sidereal.
     """
-  set_ayanamsa_mode()
-  ayan = swe.get_ayanamsa_ut(jd)
-  reset_ayanamsa_mode()
+  ayan = ephemeris_call(None, swe.get_ayanamsa_ut, jd)
   return norm180(ayan)
 
 
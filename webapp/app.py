@@ -5,6 +5,7 @@ import io
 import ipaddress
 import json
 import logging
+import os
 import sys
 from pathlib import Path
 from urllib.parse import quote
@@ -26,6 +27,7 @@ if str(_REPO_ROOT) not in sys.path:
   sys.path.insert(0, str(_REPO_ROOT))
 
 from generate_panchanga_calendar import (
+  cached_month_counts,
   city_locations,
   configure_logging,
   load_location,
@@ -34,7 +36,8 @@ from generate_panchanga_calendar import (
   require_month_system,
   require_start_month,
 )
-from panchanga import sweph_version
+from panchanga import cache_stats, sweph_version
+from webapp.compare_service import compare_panchanga, require_selections
 from webapp.day_panchanga import compute_day_panchanga
 from webapp.pdf_service import generate_pdf
 from webapp.ics_service import generate_ics
@@ -135,13 +138,29 @@ def api_panchanga():
   date = (request.args.get("date") or "").strip()
   month = request.args.get("month")
   ayanamsa = request.args.get("ayanamsa")
+  precision = (request.args.get("precision") or "fast").strip()
   try:
     if ayanamsa:
       ayanamsa = ayanamsa.strip()
     coordinate_selection = require_coordinate_selection(ayanamsa)
     if month:
       month = month.strip()
-    return jsonify(compute_day_panchanga(city, date, month_system=month, coordinate_selection=coordinate_selection))
+    return jsonify(
+      compute_day_panchanga(city, date, month_system=month, coordinate_selection=coordinate_selection,
+                            precision=precision))
+  except ValueError as error:
+    abort(400, description=str(error))
+
+
+@app.get("/api/panchanga/compare")
+def api_panchanga_compare():
+  city = (request.args.get("city") or "").strip()
+  start = (request.args.get("start") or request.args.get("date") or "").strip()
+  end = (request.args.get("end") or "").strip()
+  month = (request.args.get("month") or "amanta").strip()
+  try:
+    selections = require_selections(request.args.get("selections"))
+    return jsonify(compare_panchanga(city, start, end, selections=selections, month_system=month))
   except ValueError as error:
     abort(400, description=str(error))
 
@@ -177,6 +196,21 @@ def ics_calendar():
                    download_name=name, max_age=0)
 
 
+@app.get("/api/cache-stats")
+def api_cache_stats():
+  """Counters of every ``panchanga`` cache and the months cached per city.
+
+  Cities are anonymous (counts only, most first) unless the server sets
+  ``PANCHANGA_CACHE_STATS_CITIES=1``: their names show what others asked for.
+  """
+  caches = {name: stats._asdict() for name, stats in sorted(cache_stats().items())}
+  counts = cached_month_counts()
+  payload = {"caches": caches, "cached_months": list(counts.values())}
+  if os.environ.get("PANCHANGA_CACHE_STATS_CITIES") == "1":
+    payload["cached_months_by_city"] = counts
+  return jsonify(payload)
+
+
 @app.errorhandler(400)
 def bad_request(error):
   message = getattr(error, "description", None) or "Bad request"
@@ -187,7 +221,6 @@ def bad_request(error):
 
 def main():
   import argparse
-  import os
 
   parser = argparse.ArgumentParser(description="Serve the panchanga PDF web UI.")
   parser.add_argument("--host", default=os.environ.get("PANCHANGA_HOST", "0.0.0.0"),
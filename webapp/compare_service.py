@@ -0,0 +1,111 @@
+"""Compare nakshatra, yoga, rāśi and māsa across coordinate selections.
+
+``compare_panchanga`` computes a city's sunrises once, then asks
+``panchanga.compare_selections`` for every selection in one pass: Sun and
+Moon are taken once in tropical longitudes and each selection only adds its
+ayanāṃśa series, so comparing all selections costs about as much as one.
+"""
+
+from math import isnan
+
+import panchanga
+from generate_panchanga_calendar import (
+  COORDINATE_OPTIONS,
+  coordinate_selection_label,
+  load_location,
+  place_for_date,
+  require_coordinate_selection,
+  require_month_system,
+  sanskrit_names,
+)
+from webapp.day_panchanga import format_masa_name, parse_civil_date, require_solar_day
+
+MAX_COMPARE_DAYS = 366
+
+
+def require_selections(text):
+  """Comma-separated coordinate selections (default: all) or ``ValueError``."""
+  if not (text or "").strip():
+    return list(COORDINATE_OPTIONS)
+  selections = []
+  for part in text.split(","):
+    selection = require_coordinate_selection(part.strip())
+    if selection not in selections:
+      selections.append(selection)
+  return selections
+
+
+def compare_panchanga(city, start_text, end_text=None, selections=None, month_system="amanta"):
+  """Per-day comparison table for ``city`` from ``start_text`` to ``end_text`` (DD/MM/YYYY, inclusive).
+
+    ``selections`` is a list of coordinate selection keys (default: every
+    ``COORDINATE_OPTIONS`` entry). Values are at each day's sunrise;
+    ``ayanamsa_degrees`` is the true ayanāṃśa (nutation included) that was
+    subtracted, not the mean one the day API shows. Raises
+    ``ValueError`` for bad input, ranges over ``MAX_COMPARE_DAYS`` and days
+    without a local sunrise.
+    """
+  city = (city or "").strip()
+  if not city:
+    raise ValueError("City is required.")
+  amanta = require_month_system(month_system)
+  selections = selections or list(COORDINATE_OPTIONS)
+  start = parse_civil_date(start_text)
+  end = parse_civil_date(end_text) if (end_text or "").strip() else start
+  first_jd = panchanga.gregorian_to_jd(start)
+  days = int(panchanga.gregorian_to_jd(end) - first_jd) + 1
+  if days < 1:
+    raise ValueError("End date must not be before the start date.")
+  if days > MAX_COMPARE_DAYS:
+    raise ValueError(f"At most {MAX_COMPARE_DAYS} days can be compared at once.")
+  location = load_location(city)
+
+  series = panchanga.solar_day_series(lambda date: place_for_date(location, date), first_jd, days)
+  sunrises = list(series.sunrise)
+  for index in series.gaps:
+    if isnan(sunrises[index]):
+      place = series.places[index]
+      sunrises[index] = require_solar_day(location, series.dates[index], place)[0][0] - place.timezone / 24
+  tithis = panchanga.tithis(panchanga.lunar_phases(sunrises))
+  compared = panchanga.compare_selections(sunrises, selections)
+
+  names = sanskrit_names()
+  rows = []
+  for index, civil in enumerate(series.dates):
+    values = {}
+    for limbs in compared:
+      masa_num = panchanga.display_masa_number(limbs.masas[index], limbs.adhikas[index], tithis[index], amanta)
+      values[limbs.selection] = {
+        "ayanamsa_degrees": None if limbs.selection == "tropical" else round(limbs.ayanamsas[index], 8),
+        "nakshatra": _named(names["nakshatras"], limbs.nakshatras[index]),
+        "yoga": _named(names["yogas"], limbs.yogas[index]),
+        "raasi": {
+          "number": limbs.raasis[index],
+          "name": names["zodiac"][str(limbs.raasis[index] - 1)]
+        },
+        "masa": {
+          "number": masa_num,
+          "name": format_masa_name(names, masa_num, limbs.adhikas[index]),
+          "is_adhika": limbs.adhikas[index],
+        },
+      }
+    rows.append({
+      "date": f"{civil.day:02d}/{civil.month:02d}/{civil.year}",
+      "sunrise_jd": sunrises[index],
+      "tithi": _named(names["tithis"], tithis[index]),
+      "selections": values,
+    })
+  return {
+    "city": location.name,
+    "timezone": location.timezone_name,
+    "month_system": "amanta" if amanta else "purnimanta",
+    "selections": [{
+      "key": key,
+      "label": coordinate_selection_label(key)
+    } for key in selections],
+    "days": rows,
+  }
+
+
+def _named(lookup, number):
+  return {"number": number, "name": lookup[str(number)]}
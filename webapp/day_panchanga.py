@@ -1,8 +1,9 @@
 """Compute sunrise panchanga for one civil date and city (GUI-compatible).
 
-Public entry points take ``panchanga.coordinate_calculation_lock``, then call
-an ``_unlocked`` helper that does the real work. Hold the lock for the whole
-request so ayanāṃśa / tropical mode stays stable under concurrent web use.
+Public entry points activate a ``panchanga.Panchanga`` context, then call an
+``_unlocked`` helper that does the real work. The context keeps ayanāṃśa /
+tropical mode stable for the whole request while concurrent requests with
+other selections run in parallel.
 """
 
 import logging
@@ -132,45 +133,71 @@ def drik_ayana_label(ritu_num):
   return label
 
 
-def compute_day_details(location, civil, amanta=None, coordinate_selection=None):
-  """Compute one day while holding the shared coordinate-state lock.
+def require_solar_day(location, civil, place):
+  """Local ``(sunrise, sunset)`` for ``civil``; ``ValueError`` when either is unavailable."""
+  jd = panchanga.gregorian_to_jd(civil)
+  sunrise = require_local_sunrise(jd, place, location.name, civil.year, civil.month, civil.day)
+  if sunrise is None:
+    raise ValueError(format_sunrise_unavailable_message(location.name, civil.year, civil.month, civil.day, place))
+  sunset = panchanga.sunset(jd, place)
+  sunset_jd = sunset[0]
+  if not jd - 1 <= sunset_jd <= jd + 2:
+    message = format_sunrise_unavailable_message(location.name, civil.year, civil.month, civil.day, place)
+    log.error("%s (no local sunset)", message)
+    raise ValueError(message)
+  return sunrise, sunset
+
+
+def require_next_sunrise(location, civil):
+  """``ValueError`` when the day after ``civil`` has no local sunrise.
 
-    Lock here, then ``_compute_day_details_unlocked`` does the astronomy.
+  A sunrise day runs until the next sunrise (day frame, varjyam), so the
+  eve of a polar night cannot be computed either.
+  """
+  year, month, day = panchanga.jd_to_gregorian(panchanga.gregorian_to_jd(civil) + 1)[:3]
+  following = panchanga.Date(year, month, day)
+  place = place_for_date(location, following)
+  if require_local_sunrise(panchanga.gregorian_to_jd(following), place, location.name, year, month, day) is None:
+    raise ValueError(format_sunrise_unavailable_message(location.name, year, month, day, place))
+
+
+def compute_day_details(location, civil, amanta=None, coordinate_selection=None, precision="fast"):
+  """Compute one day under the requested coordinate context.
+
+    Activate it here, then ``_compute_day_details_unlocked`` does the astronomy.
     """
-  with panchanga.coordinate_calculation_lock:
-    return _compute_day_details_unlocked(location, civil, amanta=amanta, coordinate_selection=coordinate_selection)
+  with panchanga.Panchanga(coordinate_selection).active():
+    return _compute_day_details_unlocked(location, civil, amanta=amanta, coordinate_selection=coordinate_selection,
+                                         precision=precision)
 
 
-def _compute_day_details_unlocked(location, civil, amanta=None, coordinate_selection=None):
+def _compute_day_details_unlocked(location, civil, amanta=None, coordinate_selection=None, precision="fast"):
   """Compute all mode-sensitive panchanga fields for one civil day.
 
     Shared by the JSON day API and the ICS generator so both consume the
     same normalized day record.  ``civil`` has ``year``/``month``/``day``
     attributes (``panchanga.Date`` or ``datetime.date``).
 
-    Raises ``ValueError`` when sunrise cannot be computed for the date/location.
+    Runs under the caller's ``panchanga.Panchanga`` context for
+    ``coordinate_selection``. ``precision`` (``fast`` or ``exact``) picks how
+    tithi/nakshatra/yoga/karana end times are solved. Raises ``ValueError``
+    when sunrise or sunset, or the next day's sunrise, cannot be computed
+    for the date/location.
     """
-  panchanga.set_coordinate_selection(coordinate_selection)
   place = place_for_date(location, civil)
   jd = panchanga.gregorian_to_jd(civil)
 
-  sunrise = require_local_sunrise(jd, place, location.name, civil.year, civil.month, civil.day)
-  if sunrise is None:
-    raise ValueError(format_sunrise_unavailable_message(location.name, civil.year, civil.month, civil.day, place))
-  sunset = panchanga.sunset(jd, place)
-  sunset_jd = sunset[0]
-  if not jd - 1 <= sunset_jd <= jd + 2:
-    message = format_sunrise_unavailable_message(location.name, civil.year, civil.month, civil.day, place)
-    log.error("%s (no local sunset)", message)
-    raise ValueError(message)
+  sunrise, sunset = require_solar_day(location, civil, place)
+  require_next_sunrise(location, civil)
   day_dur = panchanga.day_duration(jd, place)
 
   names = sanskrit_names()
-  ti = panchanga.tithi(jd, place)
-  nak = panchanga.nakshatra(jd, place)
-  yog = panchanga.yoga(jd, place)
-  kar = panchanga.karana(jd, place)
-  ti_num, last_nm, lunar_num, is_adhika = panchanga.lunar_masa(jd, place, tithi_number=ti[0])
+  frame = panchanga.day_frame(jd, place)
+  ti = panchanga.tithi(jd, place, frame, precision)
+  nak = panchanga.nakshatra(jd, place, frame, precision)
+  yog = panchanga.yoga(jd, place, frame, precision)
+  kar = panchanga.karana(jd, place, frame, precision)
+  ti_num, last_nm, lunar_num, is_adhika = panchanga.lunar_masa(jd, place, tithi_number=ti[0], frame=frame)
   # Display māsa follows amānta/pūrṇimānta; ṛtus use lunar_num only.
   masa_num = panchanga.display_masa_number(lunar_num, is_adhika, ti_num, amanta)
   rtu_num = panchanga.ritu(lunar_num)
@@ -185,17 +212,13 @@ def _compute_day_details_unlocked(location, civil, amanta=None, coordinate_selec
   if coordinate_selection == "tropical":
     ayanamsa_degrees = None
   else:
-    panchanga.set_ayanamsa_mode()
-    try:
-      ayanamsa_degrees = float(panchanga.swe.get_ayanamsa_ut(sunrise_jd_ut))
-    finally:
-      panchanga.reset_ayanamsa_mode()
+    ayanamsa_degrees = float(panchanga.ephemeris_call(None, panchanga.swe.get_ayanamsa_ut, sunrise_jd_ut))
   sun_raasi = int(panchanga.raasi(sunrise_jd_ut))
   moonrise, moonrise_status = probe_moon_event(jd, place, civil, rise=True)
   moonset, moonset_status = probe_moon_event(jd, place, civil, rise=False)
   rahu_kala = panchanga.rahu_kalam(jd, place)
   durmuhurta = panchanga.durmuhurtam(jd, place)
-  varjyam = panchanga.varjyam(jd, place)
+  varjyam = panchanga.varjyam(jd, place, frame)
 
   return {
     "civil": civil,
@@ -235,17 +258,18 @@ def _compute_day_details_unlocked(location, civil, amanta=None, coordinate_selec
   }
 
 
-def compute_day_panchanga(city, date_text, month_system="amanta", coordinate_selection="citra"):
-  """Return one city's day panchanga while holding coordinate state stable.
+def compute_day_panchanga(city, date_text, month_system="amanta", coordinate_selection="citra", precision="fast"):
+  """Return one city's day panchanga under one coordinate context.
 
-    Lock here, then ``_compute_day_panchanga_unlocked`` builds the JSON fields.
+    Activate it here, then ``_compute_day_panchanga_unlocked`` builds the JSON fields.
     """
-  with panchanga.coordinate_calculation_lock:
+  with panchanga.Panchanga(coordinate_selection).active():
     return _compute_day_panchanga_unlocked(city, date_text, month_system=month_system,
-                                           coordinate_selection=coordinate_selection)
+                                           coordinate_selection=coordinate_selection, precision=precision)
 
 
-def _compute_day_panchanga_unlocked(city, date_text, month_system="amanta", coordinate_selection="citra"):
+def _compute_day_panchanga_unlocked(city, date_text, month_system="amanta", coordinate_selection="citra",
+                                    precision="fast"):
   """Return named panchanga fields for ``city`` on ``date_text`` (DD/MM/YYYY).
 
     ``month_system`` is ``amanta`` (default) or ``purnimanta``; it affects the
@@ -254,7 +278,8 @@ def _compute_day_panchanga_unlocked(city, date_text, month_system="amanta", coor
 
     ``coordinate_selection`` is a sidereal ayanāṃśa key (``citra`` default,
     ``revati``, ``rohini``, ``pushya``, ``mula``, ``krishnamurti``, ``raman``)
-    or ``"tropical"`` for tropical (sāyana) longitudes.
+    or ``"tropical"`` for tropical (sāyana) longitudes. ``precision`` is
+    ``fast`` (default) or ``exact``; see ``panchanga.PRECISIONS``.
     """
   city = (city or "").strip()
   if not city:
@@ -263,8 +288,9 @@ def _compute_day_panchanga_unlocked(city, date_text, month_system="amanta", coor
   civil = parse_civil_date(date_text)
   location = load_location(city)
 
-  # Already under coordinate_calculation_lock — call unlocked helper directly.
-  details = _compute_day_details_unlocked(location, civil, amanta=amanta, coordinate_selection=coordinate_selection)
+  # Already under the request's Panchanga context — call unlocked helper directly.
+  details = _compute_day_details_unlocked(location, civil, amanta=amanta, coordinate_selection=coordinate_selection,
+                                          precision=precision)
   names = details["names"]
   civil = details["civil"]
   jd = details["jd"]
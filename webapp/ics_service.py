@@ -1,7 +1,8 @@
 """ICS export: daily all-day events for a 14-month panchanga span.
 
-``generate_ics`` takes the coordinate lock, then ``_generate_ics_unlocked``
-builds the feed so ayanāṃśa / tropical mode stays stable for every day.
+``generate_ics`` activates a ``panchanga.Panchanga`` context, then
+``_generate_ics_unlocked`` builds the feed so ayanāṃśa / tropical mode stays
+stable for every day.
 """
 
 from calendar import monthrange
@@ -10,9 +11,11 @@ from datetime import datetime, timezone
 from generate_panchanga_calendar import (
   coordinate_selection_label,
   location_slug,
+  map_month_shards,
   month_range,
   month_system_label,
   require_month_system,
+  worker_count,
 )
 from webapp.day_panchanga import (
   _compute_day_details_unlocked,
@@ -73,17 +76,29 @@ def _fmt_interval(start_hms, end_hms):
   return f"{format_time(start_hms)}–{format_time(end_hms)}"
 
 
-def generate_ics(location, start_year, start_month, month_system="amanta", coordinate_selection="citra"):
-  """Generate a feed while holding coordinate state for the full span.
+def generate_ics(location, start_year, start_month, month_system="amanta", coordinate_selection="citra", workers=None):
+  """Generate a feed under one coordinate context for the full span.
 
-    Lock here, then ``_generate_ics_unlocked`` writes every VEVENT.
+    Activate it here, then ``_generate_ics_unlocked`` writes every VEVENT.
+    ``workers`` opts into computing the day details in the process pool.
     """
-  with panchanga.coordinate_calculation_lock:
+  with panchanga.Panchanga(coordinate_selection).active():
     return _generate_ics_unlocked(location, start_year, start_month, month_system=month_system,
-                                  coordinate_selection=coordinate_selection)
+                                  coordinate_selection=coordinate_selection, workers=workers)
 
 
-def _generate_ics_unlocked(location, start_year, start_month, month_system="amanta", coordinate_selection="citra"):
+def _day_details_shard(months, selection, nakshatra_system, location, amanta):
+  with panchanga.Panchanga(selection, nakshatra_system).active():
+    return [
+      _compute_day_details_unlocked(location, panchanga.Date(year, month, day), amanta=amanta,
+                                    coordinate_selection=selection) for year, month in months
+      for day in range(1,
+                       monthrange(year, month)[1] + 1)
+    ]
+
+
+def _generate_ics_unlocked(location, start_year, start_month, month_system="amanta", coordinate_selection="citra",
+                           workers=None):
   amanta = require_month_system(month_system)
   month_key = "amanta" if amanta else "purnimanta"
   dtstamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
@@ -99,7 +114,20 @@ def _generate_ics_unlocked(location, start_year, start_month, month_system="aman
     "X-WR-CALNAME:" + cal_name,
     "X-WR-CALDESC:" + cal_desc,
   ]
-  for year, month in month_range(start_year, start_month):
+  # Days without a local sunrise or sunset raise ValueError from
+  # require_solar_day inside each day's details (in a worker, via its result).
+  # Each day's details search its own sunrise and sunset with rise_trans,
+  # not a month's solar_day_series: the day frame, rāhukāla, durmuhūrta
+  # and varjyam all read the shared rise/set cache, and seeded series
+  # times differ from rise_trans by up to ~7 ms near the Arctic circle, so
+  # filling that cache from a series would make the day API's answers
+  # depend on whether an ICS feed was built first.
+  months = month_range(start_year, start_month)
+  workers = worker_count(workers)
+  precomputed = None
+  if workers > 1:
+    precomputed = iter(map_month_shards(_day_details_shard, months, workers, location, amanta))
+  for year, month in months:
     for day in range(1, monthrange(year, month)[1] + 1):
       civil = panchanga.Date(year, month, day)
       d = _ics_date(civil)
@@ -111,7 +139,11 @@ def _generate_ics_unlocked(location, start_year, start_month, month_system="aman
       else:
         next_civil = panchanga.Date(civil.year + 1, 1, 1)
       nxt = _ics_date(next_civil)
-      details = _compute_day_details_unlocked(location, civil, amanta=amanta, coordinate_selection=coordinate_selection)
+      if precomputed is not None:
+        details = next(precomputed)
+      else:
+        details = _compute_day_details_unlocked(location, civil, amanta=amanta,
+                                                coordinate_selection=coordinate_selection)
       names = details["names"]
       jd = details["jd"]
       sunrise = details["sunrise"]